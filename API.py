@@ -1,9 +1,54 @@
-from models.PlayerView import PlayerView
+from .Constants import ABILITY_COSTS
+from .Helper import MapGrid, grid_for
+from .Loader import load_view
+from .models.Columns import EntityColumns
+from .models.PlayerView import PlayerView
+from .Pathfinding import StaticMap
+from .SpatialIndex import TickIndex
+from .WorldMemory import WorldMemory
+
+
+# columns() kind -> (accessor, EntityColumns layout)
+COLUMN_SOURCES = {
+    "bots": ("get_my_bots", "bots"),
+    "enemies": ("visible_enemies", "bots"),
+    "algae": ("visible_algae", "algae"),
+    "scraps": ("visible_scraps", "scraps"),
+    "banks": ("banks", "banks"),
+    "energypads": ("energypads", "energypads"),
+}
+
+
+def _ability_cost(abilities: tuple) -> tuple:
+    scrap = 0
+    energy = 0.0
+    for ability in abilities:
+        cost = ABILITY_COSTS.get(ability)
+        if cost is not None:
+            scrap += cost["scrap"]
+            energy += cost["energy"]
+    # HeatSeeker synergy discount
+    if "SPEED" in abilities and "SELF_DESTRUCT" in abilities:
+        scrap -= 5
+    return scrap, energy
 
 
 class GameAPI:
     def __init__(self, view: PlayerView):
         self.view = view
+        self.index: TickIndex | None = None
+        # values derived from the view, dropped when the tick changes
+        self._memo: dict = {}
+        self._memo_tick = view.tick
+        # set by the wrapper when world memory is enabled
+        self.memory: WorldMemory | None = None
+        # set by the wrapper: the fleet's move reservations
+        self.reservations = None
+
+    @classmethod
+    def from_json(cls, data, skip=(), columnar: bool = False) -> "GameAPI":
+        """Build the API straight from the engine's JSON (see Loader)."""
+        return cls(load_view(data, skip, columnar))
 
     # ---- GLOBAL ----
     def get_tick(self):
@@ -15,6 +60,9 @@ class GameAPI:
     def get_my_bots(self):
         return self.view.bots
 
+    def grid(self) -> MapGrid:
+        return grid_for(self.view.width, self.view.height)
+
     # ---- SENSING ----
     def visible_enemies(self):
         return self.view.visible_entities.enemies
@@ -33,6 +81,89 @@ class GameAPI:
     
     def visible_walls(self):
         return self.view.visible_entities.walls
+
+    def walls(self):
+        return self.view.permanent_entities.walls
     
     def visible_algae(self):
         return self.view.permanent_entities.algae
+
+    # ---- PER-TICK MEMO ----
+    def memo(self, key, compute):
+        """
+        Get a value derived from the view, computed once per tick.
+
+        Everything memoized is dropped as soon as the view's tick number
+        changes, so callers never see a previous tick's value.
+
+        Args:
+            key: Hashable name of the value.
+            compute (Callable[[], object]): Builds the value on a miss.
+        """
+        memo = self._memo
+        tick = self.view.tick
+        if tick != self._memo_tick:
+            memo.clear()
+            self._memo_tick = tick
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = compute()
+            return value
+
+    def other_bots(self, bot_id: int) -> list:
+        """Friendly bots except the given one, in view order."""
+        bots = self.get_my_bots()
+        slot = self.memo("bot_slots", lambda: {b.id: i for i, b in enumerate(bots)}).get(bot_id)
+        if slot is None:
+            return list(bots)
+        return bots[:slot] + bots[slot + 1:]
+
+    def bots_with(self, ability: str) -> list:
+        """Friendly bots that have an ability equipped."""
+        return self.memo(
+            ("bots_with", ability),
+            lambda: [b for b in self.get_my_bots() if ability in b.abilities],
+        )
+
+    def cost(self, abilities) -> dict:
+        """
+        Spawn cost of an ability set (see BotContext.cost).
+
+        Returns:
+            dict: {"scrap": int, "energy": float}
+        """
+        key = tuple(abilities)
+        scrap, energy = self.memo(("cost", key), lambda: _ability_cost(key))
+        return {"scrap": scrap, "energy": energy}
+
+    # ---- COLUMNS ----
+    def columns(self, kind: str) -> EntityColumns:
+        """
+        Get an entity list as parallel arrays (see models.Columns).
+
+        Views loaded with columnar=True already hold their lists this way;
+        otherwise the columns are built once per tick from the objects.
+
+        Args:
+            kind (str): "bots", "enemies", "algae", "scraps", "banks" or
+                "energypads".
+        """
+        def build():
+            accessor, layout = COLUMN_SOURCES[kind]
+            entities = getattr(self, accessor)()
+            if not isinstance(entities, EntityColumns):
+                entities = EntityColumns.from_objects(layout, entities)
+            return entities
+
+        return self.memo(("columns", kind), build)
+
+    # ---- INDEXING ----
+    def build_index(self, static: StaticMap | None = None) -> TickIndex:
+        self.index = TickIndex(self, static)
+        return self.index
+
+    def spatial_index(self) -> TickIndex:
+        if self.index is None:
+            return self.build_index()
+        return self.index
@@ -1,13 +1,41 @@
 import json
+from types import MappingProxyType
 from typing import Dict, Any
 from .Constants import ActionType
 
 class Action:
+    """
+    One bot action. Instances returned by Translate for fixed arguments
+    are shared, so actions must be treated as immutable.
+    """
+
+    __slots__ = ("action_type", "payload", "_json")
+
     def __init__(self, action_type: ActionType, payload: Dict[str, Any]):
         self.action_type = action_type
         self.payload = payload
+        self._json: bytes | None = None
+
+    def __reduce__(self):
+        # shared actions carry read-only payload proxies, which do not pickle
+        return Action, (self.action_type, dict(self.payload))
 
     def to_dict(self):
         out = {"action": self.action_type.value}
         out.update(self.payload)
         return out
+
+    def to_json(self) -> bytes:
+        """
+        Compact JSON encoding of to_dict().
+
+        Only actions with a read-only payload (the shared ones from
+        Translate) keep the encoding; any other payload may still be
+        changed, so it is encoded on every call.
+        """
+        if self._json is not None:
+            return self._json
+        out = json.dumps(self.to_dict(), separators=(",", ":")).encode()
+        if type(self.payload) is MappingProxyType:
+            self._json = out
+        return out
@@ -0,0 +1,135 @@
+"""
+BATCH SENSING
+
+Optional NumPy-backed sensing for a whole fleet at once.
+
+Instead of every BotContext filtering the entity lists on its own, the
+wrapper computes bots x entities Manhattan distance matrices (in row
+chunks) once per tick and hands each context its precomputed neighbour
+lists and nearest entity. Results are identical to the scalar path:
+neighbours keep source order and ties for nearest resolve to the first
+entity, exactly like min().
+
+Requires numpy; the rest of the library works without it.
+"""
+
+# optional dependency, and slow to import: loaded by the first BatchSensing
+np = None
+
+
+def _numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("Batch sensing requires numpy (pip install numpy).") from None
+        np = numpy
+    return np
+
+
+# layers precomputed per bot (GameAPI.columns kinds)
+BATCH_KINDS = ("enemies", "algae", "scraps")
+
+
+class BatchSensing:
+    """
+    Per-tick neighbour lists and nearest entities for every friendly bot.
+
+    Layers are computed on first use, so a tick that never senses scraps
+    never builds the scraps matrix.
+    """
+
+    def __init__(self, api, radius: int = 10, chunk_cells: int = 1 << 20):
+        """
+        Args:
+            api (GameAPI): Game API for the current tick.
+            radius (int): Largest radius served from the batch; larger
+                queries fall back to the spatial index.
+            chunk_cells (int): Max matrix cells held in memory at once.
+        """
+        _numpy()
+
+        self.api = api
+        self.radius = radius
+        self.chunk_cells = chunk_cells
+
+        bots = api.columns("bots")
+        self.rows = {bot_id: i for i, bot_id in enumerate(bots.column("id"))}
+        self._bots = bots
+        self._bx = bots.numpy("x")
+        self._by = bots.numpy("y")
+        self._layers: dict[str, tuple[list, list, list]] = {}
+
+    def covers(self, bot, center, radius) -> bool:
+        """True if a query for this bot can be served from the batch."""
+        if radius > self.radius or bot.id not in self.rows:
+            return False
+        row = self.rows[bot.id]
+        return center.x == self._bots.x[row] and center.y == self._bots.y[row]
+
+    def neighbours(self, kind: str, bot_id: int, radius: int) -> list:
+        """
+        Get entities of a layer within radius of a bot.
+
+        Args:
+            kind (str): Layer name from BATCH_KINDS.
+            bot_id (int): Friendly bot ID.
+            radius (int): Manhattan radius, at most self.radius.
+
+        Returns:
+            list: Entities within radius, in source order.
+        """
+        entities, near, _ = self._layer(kind)
+        row = near[self.rows[bot_id]]
+        return [entities[j] for d, j in row if d <= radius]
+
+    def nearest(self, kind: str, bot_id: int):
+        """
+        Get the nearest entity of a layer to a bot.
+
+        Returns:
+            object | None: Nearest entity, or None if the layer is empty.
+        """
+        entities, _, nearest = self._layer(kind)
+        j = nearest[self.rows[bot_id]]
+        return None if j < 0 else entities[j]
+
+    def _layer(self, kind: str):
+        layer = self._layers.get(kind)
+        if layer is None:
+            layer = self._build(kind)
+            self._layers[kind] = layer
+        return layer
+
+    def _build(self, kind: str):
+        # entities are only materialised when a bot asks for them
+        entities = self.api.columns(kind)
+        n_bots = len(self._bx)
+        n_ent = len(entities)
+
+        near: list = [[] for _ in range(n_bots)]
+        nearest = [-1] * n_bots
+        if not n_ent or not n_bots:
+            return entities, near, nearest
+
+        ex = entities.numpy("x")
+        ey = entities.numpy("y")
+
+        step = max(1, self.chunk_cells // n_ent)
+        for lo in range(0, n_bots, step):
+            hi = min(lo + step, n_bots)
+            dist = (
+                np.abs(self._bx[lo:hi, None] - ex[None, :])
+                + np.abs(self._by[lo:hi, None] - ey[None, :])
+            )
+            nearest[lo:hi] = dist.argmin(axis=1).tolist()
+
+            rows, cols = np.nonzero(dist <= self.radius)
+            if not len(rows):
+                continue
+            ds = dist[rows, cols].tolist()
+            for r, c, d in zip(rows.tolist(), cols.tolist(), ds):
+                near[lo + r].append((d, c))
+
+        return entities, near, nearest
@@ -1,8 +1,30 @@
-from .Constants import Direction, Ability, ABILITY_COSTS
+from heapq import merge
+
+from .Constants import Direction, Ability
+from .Occupancy import OUT, FRIEND, BLOCKED
+from .Pathfinding import PathPlan
 from .Translate import *
 from .models import Point
 from .Helper import *
 
+
+# entity layers of the tick index that can be sensed by distance
+SENSE_KINDS = ("enemies", "bots", "algae", "scraps", "walls")
+
+
+def _location_of(entity):
+    return None if entity is None else entity.location
+
+
+def _xy(p):
+    return p.x, p.y
+
+
+def _ranked(entries, rank):
+    for d, o, e in entries:
+        yield d, rank, o, e
+
+
 class BotContext:
     """
     BotContext provides a safe, read-only interface between a bot strategy
@@ -14,9 +36,14 @@ class BotContext:
     - movement/pathfinding helpers
     - combat and resource actions
 
-    A BotContext instance is created once per bot per tick.
+    Each strategy keeps one BotContext for its whole life; the executors
+    rebind it to the new tick's API and bot instead of allocating a new
+    one. Radius sensing is served from the tick's shared spatial index,
+    and other tick-wide data from the GameAPI's per-tick memo.
     """
 
+    __slots__ = ("api", "bot")
+
     def __init__(self, api, bot):
         """
         Initialize the context for a single bot.
@@ -28,6 +55,21 @@ class BotContext:
         self.api = api
         self.bot = bot
 
+    def rebind(self, api, bot) -> "BotContext":
+        """
+        Point this context at a new tick.
+
+        Args:
+            api (GameAPI): Game API for the tick.
+            bot (Bot): The bot's model instance for the tick.
+
+        Returns:
+            BotContext: This context.
+        """
+        self.api = api
+        self.bot = bot
+        return self
+
     # ==================== ROBOT STATUS ====================
 
     def getID(self) -> int:
@@ -98,20 +140,7 @@ class BotContext:
                 - 'scrap' (int)
                 - 'energy' (float)
         """
-        total_scrap = 0
-        total_energy = 0.0
-
-        for ability in abilities:
-            if ability not in ABILITY_COSTS:
-                continue
-            total_scrap += ABILITY_COSTS[ability]["scrap"]
-            total_energy += ABILITY_COSTS[ability]["energy"]
-
-        # HeatSeeker synergy discount
-        if "SPEED" in abilities and "SELF_DESTRUCT" in abilities:
-            total_scrap -= 5
-
-        return {"scrap": total_scrap, "energy": total_energy}
+        return self.api.cost(abilities)
 
     # ==================== SENSING ====================
 
@@ -135,10 +164,17 @@ class BotContext:
         Returns:
             list[Bot]: Enemies within radius.
         """
-        return [
-            b for b in self.api.visible_enemies()
-            if manhattan_distance(b.location, bot) <= radius
-        ]
+        batch = self._batch(bot, radius)
+        if batch is not None:
+            return batch.neighbours("enemies", self.bot.id, radius)
+        return self.api.spatial_index().enemies.query(bot, radius)
+
+    def _batch(self, center: Point, radius: int):
+        """The tick's batch sensing results, if they can answer this query."""
+        batch = self.api.spatial_index().batch
+        if batch is not None and batch.covers(self.bot, center, radius):
+            return batch
+        return None
 
     def senseBotNearby(self):
         """
@@ -147,7 +183,7 @@ class BotContext:
         Returns:
             list[Bot]: Nearby friendly bots.
         """
-        return [b for b in self.api.get_my_bots() if b.id != self.bot.id]
+        return self.api.other_bots(self.bot.id)
 
     def senseBotinRadius(self, bot: Point, radius: int = 1):
         """
@@ -161,8 +197,8 @@ class BotContext:
             list[Bot]: Friendly bots within radius.
         """
         return [
-            b for b in self.api.get_my_bots()
-            if b.id != self.bot.id and manhattan_distance(b.location, bot) <= radius
+            b for b in self.api.spatial_index().bots.query(bot, radius)
+            if b.id != self.bot.id
         ]
 
     def senseAlgae(self, radius: int = 1):
@@ -176,10 +212,10 @@ class BotContext:
             list[Algae]: Algae entities within radius.
         """
         pos = self.bot.location
-        return [
-            a for a in self.api.visible_algae()
-            if manhattan_distance(a.location, pos) <= radius
-        ]
+        batch = self._batch(pos, radius)
+        if batch is not None:
+            return batch.neighbours("algae", self.bot.id, radius)
+        return self.api.spatial_index().algae.query(pos, radius)
 
     def senseSacraps(self, radius: int = 1):
         """
@@ -192,10 +228,75 @@ class BotContext:
             list[Scrap]: Scrap entities within radius.
         """
         pos = self.bot.location
-        return [
-            a for a in self.api.visible_scraps()
-            if manhattan_distance(a.location, pos) <= radius
+        batch = self._batch(pos, radius)
+        if batch is not None:
+            return batch.neighbours("scraps", self.bot.id, radius)
+        return self.api.spatial_index().scraps.query(pos, radius)
+
+    def senseByDistance(self, radius: int = 10, kinds=("algae",), center: Point | None = None, where=None):
+        """
+        Lazily stream entities within a radius, nearest first.
+
+        Entities are produced in one outward pass over the tick's spatial
+        index, so a caller that stops at the first match pays only for
+        the rings it looked at. Ties are broken by the order of `kinds`,
+        then by source order.
+
+        Args:
+            radius (int): Maximum Manhattan distance.
+            kinds (tuple[str]): Layers to include, from SENSE_KINDS.
+                "bots" never includes this bot.
+            center (Point | None): Center position (defaults to this bot).
+            where (callable | None): Optional entity filter.
+
+        Returns:
+            Iterator[tuple[int, object]]: (distance, entity) pairs.
+        """
+        for kind in kinds:
+            if kind not in SENSE_KINDS:
+                raise ValueError(f"Unknown sensing kind: {kind}")
+
+        index = self.api.spatial_index()
+        center = center or self.bot.location
+        streams = [
+            _ranked(getattr(index, kind).by_distance(center, radius), rank)
+            for rank, kind in enumerate(kinds)
         ]
+        skip_rank = kinds.index("bots") if "bots" in kinds else -1
+        my_id = self.bot.id
+
+        def stream():
+            for d, rank, _, e in merge(*streams):
+                if rank == skip_rank and e.id == my_id:
+                    continue
+                if where is None or where(e):
+                    yield d, e
+
+        return stream()
+
+    def countInRadius(self, radius: int = 1, kinds=("enemies",), center: Point | None = None) -> int:
+        """
+        Count entities within a radius without materialising them.
+
+        Args:
+            radius (int): Manhattan distance radius.
+            kinds (tuple[str]): Layers to include, from SENSE_KINDS.
+                "bots" never counts this bot.
+            center (Point | None): Center position (defaults to this bot).
+
+        Returns:
+            int: Number of entities within radius.
+        """
+        index = self.api.spatial_index()
+        center = center or self.bot.location
+        total = 0
+        for kind in kinds:
+            if kind not in SENSE_KINDS:
+                raise ValueError(f"Unknown sensing kind: {kind}")
+            total += getattr(index, kind).count(center, radius)
+        if "bots" in kinds and manhattan_distance(self.bot.location, center) <= radius:
+            total -= 1
+        return total
 
     def senseObjects(self):
         """
@@ -205,7 +306,7 @@ class BotContext:
             dict: Mapping of object categories to entity lists.
         """
         return {
-            "scraps": self.api.sense_bot_scraps(),
+            "scraps": self.api.visible_scraps(),
             "banks": self.api.banks(),
             "energypads": self.api.energypads(),
         }
@@ -230,10 +331,79 @@ class BotContext:
         Returns:
             list[Wall]: Walls within radius.
         """
-        return [
-            w for w in self.api.visible_walls()
-            if manhattan_distance(w, bot) <= radius
-        ]
+        return self.api.spatial_index().walls.query(bot, radius)
+
+    # ==================== MEMORY ====================
+
+    def _memory(self):
+        memory = self.api.memory
+        if memory is None:
+            raise RuntimeError("World memory is disabled; run play() with memory=True.")
+        return memory
+
+    def recallAlgae(self, radius: int = 10, center: Point | None = None) -> list:
+        """
+        Get remembered algae within radius, including sightings from
+        earlier ticks that are out of view now.
+
+        Args:
+            radius (int): Manhattan distance radius.
+            center (Point | None): Center (defaults to the bot's location).
+
+        Returns:
+            list[Algae]: Algae as last seen.
+        """
+        return self._memory().index("algae").query(center or self.bot.location, radius)
+
+    def recallScraps(self, radius: int = 10, center: Point | None = None) -> list:
+        """
+        Get remembered scrap piles within radius.
+
+        Args:
+            radius (int): Manhattan distance radius.
+            center (Point | None): Center (defaults to the bot's location).
+
+        Returns:
+            list[VisibleScrap]: Scrap piles as last seen.
+        """
+        return self._memory().index("scraps").query(center or self.bot.location, radius)
+
+    def recallEnemies(self, radius: int = 10, center: Point | None = None) -> list:
+        """
+        Get enemies whose last known position is within radius.
+
+        Args:
+            radius (int): Manhattan distance radius.
+            center (Point | None): Center (defaults to the bot's location).
+
+        Returns:
+            list[Bot]: Enemy bots as last seen.
+        """
+        return self._memory().index("enemies").query(center or self.bot.location, radius)
+
+    def recallNearest(self, kind: str = "algae"):
+        """
+        Get the nearest remembered entity of a kind.
+
+        Args:
+            kind (str): "algae", "scraps" or "enemies".
+
+        Returns:
+            object | None: Entity as last seen, or None.
+        """
+        return self._memory().index(kind).nearest(self.bot.location)
+
+    def lastSeenTick(self, point: Point) -> int:
+        """
+        Get the tick a cell was last in view of the fleet.
+
+        Args:
+            point (Point): Cell to check.
+
+        Returns:
+            int: Tick, or -1 if never seen.
+        """
+        return self._memory().last_seen_tick(point.x, point.y)
 
     # ==================== PATHING ====================
 
@@ -247,49 +417,152 @@ class BotContext:
         Returns:
             bool: True if move is inside map bounds.
         """
-        x, y = self.bot.location.x, self.bot.location.y
+        loc = self.bot.location
+        occupancy = self.api.spatial_index().occupancy
+        return not occupancy.step_flags(loc.x, loc.y, direction) & OUT
+
+    def getGrid(self) -> MapGrid:
+        """
+        Get the bounds of this match's map.
+
+        Pass it to Helper.next_point / direction_from_point on maps that
+        are not 20x20.
+
+        Returns:
+            MapGrid: Shared grid for the map size.
+        """
+        return self.api.grid()
 
-        if direction == Direction.NORTH:
-            y += 1
-        elif direction == Direction.SOUTH:
-            y -= 1
-        elif direction == Direction.EAST:
-            x += 1
-        elif direction == Direction.WEST:
-            x -= 1
+    def nextPoint(self, direction: Direction, start: Point | None = None) -> Point | None:
+        """
+        Get the cell one step away on this map.
 
-        return 0 <= x < self.api.view.width and 0 <= y < self.api.view.height
+        Args:
+            direction (Direction): Step direction.
+            start (Point | None): Origin (defaults to the bot's location).
+
+        Returns:
+            Point | None: Neighbouring cell, or None off the map.
+        """
+        return next_point(start or self.bot.location, direction, grid=self.getGrid())
 
-    def shortestPath(self, target: Point) -> int:
+    def directionTo(self, target: Point, start: Point | None = None) -> Direction:
         """
-        Compute Manhattan distance to a target point.
+        Get the dominant direction toward a target, ignoring obstacles.
 
         Args:
             target (Point): Target location.
+            start (Point | None): Origin (defaults to the bot's location).
 
         Returns:
-            int: Manhattan distance.
+            Direction: Direction of the larger axis offset.
         """
-        bx, by = self.bot.location.x, self.bot.location.y
-        return abs(bx - target.x) + abs(by - target.y)
+        return direction_from_point(start or self.bot.location, target, grid=self.getGrid())
 
+    def shortestPath(self, target: Point) -> int | None:
+        """
+        Compute the true path length to a target point, routing around walls.
 
+        Args:
+            target (Point): Target location.
+
+        Returns:
+            int | None: Number of steps, or None if no path was found
+            within the search budget.
+        """
+        finder = self.api.spatial_index().pathfinder
+        path = finder.astar(self.bot.location, target)
+        return None if path is None else len(path)
+
+    def followPlan(self, plan: PathPlan, target: Point) -> Direction | None:
+        """
+        Get the next step toward target from a plan kept across ticks.
+
+        The route is searched once and then reused each tick while it
+        stays valid: the bot is still on it, the target has not moved and
+        no cell left on it is blocked. Anything else triggers a new search.
+
+        Args:
+            plan (PathPlan): The strategy's plan (BotController.plan).
+            target (Point): Target location.
+
+        Returns:
+            Direction | None: Step to take, or None if already there or boxed in.
+        """
+        index = self.api.spatial_index()
+        finder = index.pathfinder
+        loc = self.bot.location
+        here = finder.index(loc.x, loc.y)
+        if loc == target:
+            plan.clear()
+            return None
+
+        table = self.api.reservations
+        valid = plan.advance(finder, target, here, index.occupancy.cells)
+        if valid and table is not None and table.horizon:
+            # other bots' look-ahead reservations on our next cells
+            route = (_xy(finder.point(c)) for c in plan.cells[plan.step:])
+            valid = not table.conflicts(self.bot.id, route, self.api.get_tick())
+            avoid = not valid
+        else:
+            avoid = False
+
+        if not valid:
+            path = self._plan(loc, target, self._reservedCells(finder) if avoid else None)
+            if not path:
+                plan.clear()
+                return None
+            plan.set(finder, target, here, path)
+        return finder.direction(here, plan.cells[plan.step])
+
+    def _reservedCells(self, finder) -> list[int]:
+        """Padded indices other bots have reserved within the look-ahead horizon."""
+        table = self.api.reservations
+        tick = self.api.get_tick()
+        return [
+            finder.index(x, y)
+            for (x, y, t), holder in table.items()
+            if holder != self.bot.id and tick < t <= tick + table.horizon
+        ]
+
+    def _plan(self, bot: Point, target: Point, avoid: list[int] | None = None) -> list[int]:
+        """
+        Best-effort path from bot toward target around walls and units.
+
+        Args:
+            avoid (list[int] | None): Extra padded cells to treat as taken.
+
+        Returns:
+            list[int]: Padded cell indices after bot (empty if stuck).
+        """
+        index = self.api.spatial_index()
+        occupied = index.occupancy.cells
+        if avoid:
+            occupied = bytearray(occupied)
+            for c in avoid:
+                occupied[c] |= FRIEND
+        path = index.pathfinder.astar(bot, target, occupied=occupied, partial=True)
+        return path or []
 
     def checkBlocked(self, pos: Point) -> bool:
         """
         Determine if a position is blocked by any obstacle.
 
+        A single lookup in the tick's occupancy flags: the cell is blocked
+        if it is off the map, a wall, or holds an enemy or another friendly
+        bot.
+
         Args:
             pos (Point): Position to check.
 
         Returns:
             bool: True if blocked.
         """
-        return (
-            self.senseWallsinRadius(pos) or
-            self.senseEnemyinRadius(pos) or
-            self.senseBotinRadius(pos)
-        )
+        occupancy = self.api.spatial_index().occupancy
+        mask = BLOCKED
+        if pos == self.bot.location and not occupancy.shared(pos.x, pos.y):
+            mask &= ~FRIEND
+        return occupancy.blocked(pos.x, pos.y, mask)
 
 
     def canDefend(self) -> bool:
@@ -320,158 +593,128 @@ class BotContext:
         Returns:
             bool: True if spawn is allowed.
         """
-        if self.api.view.bot_count >= self.api.view.max_bots:
+        view = self.api.view
+        if view.bot_count >= view.max_bots:
             return False
-        return self.api.get_scraps() >= self.cost(abilities)["scrap"] and self.api.get_energy() >= self.cost(abilities)["energy"]
+        return view.scraps >= self.api.cost(abilities)["scrap"]
 
     # ==================== NEAREST OBJECT HELPERS ====================
 
-    def getNearestBank(self) -> Point:
-        """Return nearest bank location."""
+    def getNearestBank(self) -> Point | None:
+        """Return nearest bank location (by path distance, from the shared bank field)."""
+        index = self.api.spatial_index()
         pos = self.bot.location
-        return min(self.api.banks(), key=lambda b: manhattan_distance(b.location, pos)).location
-
-    def getNearestEnergyPad(self) -> Point:
-        """Return nearest energy pad location."""
+        nearest = index.bank_field.nearest(pos)
+        if nearest is not None:
+            return nearest
+        return _location_of(index.banks.nearest(pos))
+
+    def getNearestEnergyPad(self) -> Point | None:
+        """Return nearest energy pad location (by path distance, from the shared pad field)."""
+        index = self.api.spatial_index()
         pos = self.bot.location
-        return min(self.api.energypads(), key=lambda p: manhattan_distance(p.location, pos)).location
+        nearest = index.energypad_field.nearest(pos)
+        if nearest is not None:
+            return nearest
+        return _location_of(index.energypads.nearest(pos))
+
+    def getBankDirection(self) -> Direction | None:
+        """Return the first step toward the nearest bank, or None if on one or cut off."""
+        return self.api.spatial_index().bank_field.direction(self.bot.location)
 
-    def getNearestScrap(self) -> Point:
+    def getEnergyPadDirection(self) -> Direction | None:
+        """Return the first step toward the nearest energy pad, or None if on one or cut off."""
+        return self.api.spatial_index().energypad_field.direction(self.bot.location)
+
+    def getNearestScrap(self) -> Point | None:
         """Return nearest scrap location."""
-        pos = self.bot.location
-        return min(self.api.sense_bot_scraps(), key=lambda s: manhattan_distance(s.location, pos)).location
+        return _location_of(self._nearest("scraps"))
 
-    def getNearestAlgae(self) -> Point:
+    def getNearestAlgae(self) -> Point | None:
         """Return nearest algae location."""
-        pos = self.bot.location
-        return min(self.api.visible_algae(), key=lambda a: manhattan_distance(a.location, pos)).location
+        return _location_of(self._nearest("algae"))
 
-    def getNearestEnemy(self) -> Point:
+    def getNearestEnemy(self) -> Point | None:
         """Return nearest enemy location."""
-        pos = self.bot.location
-        return min(self.api.visible_enemies(), key=lambda e: manhattan_distance(e.location, pos)).location
+        return _location_of(self._nearest("enemies"))
+
+    def _nearest(self, kind: str):
+        index = self.api.spatial_index()
+        batch = index.batch
+        if batch is not None and self.bot.id in batch.rows:
+            return batch.nearest(kind, self.bot.id)
+        return getattr(index, kind).nearest(self.bot.location)
+
+    def getKNearestScraps(self, k: int) -> list[Point]:
+        """Return up to k scrap locations, nearest first."""
+        found = self.api.spatial_index().scraps.k_nearest(self.bot.location, k)
+        return [s.location for s in found]
+
+    def getKNearestAlgae(self, k: int) -> list[Point]:
+        """Return up to k algae locations, nearest first."""
+        found = self.api.spatial_index().algae.k_nearest(self.bot.location, k)
+        return [a.location for a in found]
+
+    def getKNearestEnemies(self, k: int) -> list[Point]:
+        """Return up to k enemy locations, nearest first."""
+        found = self.api.spatial_index().enemies.k_nearest(self.bot.location, k)
+        return [e.location for e in found]
+
+    def claimNearestScrap(self) -> Point | None:
+        """Claim the nearest scrap no other bot has claimed this tick and return its location."""
+        return _location_of(self.api.spatial_index().scraps.claim_nearest(self.bot.location))
+
+    def claimNearestAlgae(self) -> Point | None:
+        """Claim the nearest algae no other bot has claimed this tick and return its location."""
+        return _location_of(self.api.spatial_index().algae.claim_nearest(self.bot.location))
 
     # ==================== COLLISION AVOIDANCE ====================
 
-def moveTarget(self, bot: Point, target: Point):
-    """
-    Fast, edge-safe movement toward target.
-    O(1) time, no allocations.
-    """
+    def moveTarget(self, bot: Point, target: Point):
+        """
+        Get the first step of a shortest path toward target.
 
-    x, y = bot.x, bot.y
-    at_left   = (x == 0)
-    at_right  = (x == 19)
-    at_bottom = (y == 0)
-    at_top    = (y == 19)
-
-    dx = target.x - x
-    dy = target.y - y
-
-    # ---------- preferred direction ----------
-    if abs(dx) >= abs(dy):
-        preferred = Direction.EAST if dx > 0 else Direction.WEST
-    else:
-        preferred = Direction.NORTH if dy > 0 else Direction.SOUTH
-
-    def try_dir(d: Direction):
-        np = next_point(bot, d)
-        return np is not None and not self.checkBlocked(np)
-
-    # ---------- try preferred ----------
-    if (
-        (preferred == Direction.EAST  and not at_right) or
-        (preferred == Direction.WEST  and not at_left)  or
-        (preferred == Direction.NORTH and not at_top)   or
-        (preferred == Direction.SOUTH and not at_bottom)
-    ):
-        if try_dir(preferred):
-            return preferred
-
-    # ---------- inward recovery ----------
-    if at_left and try_dir(Direction.EAST):
-        return Direction.EAST
-    if at_right and try_dir(Direction.WEST):
-        return Direction.WEST
-    if at_bottom and try_dir(Direction.NORTH):
-        return Direction.NORTH
-    if at_top and try_dir(Direction.SOUTH):
-        return Direction.SOUTH
-
-    # ---------- minimal fallback ----------
-    if not at_top and try_dir(Direction.NORTH):
-        return Direction.NORTH
-    if not at_right and try_dir(Direction.EAST):
-        return Direction.EAST
-    if not at_bottom and try_dir(Direction.SOUTH):
-        return Direction.SOUTH
-    if not at_left and try_dir(Direction.WEST):
-        return Direction.WEST
-
-    return None
-
-
-def moveTargetSpeed(self, bot: Point, target: Point):
-    """
-    High-performance SPEED movement with edge protection.
-    """
+        The path avoids walls, enemies and friendly bots. If the target
+        cannot be reached, the step heads for the reachable cell closest
+        to it.
+
+        Args:
+            bot (Point): Start position.
+            target (Point): Target location.
+
+        Returns:
+            Direction | None: Step to take, or None if already there or boxed in.
+        """
+        path = self._plan(bot, target)
+        if not path:
+            return None
+        finder = self.api.spatial_index().pathfinder
+        return finder.direction(finder.index(bot.x, bot.y), path[0])
 
-    if Ability.SPEED.value not in self.bot.abilities:
-        raise ValueError("Bot does not have SPEED ability equipped.")
+    def moveTargetSpeed(self, bot: Point, target: Point):
+        """
+        Get a SPEED move along a shortest path toward target.
 
-    x, y = bot.x, bot.y
-    at_left   = (x == 0)
-    at_right  = (x == 19)
-    at_bottom = (y == 0)
-    at_top    = (y == 19)
+        Takes two steps when the first two cells of the path lie in the
+        same direction, otherwise one.
 
-    dx = target.x - x
-    dy = target.y - y
+        Args:
+            bot (Point): Start position.
+            target (Point): Target location.
 
-    if abs(dx) >= abs(dy):
-        preferred = Direction.EAST if dx > 0 else Direction.WEST
-    else:
-        preferred = Direction.NORTH if dy > 0 else Direction.SOUTH
+        Returns:
+            tuple[Direction | None, int]: Direction and step count.
+        """
+        if Ability.SPEED.value not in self.bot.abilities:
+            raise ValueError("Bot does not have SPEED ability equipped.")
 
-    def speed_try(d: Direction):
-        p1 = next_point(bot, d)
-        if p1 is None or self.checkBlocked(p1):
-            return None
-        p2 = next_point(p1, d)
-        if p2 is not None and not self.checkBlocked(p2):
-            return (d, 2)
-        return (d, 1)
-
-    # ---------- preferred ----------
-    if (
-        (preferred == Direction.EAST  and not at_right) or
-        (preferred == Direction.WEST  and not at_left)  or
-        (preferred == Direction.NORTH and not at_top)   or
-        (preferred == Direction.SOUTH and not at_bottom)
-    ):
-        res = speed_try(preferred)
-        if res:
-            return res
-
-    # ---------- inward ----------
-    if at_left:
-        res = speed_try(Direction.EAST)
-        if res: return res
-    if at_right:
-        res = speed_try(Direction.WEST)
-        if res: return res
-    if at_bottom:
-        res = speed_try(Direction.NORTH)
-        if res: return res
-    if at_top:
-        res = speed_try(Direction.SOUTH)
-        if res: return res
-
-    # ---------- fallback ----------
-    for d in (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST):
-        res = speed_try(d)
-        if res:
-            return res
-
-    return None, 0
+        path = self._plan(bot, target)
+        if not path:
+            return None, 0
 
+        finder = self.api.spatial_index().pathfinder
+        start = finder.index(bot.x, bot.y)
+        d = finder.direction(start, path[0])
+        if len(path) > 1 and path[1] - path[0] == path[0] - start:
+            return d, 2
+        return d, 1
@@ -5,6 +5,11 @@ class BotIDAllocator:
     def __init__(self, start: int = 1):
         self._next_id = start
 
+    @property
+    def next_id(self) -> int:
+        """ID the next allocate() call returns."""
+        return self._next_id
+
     def allocate(self) -> int:
         bot_id = self._next_id
         self._next_id += 1
@@ -0,0 +1,229 @@
+"""
+DELTA INPUT
+
+Tick-to-tick diffs of the PlayerView.
+
+Handles:
+- Applying a diff (added / removed / changed entities and scalar
+  fields since the previous tick) to a cached view in place
+- Producing diffs from full views (local stand-in for the engine)
+
+Diff format (JSON):
+
+    {"tick": N, "full": <engine view>}                   first tick / resync
+    {"tick": N, "base": N-1,
+     "set": {"scraps": 120, ...},                        changed scalars
+     "sections": {
+         "<section>": {
+             "added":   [[key, entry], ...],
+             "changed": [[key, entry], ...],
+             "removed": [key, ...]
+         }, ...
+     }}
+
+Sections are Loader.SECTIONS. Bots, enemies, banks and energy pads are
+keyed by id; scraps, algae and walls by [x, y, n], where n counts
+earlier entries on the same cell. Entries keep their position in the
+cached lists across ticks and new ones are appended.
+"""
+
+from .Loader import SECTIONS, ViewLoader, dump_view, parse_json
+from .models.PlayerView import PlayerView
+
+# scalar PlayerView fields carried in "set"
+SCALARS = ("scraps", "algae", "bot_count", "max_bots", "width", "height")
+
+# section -> (PlayerView container attribute or None, list attribute, key mode)
+_LAYOUT = {
+    "bots": (None, "bots", "id"),
+    "enemies": ("visible_entities", "enemies", "id"),
+    "scraps": ("visible_entities", "scraps", "cell"),
+    "visible_walls": ("visible_entities", "walls", "point"),
+    "banks": ("permanent_entities", "banks", "id"),
+    "energypads": ("permanent_entities", "energypads", "id"),
+    "walls": ("permanent_entities", "walls", "point"),
+    "algae": ("permanent_entities", "algae", "cell"),
+}
+
+
+def _raw_sections(raw: dict) -> dict[str, list]:
+    visible = raw.get("visible_entities") or {}
+    permanent = raw.get("permanent_entities") or {}
+    return {
+        "bots": raw.get("bots") or [],
+        "enemies": visible.get("enemies") or [],
+        "scraps": visible.get("scraps") or [],
+        "visible_walls": visible.get("walls") or [],
+        "banks": permanent.get("banks") or [],
+        "energypads": permanent.get("energypads") or [],
+        "walls": permanent.get("walls") or [],
+        "algae": permanent.get("algae") or [],
+    }
+
+
+def _keys(items: list, mode: str) -> list:
+    if mode == "id":
+        return [item["id"] for item in items]
+    counts: dict[tuple[int, int], int] = {}
+    keys = []
+    for item in items:
+        p = item["location"] if mode == "cell" else item
+        xy = (p["x"], p["y"])
+        n = counts.get(xy, 0)
+        counts[xy] = n + 1
+        keys.append((xy[0], xy[1], n))
+    return keys
+
+
+def _key(k):
+    # cell keys arrive as JSON lists
+    return tuple(k) if isinstance(k, list) else k
+
+
+def _list(view: PlayerView, section: str) -> list:
+    container, attr, _ = _LAYOUT[section]
+    owner = view if container is None else getattr(view, container)
+    return getattr(owner, attr)
+
+
+class DeltaLoader:
+    """
+    Keeps the current PlayerView and applies each tick's diff to it.
+
+    The same PlayerView object (and the same section lists) is updated
+    every tick; changed entities are replaced by new objects, so
+    references kept from earlier ticks still describe those ticks.
+    """
+
+    def __init__(self, loader: ViewLoader | None = None):
+        """
+        Args:
+            loader (ViewLoader | None): Builds the model objects
+                (a private one is used when omitted).
+        """
+        self.loader = loader or ViewLoader()
+        self.view: PlayerView | None = None
+        self._keyed: dict[str, dict] = {}
+
+    def apply(self, data) -> PlayerView:
+        """
+        Bring the cached view up to date.
+
+        Args:
+            data (str | bytes | dict): Diff JSON, or the decoded dict.
+
+        Returns:
+            PlayerView: The updated view.
+
+        Raises:
+            ValueError: If the diff is not based on the cached tick.
+        """
+        diff = parse_json(data)
+        if "full" in diff:
+            return self._reset(diff["full"])
+
+        view = self.view
+        if view is None or diff.get("base") != view.tick:
+            have = None if view is None else view.tick
+            raise ValueError(
+                f"Delta for tick {diff.get('tick')} is based on tick "
+                f"{diff.get('base')}, but the cached view is at tick {have}"
+            )
+
+        view.tick = diff["tick"]
+        for name, value in (diff.get("set") or {}).items():
+            if name not in SCALARS:
+                raise ValueError(f"Unknown scalar field in delta: {name!r}")
+            setattr(view, name, value)
+
+        for section, change in (diff.get("sections") or {}).items():
+            keyed = self._keyed[section]
+            for k in change.get("removed", ()):
+                keyed.pop(_key(k), None)
+            pairs = list(change.get("changed", ())) + list(change.get("added", ()))
+            if pairs:
+                built = self.loader.build(section, [entry for _, entry in pairs])
+                for (k, _), entity in zip(pairs, built):
+                    keyed[_key(k)] = entity
+            _list(view, section)[:] = keyed.values()
+
+        return view
+
+    def _reset(self, raw: dict) -> PlayerView:
+        view = self.loader.load(raw, skip=(), columnar=False)
+        sections = _raw_sections(raw)
+        self._keyed = {
+            section: dict(zip(_keys(sections[section], _LAYOUT[section][2]), _list(view, section)))
+            for section in SECTIONS
+        }
+        self.view = view
+        return view
+
+
+class DeltaProducer:
+    """
+    Emits diffs between successive full views, the way the engine would
+    in delta mode. Used for testing and local simulation.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Make the next diff a full snapshot."""
+        self._tick = None
+        self._scalars: dict = {}
+        self._sections: dict[str, dict] = {}
+
+    def diff(self, view: PlayerView) -> dict:
+        """
+        Diff a view against the previous one passed in.
+
+        Args:
+            view (PlayerView): Full view for the new tick.
+
+        Returns:
+            dict: JSON-serialisable diff.
+        """
+        raw = dump_view(view)
+        sections = {
+            section: dict(zip(_keys(items, _LAYOUT[section][2]), items))
+            for section, items in _raw_sections(raw).items()
+        }
+        scalars = {name: raw[name] for name in SCALARS}
+
+        resync = (
+            self._tick is None
+            or (scalars["width"], scalars["height"])
+            != (self._scalars["width"], self._scalars["height"])
+        )
+        if resync:
+            out = {"tick": raw["tick"], "full": raw}
+        else:
+            out = {"tick": raw["tick"], "base": self._tick}
+            changed_scalars = {
+                name: value for name, value in scalars.items() if self._scalars[name] != value
+            }
+            if changed_scalars:
+                out["set"] = changed_scalars
+
+            changes = {}
+            for section, now in sections.items():
+                before = self._sections[section]
+                added, changed = [], []
+                for k, entry in now.items():
+                    old = before.get(k)
+                    if old is None:
+                        added.append([k, entry])
+                    elif old != entry:
+                        changed.append([k, entry])
+                removed = [k for k in before if k not in now]
+                if added or changed or removed:
+                    changes[section] = {"added": added, "changed": changed, "removed": removed}
+            if changes:
+                out["sections"] = changes
+
+        self._tick = raw["tick"]
+        self._scalars = scalars
+        self._sections = sections
+        return out
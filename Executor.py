@@ -0,0 +1,443 @@
+"""
+EXECUTORS
+
+Strategies for running every bot's act() in the execution phase.
+
+Handles:
+- Sequential execution (default)
+- Thread pool execution (scales on free-threaded builds)
+- Process pool execution with sticky bot ownership and the tick's
+  PlayerView, world memory and move reservations shared through shared
+  memory
+- Deadline-aware execution with per-bot time slices and fallbacks
+
+Every executor returns actions in the order of the bots it was given,
+so the wrapper's output is deterministic regardless of completion order.
+"""
+
+# concurrent.futures and multiprocessing are imported by the executors
+# that use them: they are slow to import and most matches run serially
+import pickle
+import queue
+import threading
+import time
+import traceback
+
+from .API import GameAPI
+from .BotContext import BotContext
+from .Instrumentation import PROFILER
+from .Pathfinding import StaticMap
+
+
+def _act(strategy):
+    return PROFILER.act(strategy)
+
+
+def _bind(strategy, api, bot):
+    """Rebind the strategy's pooled context to this tick (created on first use)."""
+    ctx = strategy.ctx
+    if type(ctx) is BotContext:
+        ctx.rebind(api, bot)
+    else:
+        strategy.ctx = BotContext(api, bot)
+
+
+class SerialExecutor:
+    """
+    Runs act() for each bot in turn on the calling thread.
+    """
+
+    def run(self, api, bots, strategies, spawned) -> list:
+        """
+        Execute one tick.
+
+        Args:
+            api (GameAPI): Game API for the tick.
+            bots (list[Bot]): Friendly bots, in output order.
+            strategies (dict[int, BotController]): Registered strategies.
+            spawned (dict[int, BotController]): Strategies created this tick.
+
+        Returns:
+            list[Action | None]: One action per bot, in bot order.
+        """
+        actions = []
+        for bot in bots:
+            strategy = strategies[bot.id]
+            # rebind context every tick
+            _bind(strategy, api, bot)
+            actions.append(PROFILER.act(strategy))
+        return actions
+
+    def close(self):
+        pass
+
+
+class ThreadExecutor(SerialExecutor):
+    """
+    Runs act() calls on a thread pool.
+
+    Contexts are bound before dispatch and results are collected in bot
+    order. CPU-bound strategies only run in parallel on free-threaded
+    Python builds; elsewhere this helps strategies that release the GIL.
+    """
+
+    def __init__(self, workers: int | None = None):
+        """
+        Args:
+            workers (int | None): Pool size (defaults to the CPU count).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+    def run(self, api, bots, strategies, spawned) -> list:
+        batch = []
+        for bot in bots:
+            strategy = strategies[bot.id]
+            _bind(strategy, api, bot)
+            batch.append(strategy)
+        return list(self._pool.map(_act, batch))
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+
+# ============================================================
+# PROCESS POOL
+# ============================================================
+
+def _attach(name: str):
+    """Attach to the parent's block without handing it to this process's resource tracker."""
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _plan_state(plan):
+    """A PathPlan's route as plain data (None when empty), for the parent's copy."""
+    if not plan.cells:
+        return None
+    return plan.target, plan.cells, plan.step, plan.at
+
+
+def _worker_main(conn):
+    """
+    Worker loop: owns a subset of the fleet's strategy instances.
+
+    Each tick message carries the shared-memory block holding the pickled
+    (PlayerView, WorldMemory, ReservationTable), the strategies spawned
+    for this worker and the ids of the bots it must run. When look-ahead
+    reservations are on, the reply also carries each bot's path plan.
+    """
+    strategies = {}
+    static = StaticMap()
+    shm = None
+
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+
+        name, size, spawned, bot_ids = msg
+        try:
+            if shm is None or shm.name != name:
+                if shm is not None:
+                    shm.close()
+                shm = _attach(name)
+            view, memory, reservations = pickle.loads(shm.buf[:size])
+
+            strategies.update(spawned)
+            api = GameAPI(view)
+            api.memory = memory
+            api.reservations = reservations
+            # with memory on, the path finder routes around remembered walls
+            api.build_index(static)
+            send_plans = reservations is not None and reservations.horizon > 0
+
+            mine = set(bot_ids)
+            results = {}
+            plans = {}
+            for bot in view.bots:
+                if bot.id in mine:
+                    strategy = strategies[bot.id]
+                    _bind(strategy, api, bot)
+                    action = PROFILER.act(strategy)
+                    # contexts hold the whole view; do not ship them back
+                    strategy.ctx = None
+                    results[bot.id] = action
+                    if send_plans:
+                        plans[bot.id] = _plan_state(strategy.plan)
+
+            alive = {bot.id for bot in view.bots}
+            for bot_id in list(strategies):
+                if bot_id not in alive and bot_id not in spawned:
+                    del strategies[bot_id]
+
+            conn.send(("ok", (results, plans)))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+
+    if shm is not None:
+        shm.close()
+
+
+class ProcessExecutor:
+    """
+    Runs act() calls across worker processes.
+
+    Every bot is owned by one worker for its whole life (bot id modulo
+    the worker count), so strategy instance state such as a Saboteur's
+    target persists across ticks. The tick's PlayerView is pickled once
+    into a shared-memory block that all workers read, rather than being
+    pickled per bot.
+
+    The world memory and the reservation table travel with the view, so
+    recall and cooperative pathing work as they do in-process. The
+    instance the wrapper keeps in its registry is only the one built at
+    spawn time; the live instance runs inside the owning worker. With
+    look-ahead reservations on, each bot's path plan is copied back onto
+    the registry instance so the resolver reserves the route the worker
+    actually planned.
+    """
+
+    def __init__(self, workers: int | None = None, context: str | None = None):
+        """
+        Args:
+            workers (int | None): Number of worker processes (defaults to
+                the CPU count).
+            context (str | None): multiprocessing start method.
+        """
+        import multiprocessing as mp
+
+        ctx = mp.get_context(context)
+        self._workers = []
+        for _ in range(workers or mp.cpu_count()):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_worker_main, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+            self._workers.append((proc, parent))
+        self._shm = None
+
+    def _share(self, api) -> tuple[str, int]:
+        payload = (api.view, api.memory, api.reservations)
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(data)
+        if self._shm is None or self._shm.size < size:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            from multiprocessing import shared_memory
+
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size * 2, 1 << 16))
+        self._shm.buf[:size] = data
+        return self._shm.name, size
+
+    def run(self, api, bots, strategies, spawned) -> list:
+        n = len(self._workers)
+        name, size = self._share(api)
+
+        owned = [[] for _ in range(n)]
+        for bot in bots:
+            owned[bot.id % n].append(bot.id)
+        handoff = [{} for _ in range(n)]
+        for bot_id, strategy in spawned.items():
+            handoff[bot_id % n][bot_id] = strategy
+
+        # workers also drop dead bots, so every worker gets a message
+        for w, (_, conn) in enumerate(self._workers):
+            conn.send((name, size, handoff[w], owned[w]))
+
+        results = {}
+        plans = {}
+        errors = []
+        for _, conn in self._workers:
+            status, payload = conn.recv()
+            if status == "ok":
+                results.update(payload[0])
+                plans.update(payload[1])
+            else:
+                errors.append(payload)
+        if errors:
+            raise RuntimeError("Strategy failed in worker process:\n" + errors[0])
+
+        if plans:
+            finder = api.spatial_index().pathfinder
+            for bot_id, state in plans.items():
+                plan = strategies[bot_id].plan
+                if state is None:
+                    plan.clear()
+                else:
+                    plan.target, plan.cells, plan.step, plan.at = state
+                    plan.finder = finder
+
+        return [results.get(bot.id) for bot in bots]
+
+    def close(self):
+        for proc, conn in self._workers:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            proc.join(timeout=5)
+        self._workers = []
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+# ============================================================
+# DEADLINE SCHEDULING
+# ============================================================
+
+class _Runner:
+    """
+    A worker thread that runs the act() calls handed to it, one at a time.
+    """
+
+    def __init__(self):
+        from concurrent.futures import Future
+
+        self._future = Future
+        self._jobs = queue.SimpleQueue()
+        # daemon: an act() that never returns must not hold up interpreter exit
+        self.thread = threading.Thread(target=self._loop, name="deadline-act", daemon=True)
+        self.thread.start()
+
+    def submit(self, strategy):
+        """Queue one act() call and return its Future."""
+        future = self._future()
+        self._jobs.put((future, strategy))
+        return future
+
+    def retire(self):
+        """Exit once the current call returns; nothing more is submitted."""
+        self._jobs.put(None)
+
+    def _loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, strategy = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(_act(strategy))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+class DeadlineExecutor:
+    """
+    Runs act() calls under a total tick budget.
+
+    Bots run in priority order (strategy PRIORITY, highest first). Each
+    gets a slice of the budget proportional to its strategy's
+    BUDGET_WEIGHT, plus whatever earlier bots left unused. A bot that
+    overruns its slice gets its strategy's fallback() action instead.
+    Its act() keeps running in the background, and the bot gets fallbacks
+    until it finishes so two act() calls never share one strategy. Once
+    the whole budget is spent, the remaining bots get fallbacks without
+    running.
+
+    act() calls run one at a time on a runner thread. A runner whose call
+    overran is retired (it exits once that call returns) and a fresh one
+    takes over, so stuck bots never hold capacity the rest of the fleet
+    needs: there is one live runner plus one per bot still busy.
+
+    After each tick, `report` lists the bots that overran, were still
+    busy from an earlier overrun, or were skipped.
+    """
+
+    def __init__(self):
+        self._runner: _Runner | None = None
+        self._busy: dict[int, object] = {}
+        self.report: dict[str, list[int]] = {"overran": [], "busy": [], "skipped": []}
+
+    def run(self, api, bots, strategies, spawned, budget: float = 0.05, weights=None) -> list:
+        """
+        Execute one tick within a time budget.
+
+        Args:
+            api (GameAPI): Game API for the tick.
+            bots (list[Bot]): Friendly bots, in output order.
+            strategies (dict[int, BotController]): Registered strategies.
+            spawned (dict[int, BotController]): Strategies created this tick.
+            budget (float): Seconds available for the whole execution phase
+                (Match.play passes what the tick budget has left).
+            weights (dict[type, float] | None): Per-class weight overrides.
+
+        Returns:
+            list[Action | None]: One action per bot, in bot order.
+        """
+        from concurrent.futures import TimeoutError as _FutureTimeout
+
+        start = time.perf_counter()
+        deadline = start + budget
+        report = {"overran": [], "busy": [], "skipped": []}
+
+        for bot_id, future in list(self._busy.items()):
+            if future.done():
+                del self._busy[bot_id]
+
+        def weight(strategy):
+            cls = type(strategy)
+            if weights and cls in weights:
+                return weights[cls]
+            return cls.BUDGET_WEIGHT
+
+        order = sorted(
+            range(len(bots)),
+            key=lambda i: -type(strategies[bots[i].id]).PRIORITY,
+        )
+        shares = [weight(strategies[bots[i].id]) for i in order]
+        remaining_share = sum(shares)
+
+        results: list = [None] * len(bots)
+        for i, share in zip(order, shares):
+            bot = bots[i]
+            strategy = strategies[bot.id]
+            now = time.perf_counter()
+            left = deadline - now
+
+            if bot.id in self._busy:
+                results[i] = strategy.fallback(BotContext(api, bot))
+                report["busy"].append(bot.id)
+            elif left <= 0:
+                results[i] = strategy.fallback(BotContext(api, bot))
+                report["skipped"].append(bot.id)
+            else:
+                # unused time from earlier bots rolls forward
+                slice_ = left * share / remaining_share if remaining_share else left
+                # not busy, so no earlier act() is still using the context
+                _bind(strategy, api, bot)
+                if self._runner is None:
+                    self._runner = _Runner()
+                future = self._runner.submit(strategy)
+                try:
+                    results[i] = future.result(timeout=slice_)
+                except _FutureTimeout:
+                    if not future.cancel():
+                        self._busy[bot.id] = future
+                        # leave the stuck call its thread; later bots get a new one
+                        self._runner.retire()
+                        self._runner = None
+                    results[i] = strategy.fallback(BotContext(api, bot))
+                    report["overran"].append(bot.id)
+            remaining_share -= share
+
+        self.report = report
+        return results
+
+    def close(self):
+        if self._runner is not None:
+            self._runner.retire()
+            self._runner = None
@@ -1,26 +1,100 @@
+from functools import lru_cache
+
 from .models.Point import Point
 from  .Constants import Direction
 
 def manhattan_distance(p1:Point, p2: Point) -> int:
     return abs(p1.x - p2.x) + abs(p1.y - p2.y)
 
-def next_point(p: Point, d: Direction):
-    if d == Direction.NORTH and p.y+1>=0 and p.y+1 < 20:
-        return Point(p.x, p.y + 1)
-    if d == Direction.SOUTH and p.y-1>=0 and p.y-1 < 20:
-        return Point(p.x, p.y - 1)
-    if d == Direction.EAST and p.x+1>=0 and p.x+1 < 20:
-        return Point(p.x + 1, p.y)
-    if d == Direction.WEST and p.x-1>=0 and p.x-1 < 20:
-        return Point(p.x - 1, p.y)
+
+# (dx, dy) of one step; Direction is a str enum, so plain names work too
+STEPS = {
+    Direction.NORTH: (0, 1),
+    Direction.SOUTH: (0, -1),
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+}
+
+
+class MapGrid:
+    """
+    Bounds of one map size.
+
+    Steps are plain arithmetic with a bounds check, so a grid costs the
+    same on any map size; wall-aware movement goes through the tick's
+    PathFinder instead.
+    """
+
+    __slots__ = ("width", "height")
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+    def contains(self, p: Point) -> bool:
+        return 0 <= p.x < self.width and 0 <= p.y < self.height
+
+    def next_point(self, p: Point, d: Direction) -> Point | None:
+        """
+        Get the cell one step from p.
+
+        Returns:
+            Point | None: Neighbouring cell, or None off the map.
+        """
+        w, h = self.width, self.height
+        if not (0 <= p.x < w and 0 <= p.y < h):
+            return None
+        dx, dy = STEPS[d]
+        x, y = p.x + dx, p.y + dy
+        if 0 <= x < w and 0 <= y < h:
+            return Point(x, y)
+        return None
+
+    def direction(self, p1: Point, p2: Point) -> Direction:
+        """
+        Get the dominant direction from p1 toward p2.
+
+        Raises:
+            ValueError: If either point is off the map.
+        """
+        if not (self.contains(p1) and self.contains(p2)):
+            raise ValueError(
+                f"Points must be within the grid bounds "
+                f"(0-{self.width - 1} for x, 0-{self.height - 1} for y)"
+            )
+        dx = p2.x - p1.x
+        dy = p2.y - p1.y
+
+        if abs(dx) >= abs(dy):
+            return Direction.EAST if dx > 0 else Direction.WEST
+        else:
+            return Direction.NORTH if dy > 0 else Direction.SOUTH
+
+
+@lru_cache(maxsize=8)
+def grid_for(width: int, height: int) -> MapGrid:
+    """Get the shared MapGrid for a map size."""
+    return MapGrid(width, height)
+
+
+# map size the grid-less helpers assume (the engine's standard map)
+DEFAULT_SIZE = (20, 20)
+
+
+def next_point(p: Point, d: Direction, grid: MapGrid | None = None):
+    """
+    Cell one step from p (see MapGrid.next_point).
+
+    grid is optional for compatibility with strategies written before it
+    existed; without it the standard 20x20 map is assumed. Pass the
+    match's grid (BotContext.getGrid()) on other map sizes.
+    """
+    return (grid or grid_for(*DEFAULT_SIZE)).next_point(p, d)
     
-def direction_from_point(p1: Point, p2: Point) -> Direction:
-    if p1.x>20 or p1.x<0 or p1.y>20 or p1.y<0 or p2.x>20 or p2.x<0 or p2.y>20 or p2.y<0:
-        raise ValueError("Points must be within the grid bounds (0-19 for both x and y)")
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-
-    if abs(dx) >= abs(dy):
-        return Direction.EAST if dx > 0 else Direction.WEST
-    else:
-        return Direction.NORTH if dy > 0 else Direction.SOUTH
\ No newline at end of file
+def direction_from_point(p1: Point, p2: Point, grid: MapGrid | None = None) -> Direction:
+    """
+    Dominant direction from p1 toward p2 (see MapGrid.direction).
+
+    grid is optional, with the same 20x20 default as next_point.
+    """
+    return (grid or grid_for(*DEFAULT_SIZE)).direction(p1, p2)
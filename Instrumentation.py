@@ -0,0 +1,233 @@
+"""
+INSTRUMENTATION
+
+Opt-in wall-time profiling of the wrapper and strategies.
+
+Handles:
+- Per-phase timing of Wrapper.play (spawn, execute, resolve, cleanup, record, tick)
+- Per-strategy-class timing of act()
+- Per-method timing of BotContext sensing and pathing calls
+- Count / total / p50 / p99 / max summaries for dumping at match end
+
+Samples may come from executor worker threads, so series are updated
+under one lock. Disabled by default. BotContext methods are only wrapped while the
+profiler is enabled, so the disabled cost is a flag check per phase and
+per act() call.
+"""
+
+import atexit
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from .BotContext import BotContext
+
+# BotContext methods wrapped while profiling
+TIMED_METHODS = (
+    "senseEnemyinRadius",
+    "senseBotinRadius",
+    "senseAlgae",
+    "senseSacraps",
+    "senseWallsinRadius",
+    "senseByDistance",
+    "countInRadius",
+    "canMove",
+    "nextPoint",
+    "directionTo",
+    "shortestPath",
+    "checkBlocked",
+    "moveTarget",
+    "moveTargetSpeed",
+    "followPlan",
+    "getNearestBank",
+    "getNearestEnergyPad",
+    "getBankDirection",
+    "getEnergyPadDirection",
+    "getNearestScrap",
+    "getNearestAlgae",
+    "getNearestEnemy",
+    "getKNearestScraps",
+    "getKNearestAlgae",
+    "getKNearestEnemies",
+    "claimNearestScrap",
+    "claimNearestAlgae",
+    "recallAlgae",
+    "recallScraps",
+    "recallEnemies",
+    "recallNearest",
+)
+
+# samples kept per series for percentiles
+RESERVOIR_SIZE = 10_000
+
+_NULL = nullcontext()
+
+
+class _Series:
+    """Running count/total/max plus a bounded reservoir of samples."""
+
+    __slots__ = ("count", "total", "max", "samples", "_rng")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: list[float] = []
+        self._rng = random.Random(0)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(seconds)
+        else:
+            j = self._rng.randrange(self.count)
+            if j < RESERVOIR_SIZE:
+                self.samples[j] = seconds
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Profiler:
+    """
+    Collects timing series keyed "phase:<name>", "strategy:<class>" and
+    "ctx:<method>".
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._series: dict[str, _Series] = {}
+        self._originals: dict[str, object] = {}
+        # guards _series: act() and ctx timings arrive from executor threads
+        self._lock = threading.Lock()
+
+    # ==================== CONTROL ====================
+
+    def enable(self, dump_at_exit: bool = False):
+        """
+        Start collecting and wrap the BotContext methods.
+
+        Args:
+            dump_at_exit (bool): Print the summary to stderr when the
+                process exits.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        for name in TIMED_METHODS:
+            original = BotContext.__dict__[name]
+            self._originals[name] = original
+            setattr(BotContext, name, self._wrap("ctx:" + name, original))
+        if dump_at_exit:
+            atexit.register(self.dump)
+
+    def disable(self):
+        """Stop collecting and restore the original BotContext methods."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for name, original in self._originals.items():
+            setattr(BotContext, name, original)
+        self._originals.clear()
+
+    def reset(self):
+        """Drop all collected samples."""
+        with self._lock:
+            self._series.clear()
+
+    # ==================== RECORDING ====================
+
+    def record(self, key: str, seconds: float):
+        """Add one sample to a series."""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.add(seconds)
+
+    def phase(self, name: str):
+        """Context manager timing a wrapper phase (no-op when disabled)."""
+        if not self.enabled:
+            return _NULL
+        return self._timed("phase:" + name)
+
+    def act(self, strategy):
+        """Run strategy.act(), timing it under its class when enabled."""
+        if not self.enabled:
+            return strategy.act()
+        start = time.perf_counter()
+        try:
+            return strategy.act()
+        finally:
+            self.record("strategy:" + type(strategy).__name__, time.perf_counter() - start)
+
+    @contextmanager
+    def _timed(self, key: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(key, time.perf_counter() - start)
+
+    def _wrap(self, key: str, fn):
+        record = self.record
+        perf = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(key, perf() - start)
+
+        timed.__name__ = fn.__name__
+        timed.__doc__ = fn.__doc__
+        timed.__wrapped__ = fn
+        return timed
+
+    # ==================== REPORTING ====================
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Summarise every series.
+
+        Returns:
+            dict: key -> {"count", "total", "p50", "p99", "max"} (seconds).
+        """
+        with self._lock:
+            return {
+                key: {
+                    "count": s.count,
+                    "total": s.total,
+                    "p50": s.percentile(0.50),
+                    "p99": s.percentile(0.99),
+                    "max": s.max,
+                }
+                for key, s in self._series.items()
+            }
+
+    def summary(self) -> str:
+        """Render the stats as a table, slowest total first."""
+        rows = sorted(self.stats().items(), key=lambda kv: -kv[1]["total"])
+        lines = [f"{'series':<34}{'count':>9}{'total ms':>11}{'p50 us':>10}{'p99 us':>10}{'max us':>10}"]
+        for key, s in rows:
+            lines.append(
+                f"{key:<34}{s['count']:>9}{s['total'] * 1e3:>11.2f}"
+                f"{s['p50'] * 1e6:>10.1f}{s['p99'] * 1e6:>10.1f}{s['max'] * 1e6:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        """Write the summary to a stream (stderr by default)."""
+        print(self.summary(), file=stream or sys.stderr)
+
+
+PROFILER = Profiler()
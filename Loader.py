@@ -0,0 +1,355 @@
+"""
+VIEW LOADER
+
+Builds PlayerView objects straight from the engine's JSON tick payload.
+
+Handles:
+- Parsing str / bytes / already-decoded dicts (orjson when installed)
+- Constructing models positionally, without per-field reflection
+- Interning repeated Points and ability strings across ticks
+- Skipping sections that the strategies never read
+- Optional columnar loading of bots, enemies, scraps and algae
+- The inverse: dumping a PlayerView back to the engine's JSON shape
+"""
+
+import json
+import sys
+from enum import Enum
+
+from .models.Algae import Algae
+from .models.Bank import Bank
+from .models.Bot import Bot
+from .models.Columns import EntityColumns
+from .models.EnergyPad import EnergyPad
+from .models.PermanentEntities import PermanentEntities
+from .models.PlayerView import PlayerView
+from .models.Point import Point
+from .models.VisibleEntities import VisibleEntities
+from .models.VisibleScrap import VisibleScrap
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speed-up
+    _loads = json.loads
+
+# sections that can be skipped; a skipped section loads as an empty list
+SECTIONS = ("bots", "enemies", "scraps", "visible_walls", "banks", "energypads", "walls", "algae")
+
+# ViewLoader method building each section from raw entries
+_BUILDERS = {
+    "bots": "_bots",
+    "enemies": "_bots",
+    "scraps": "_scraps",
+    "visible_walls": "_walls",
+    "banks": "_banks",
+    "energypads": "_pads",
+    "walls": "_walls",
+    "algae": "_algae",
+}
+
+# interned points kept before the table is reset (bounds memory on huge maps)
+MAX_INTERNED_POINTS = 1 << 20
+
+
+def parse_json(data) -> dict:
+    """Decode engine JSON (str / bytes); dicts are returned unchanged."""
+    return data if isinstance(data, dict) else _loads(data)
+
+
+def _check(skip) -> frozenset:
+    skip = frozenset(skip)
+    unknown = skip.difference(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown view sections: {sorted(unknown)}")
+    return skip
+
+
+class ViewLoader:
+    """
+    Reusable loader. Interned Points and ability strings are kept across
+    ticks, so one instance should live for the whole match.
+    """
+
+    def __init__(self, skip=(), columnar: bool = False):
+        """
+        Args:
+            skip (Iterable[str]): Names from SECTIONS to leave empty.
+            columnar (bool): Load bots, enemies, scraps and algae as
+                EntityColumns, materialising objects only on access.
+        """
+        self.skip = _check(skip)
+        self.columnar = columnar
+        self._points: dict[tuple[int, int], Point] = {}
+        self._abilities: dict[str, str] = {}
+
+    # ==================== PUBLIC ====================
+
+    def load(self, data, skip=None, columnar: bool | None = None) -> PlayerView:
+        """
+        Build a PlayerView from one tick payload.
+
+        Args:
+            data (str | bytes | dict): Engine JSON, or the decoded dict.
+            skip (Iterable[str] | None): Overrides the loader's skip set.
+            columnar (bool | None): Overrides the loader's columnar flag.
+
+        Returns:
+            PlayerView: Loaded view.
+        """
+        raw = parse_json(data)
+        if len(self._points) > MAX_INTERNED_POINTS:
+            self._points.clear()
+
+        skip = self.skip if skip is None else _check(skip)
+        if columnar is None:
+            columnar = self.columnar
+        visible = raw.get("visible_entities") or {}
+        permanent = raw.get("permanent_entities") or {}
+
+        if columnar:
+            bots, scraps, algae = self._bot_columns, self._scrap_columns, self._algae_columns
+        else:
+            bots, scraps, algae = self._bots, self._scraps, self._algae
+
+        ve = VisibleEntities(
+            bots(visible.get("enemies"), "enemies" in skip),
+            scraps(visible.get("scraps"), "scraps" in skip),
+            self._walls(visible.get("walls"), "visible_walls" in skip),
+        )
+        pe = PermanentEntities(
+            self._banks(permanent.get("banks"), "banks" in skip),
+            self._pads(permanent.get("energypads"), "energypads" in skip),
+            self._walls(permanent.get("walls"), "walls" in skip),
+            algae(permanent.get("algae"), "algae" in skip),
+        )
+        return PlayerView(
+            raw["tick"],
+            raw.get("scraps", 0),
+            raw.get("algae", 0),
+            raw.get("bot_count", 0),
+            raw.get("max_bots", 0),
+            raw["width"],
+            raw["height"],
+            bots(raw.get("bots"), "bots" in skip),
+            ve,
+            pe,
+        )
+
+    def build(self, section: str, items) -> list:
+        """
+        Build model objects for raw entries of one section.
+
+        Args:
+            section (str): Name from SECTIONS.
+            items (list[dict]): Raw entries (Points for the wall sections).
+
+        Returns:
+            list: Model objects, in input order.
+        """
+        return getattr(self, _BUILDERS[section])(items, False)
+
+    # ==================== INTERNING ====================
+
+    def _point(self, p) -> Point:
+        key = (p["x"], p["y"])
+        point = self._points.get(key)
+        if point is None:
+            point = self._points[key] = Point(*key)
+        return point
+
+    def _ability_list(self, names) -> list:
+        table = self._abilities
+        out = []
+        for name in names or ():
+            s = table.get(name)
+            if s is None:
+                s = table[name] = sys.intern(name)
+            out.append(s)
+        return out
+
+    # ==================== SECTIONS ====================
+
+    def _bots(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        abilities = self._ability_list
+        get = dict.get
+        return [
+            Bot(
+                b["id"],
+                get(b, "owner_id"),
+                point(b["location"]),
+                get(b, "energy", 0),
+                get(b, "scraps", 0),
+                abilities(get(b, "abilities")),
+                get(b, "algae_held", 0),
+            )
+            for b in items
+        ]
+
+    def _scraps(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        return [VisibleScrap(point(s["location"]), s.get("amount", 0)) for s in items]
+
+    def _algae(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        return [Algae(point(a["location"]), a.get("is_poison")) for a in items]
+
+    def _banks(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        get = dict.get
+        return [
+            Bank(
+                b["id"],
+                point(b["location"]),
+                get(b, "deposit_occuring", 0),
+                get(b, "deposit_amount", 0),
+                get(b, "deposit_owner", 0),
+                get(b, "depositticksleft", 0),
+            )
+            for b in items
+        ]
+
+    def _pads(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        get = dict.get
+        return [
+            EnergyPad(p["id"], point(p["location"]), get(p, "available", 0), get(p, "ticksleft", 0))
+            for p in items
+        ]
+
+    def _walls(self, items, skip: bool) -> list:
+        if skip or not items:
+            return []
+        point = self._point
+        return [point(w) for w in items]
+
+    # ==================== COLUMNAR SECTIONS ====================
+
+    def _bot_columns(self, items, skip: bool) -> EntityColumns:
+        cols = EntityColumns("bots")
+        if skip or not items:
+            return cols
+        get = dict.get
+        n = cols.numeric
+        cols.x.extend(b["location"]["x"] for b in items)
+        cols.y.extend(b["location"]["y"] for b in items)
+        n["id"].extend(b["id"] for b in items)
+        n["owner_id"].extend(get(b, "owner_id") or 0 for b in items)
+        n["energy"].extend(get(b, "energy", 0) for b in items)
+        n["scraps"].extend(get(b, "scraps", 0) for b in items)
+        n["algae_held"].extend(get(b, "algae_held", 0) for b in items)
+        abilities = self._ability_list
+        cols.objects["abilities"].extend(abilities(get(b, "abilities")) for b in items)
+        return cols
+
+    def _scrap_columns(self, items, skip: bool) -> EntityColumns:
+        cols = EntityColumns("scraps")
+        if skip or not items:
+            return cols
+        cols.x.extend(s["location"]["x"] for s in items)
+        cols.y.extend(s["location"]["y"] for s in items)
+        cols.numeric["amount"].extend(s.get("amount", 0) for s in items)
+        return cols
+
+    def _algae_columns(self, items, skip: bool) -> EntityColumns:
+        cols = EntityColumns("algae")
+        if skip or not items:
+            return cols
+        cols.x.extend(a["location"]["x"] for a in items)
+        cols.y.extend(a["location"]["y"] for a in items)
+        cols.objects["is_poison"].extend(a.get("is_poison") for a in items)
+        return cols
+
+
+DEFAULT_LOADER = ViewLoader()
+
+
+def load_view(data, skip=(), columnar: bool = False) -> PlayerView:
+    """
+    Build a PlayerView from the engine's JSON.
+
+    Args:
+        data (str | bytes | dict): Engine JSON, or the decoded dict.
+        skip (Iterable[str]): Names from SECTIONS to leave empty.
+        columnar (bool): Load the large entity lists as EntityColumns.
+
+    Returns:
+        PlayerView: Loaded view.
+    """
+    return DEFAULT_LOADER.load(data, skip, columnar)
+
+
+# ==================== DUMPING ====================
+
+def dump_point(p: Point) -> dict:
+    return {"x": p.x, "y": p.y}
+
+
+def dump_entity(entity) -> dict:
+    """
+    Convert one model object to its engine JSON dict.
+
+    Args:
+        entity: Bot, Algae, VisibleScrap, Bank or EnergyPad.
+
+    Returns:
+        dict: Field name -> JSON value (Points as {"x", "y"}).
+    """
+    out = {}
+    for name in type(entity).__slots__:
+        value = getattr(entity, name)
+        if isinstance(value, Point):
+            value = dump_point(value)
+        elif isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, list):
+            value = [v.value if isinstance(v, Enum) else v for v in value]
+        out[name] = value
+    return out
+
+
+def dump_view(view: PlayerView) -> dict:
+    """
+    Convert a PlayerView back to the engine's JSON shape (load_view's inverse).
+
+    Args:
+        view (PlayerView): View to dump.
+
+    Returns:
+        dict: JSON-serialisable payload.
+    """
+    ve = view.visible_entities
+    pe = view.permanent_entities
+    return {
+        "tick": view.tick,
+        "scraps": view.scraps,
+        "algae": view.algae,
+        "bot_count": view.bot_count,
+        "max_bots": view.max_bots,
+        "width": view.width,
+        "height": view.height,
+        "bots": [dump_entity(b) for b in view.bots],
+        "visible_entities": {
+            "enemies": [dump_entity(e) for e in ve.enemies],
+            "scraps": [dump_entity(s) for s in ve.scraps],
+            "walls": [dump_point(w) for w in ve.walls],
+        },
+        "permanent_entities": {
+            "banks": [dump_entity(b) for b in pe.banks],
+            "energypads": [dump_entity(p) for p in pe.energypads],
+            "walls": [dump_point(w) for w in pe.walls],
+            "algae": [dump_entity(a) for a in pe.algae],
+        },
+    }
@@ -0,0 +1,70 @@
+"""
+OCCUPANCY
+
+Per-tick cell flags for the whole map, so blocking checks are a single
+bit test instead of a scan over walls, enemies and friendly bots.
+
+Uses the same padded cell layout as PathFinder. Unit positions are read
+with models.Columns.coordinates, so columnar bot lists are flagged without
+materialising any Bot.
+"""
+
+from .models.Columns import coordinates
+
+# cell flags
+OUT = 1       # outside the map (padding border)
+WALL = 2
+ENEMY = 4
+FRIEND = 8
+
+UNITS = ENEMY | FRIEND
+BLOCKED = OUT | WALL | ENEMY | FRIEND
+
+
+class Occupancy:
+    """
+    Bit flags per padded cell for walls, enemies and friendly bots.
+
+    Built once per tick from the match's PathFinder grid, which already
+    carries the OUT and WALL bits.
+    """
+
+    def __init__(self, finder, enemies, friends):
+        """
+        Args:
+            finder (PathFinder): Grid and static walls for the match.
+            enemies (Sequence[Bot]): Visible enemy bots.
+            friends (Sequence[Bot]): Friendly bots.
+        """
+        self.finder = finder
+        index = finder.index
+
+        cells = bytearray(finder.blocked)
+        for x, y in coordinates(enemies):
+            cells[index(x, y)] |= ENEMY
+        stacked = set()
+        for x, y in coordinates(friends):
+            i = index(x, y)
+            if cells[i] & FRIEND:
+                stacked.add(i)
+            cells[i] |= FRIEND
+
+        self.cells = cells
+        self.stacked = stacked
+        self.offsets = {d: off for off, d in finder.steps}
+
+    def flags(self, x: int, y: int) -> int:
+        """Raw flags of a cell."""
+        return self.cells[self.finder.index(x, y)]
+
+    def blocked(self, x: int, y: int, mask: int = BLOCKED) -> bool:
+        """True if the cell has any of the flags in mask."""
+        return bool(self.cells[self.finder.index(x, y)] & mask)
+
+    def shared(self, x: int, y: int) -> bool:
+        """True if more than one friendly bot stands on the cell."""
+        return self.finder.index(x, y) in self.stacked
+
+    def step_flags(self, x: int, y: int, direction) -> int:
+        """Flags of the cell one step from (x, y) in a direction."""
+        return self.cells[self.finder.index(x, y) + self.offsets[direction]]
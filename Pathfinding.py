@@ -0,0 +1,415 @@
+"""
+PATHFINDING
+
+Wall-aware shortest paths on the game grid.
+
+Handles:
+- Padded cell indexing (out-of-bounds cells are permanently blocked)
+- BFS and A* (Manhattan heuristic) over unit-cost moves
+- Per-query expansion budgets so large maps stay bounded
+- Multi-source distance fields to static targets, cached per match
+- Cross-tick path plans that are only recomputed when invalidated
+"""
+
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
+from .Constants import Direction
+from .models.Point import Point
+from .Occupancy import OUT, WALL, UNITS, BLOCKED
+
+# Upper bound on nodes expanded by a single query.
+MAX_EXPANSIONS = 4096
+
+
+class PathFinder:
+    """
+    Shortest-path engine over a width x height grid with static walls.
+
+    Cells are addressed by a padded index: the grid is surrounded by a
+    one-cell border of blocked cells, so neighbour lookups never need a
+    bounds check. `blocked` holds the OUT / WALL occupancy flags.
+    """
+
+    def __init__(self, width: int, height: int, walls):
+        """
+        Args:
+            width (int): Map width.
+            height (int): Map height.
+            walls (list[Point]): Impassable cells.
+        """
+        self.width = width
+        self.height = height
+        self.stride = stride = width + 2
+
+        blocked = bytearray((OUT,)) * (stride * (height + 2))
+        row = bytes(width)
+        for y in range(height):
+            start = (y + 1) * stride + 1
+            blocked[start:start + width] = row
+        for w in walls:
+            if 0 <= w.x < width and 0 <= w.y < height:
+                blocked[(w.y + 1) * stride + w.x + 1] = WALL
+        self.blocked = blocked
+
+        # neighbour offsets in fallback order: N, E, S, W
+        self.steps = (
+            (stride, Direction.NORTH),
+            (1, Direction.EAST),
+            (-stride, Direction.SOUTH),
+            (-1, Direction.WEST),
+        )
+        self.directions = {off: d for off, d in self.steps}
+
+    # ==================== INDEXING ====================
+
+    def index(self, x: int, y: int) -> int:
+        """Padded index of (x, y); out-of-bounds points map to border cells."""
+        x = min(max(x, -1), self.width)
+        y = min(max(y, -1), self.height)
+        return (y + 1) * self.stride + x + 1
+
+    def point(self, i: int) -> Point:
+        """Point for a padded index."""
+        y, x = divmod(i, self.stride)
+        return Point(x - 1, y - 1)
+
+    def is_open(self, p: Point) -> bool:
+        """True if p is inside the map and not a wall."""
+        return not self.blocked[self.index(p.x, p.y)]
+
+    def direction(self, a: int, b: int) -> Direction:
+        """Direction of the single step from cell a to adjacent cell b."""
+        return self.directions[b - a]
+
+    # ==================== SEARCH ====================
+
+    def bfs(self, start: Point, goal: Point, occupied: bytearray | None = None,
+            mask: int = UNITS,
+            max_nodes: int = MAX_EXPANSIONS) -> list[int] | None:
+        """
+        Breadth-first search for a shortest path.
+
+        Args:
+            start (Point): Start location.
+            goal (Point): Target location.
+            occupied (bytearray | None): Occupancy flags; cells with any
+                flag in mask are avoided (the goal is always enterable).
+            mask (int): Occupancy flags that block a cell.
+            max_nodes (int): Expansion budget.
+
+        Returns:
+            list[int] | None: Cell indices after start up to and including
+            goal, or None if no path was found within budget.
+        """
+        s = self.index(start.x, start.y)
+        g = self.index(goal.x, goal.y)
+        if s == g:
+            return []
+        if self.blocked[g]:
+            return None
+
+        blocked = self.blocked
+        if occupied is None:
+            occupied, mask = blocked, 0
+        offsets = [off for off, _ in self.steps]
+        came = {s: s}
+        frontier = deque((s,))
+        expanded = 0
+
+        while frontier and expanded < max_nodes:
+            cur = frontier.popleft()
+            expanded += 1
+            for off in offsets:
+                nxt = cur + off
+                if nxt in came or blocked[nxt]:
+                    continue
+                if nxt != g and occupied[nxt] & mask:
+                    continue
+                came[nxt] = cur
+                if nxt == g:
+                    return self._unwind(came, s, g)
+                frontier.append(nxt)
+
+        return None
+
+    def astar(self, start: Point, goal: Point, occupied: bytearray | None = None,
+              mask: int = UNITS,
+              max_nodes: int = MAX_EXPANSIONS,
+              partial: bool = False) -> list[int] | None:
+        """
+        A* search with a Manhattan heuristic.
+
+        Args:
+            start (Point): Start location.
+            goal (Point): Target location.
+            occupied (bytearray | None): Occupancy flags; cells with any
+                flag in mask are avoided (the goal is always enterable).
+            mask (int): Occupancy flags that block a cell.
+            max_nodes (int): Expansion budget.
+            partial (bool): When the goal is not reached, return the path
+                to the explored cell closest to it instead of None.
+
+        Returns:
+            list[int] | None: Cell indices after start up to and including
+            the goal (or the closest cell when partial), or None.
+        """
+        s = self.index(start.x, start.y)
+        g = self.index(goal.x, goal.y)
+        if s == g:
+            return []
+        if self.blocked[g] and not partial:
+            return None
+
+        stride = self.stride
+        blocked = self.blocked
+        if occupied is None:
+            occupied, mask = blocked, 0
+        offsets = [off for off, _ in self.steps]
+        gy, gx = divmod(g, stride)
+
+        def h(i):
+            y, x = divmod(i, stride)
+            return abs(x - gx) + abs(y - gy)
+
+        best, best_h = s, h(s)
+        cost = {s: 0}
+        came = {s: s}
+        heap = [(best_h, best_h, 0, s)]
+        closed = set()
+        expanded = 0
+
+        while heap and expanded < max_nodes:
+            _, hc, gc, cur = heappop(heap)
+            if cur in closed:
+                continue
+            if cur == g:
+                return self._unwind(came, s, g)
+            closed.add(cur)
+            expanded += 1
+
+            if hc < best_h:
+                best, best_h = cur, hc
+
+            ng = gc + 1
+            for off in offsets:
+                nxt = cur + off
+                if blocked[nxt] or nxt in closed:
+                    continue
+                if nxt != g and occupied[nxt] & mask:
+                    continue
+                if ng < cost.get(nxt, ng + 1):
+                    cost[nxt] = ng
+                    came[nxt] = cur
+                    hn = h(nxt)
+                    heappush(heap, (ng + hn, hn, ng, nxt))
+
+        if partial:
+            return self._unwind(came, s, best)
+        return None
+
+    @staticmethod
+    def _unwind(came: dict[int, int], s: int, g: int) -> list[int]:
+        path = []
+        cur = g
+        while cur != s:
+            path.append(cur)
+            cur = came[cur]
+        path.reverse()
+        return path
+
+
+class PathPlan:
+    """
+    A bot's route to a target, kept on its strategy across ticks.
+
+    BotContext.followPlan reuses it while the bot is still on the route,
+    the target is unchanged, the map layout is the same and no cell on
+    the remaining route is blocked; otherwise it searches again.
+    """
+
+    __slots__ = ("target", "cells", "step", "at", "finder")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Forget the route."""
+        self.target: tuple[int, int] | None = None
+        self.cells: list[int] = []
+        self.step = 0
+        self.at = -1
+        self.finder: PathFinder | None = None
+
+    def __reduce__(self):
+        # a cache: worker processes start with an empty plan
+        return PathPlan, ()
+
+    def set(self, finder: "PathFinder", target: Point, here: int, cells: list[int]):
+        """Store a freshly searched route starting after cell `here`."""
+        self.target = (target.x, target.y)
+        self.cells = cells
+        self.step = 0
+        self.at = here
+        self.finder = finder
+
+    def advance(self, finder: "PathFinder", target: Point, here: int, occupied: bytearray) -> bool:
+        """
+        Catch the plan up with the bot and check it is still usable.
+
+        Args:
+            finder (PathFinder): This tick's path finder.
+            target (Point): Current target.
+            here (int): Padded index of the bot's cell.
+            occupied (bytearray): This tick's occupancy flags.
+
+        Returns:
+            bool: True if the next step can be taken from cells[step].
+        """
+        cells = self.cells
+        if not cells or self.finder is not finder or self.target != (target.x, target.y):
+            return False
+
+        i = self.step
+        if here != self.at:
+            # moved one or two (SPEED) cells along the route since last tick
+            if i < len(cells) and cells[i] == here:
+                i += 1
+            elif i + 1 < len(cells) and cells[i + 1] == here:
+                i += 2
+            else:
+                return False
+        if i >= len(cells):
+            return False  # end of a partial route
+
+        goal = finder.index(target.x, target.y)
+        for c in cells[i:]:
+            if occupied[c] & BLOCKED and c != goal:
+                return False
+
+        self.step = i
+        self.at = here
+        return True
+
+
+class DistanceField:
+    """
+    Multi-source BFS distances from every cell to its nearest source.
+
+    Stores, per padded cell, the path distance, which source is nearest
+    and the first step toward it, so both lookups are a table read.
+    """
+
+    def __init__(self, finder: PathFinder, sources: list[Point]):
+        """
+        Args:
+            finder (PathFinder): Grid and walls to flood over.
+            sources (list[Point]): Target locations.
+        """
+        self.finder = finder
+        self.sources = sources
+
+        blocked = finder.blocked
+        size = len(blocked)
+        dist = array("i", [-1]) * size
+        owner = array("i", [-1]) * size
+        toward = bytearray(size)
+
+        frontier = deque()
+        for k, p in enumerate(sources):
+            i = finder.index(p.x, p.y)
+            if blocked[i] or dist[i] >= 0:
+                continue
+            dist[i] = 0
+            owner[i] = k
+            frontier.append(i)
+
+        # stepping by steps[k] is undone by the opposite step (k + 2) % 4;
+        # codes are 1-based so 0 can mean "no step"
+        expand = [
+            (off, (k + 2) % 4 + 1) for k, (off, _) in enumerate(finder.steps)
+        ]
+        while frontier:
+            cur = frontier.popleft()
+            d = dist[cur] + 1
+            o = owner[cur]
+            for off, back in expand:
+                nxt = cur + off
+                if blocked[nxt] or dist[nxt] >= 0:
+                    continue
+                dist[nxt] = d
+                owner[nxt] = o
+                toward[nxt] = back
+                frontier.append(nxt)
+
+        self.dist = dist
+        self.owner = owner
+        self.toward = toward
+
+    def distance(self, p: Point) -> int | None:
+        """Path distance from p to the nearest source, or None if unreachable."""
+        d = self.dist[self.finder.index(p.x, p.y)]
+        return d if d >= 0 else None
+
+    def nearest(self, p: Point) -> Point | None:
+        """Nearest source to p by path distance, or None if unreachable."""
+        k = self.owner[self.finder.index(p.x, p.y)]
+        return self.sources[k] if k >= 0 else None
+
+    def direction(self, p: Point) -> Direction | None:
+        """First step from p toward the nearest source, or None if at one or unreachable."""
+        code = self.toward[self.finder.index(p.x, p.y)]
+        return self.finder.steps[code - 1][1] if code else None
+
+
+class StaticMap:
+    """
+    Per-match cache of everything derived from the static layout.
+
+    The path finder and distance fields are rebuilt only when the map
+    size, the walls or a field's sources change.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._fields: dict[str, tuple[tuple, DistanceField]] = {}
+        self.pathfinder: PathFinder | None = None
+
+    def update(self, width: int, height: int, walls) -> PathFinder:
+        """
+        Sync with the current layout.
+
+        Args:
+            width (int): Map width.
+            height (int): Map height.
+            walls (list[Point]): Impassable cells.
+
+        Returns:
+            PathFinder: Path finder for the current layout.
+        """
+        key = (width, height, frozenset((w.x, w.y) for w in walls))
+        if key != self._key:
+            self._key = key
+            self.pathfinder = PathFinder(width, height, walls)
+            self._fields.clear()
+        return self.pathfinder
+
+    def field(self, name: str, sources: list[Point]) -> DistanceField:
+        """
+        Get the distance field for a named class of static targets.
+
+        Args:
+            name (str): Field name, e.g. "banks".
+            sources (list[Point]): Current target locations.
+
+        Returns:
+            DistanceField: Cached field, rebuilt if the sources moved.
+        """
+        key = tuple((p.x, p.y) for p in sources)
+        cached = self._fields.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        field = DistanceField(self.pathfinder, list(sources))
+        self._fields[name] = (key, field)
+        return field
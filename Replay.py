@@ -0,0 +1,482 @@
+"""
+REPLAY LOG
+
+Compact binary recording of each tick's view and response.
+
+Handles:
+- Appending one frame per tick: the PlayerView packed as fixed-width
+  little-endian records, the play() response, and the strategy class of
+  every bot spawned that tick
+- Permanent walls stored once and referenced by later frames while the
+  map is unchanged
+- Reading a log through mmap: frame index built on open, any tick
+  decoded on demand, strategy registry snapshots kept every
+  SNAPSHOT_EVERY frames so a seek only scans the frames after the
+  nearest one
+- Replaying play() against a recorded tick with the strategy registry
+  and ID allocator the wrapper had at the time
+
+File layout (all little-endian):
+
+    header    "BRPL" u16 version
+    frame     u32 frame length, i64 tick, i64 next bot id, u32 response length,
+              6 x i64 scalars (scraps, algae, bot_count, max_bots, width, height),
+              8 sections (Loader.SECTIONS order): u32 count + records,
+                  or u32 0xFFFFFFFF + u64 file offset of an earlier copy,
+              u32 spawned count + (i64 bot id, u16 length, class path),
+              response JSON
+
+Abilities are stored as a bit mask over Constants.Ability, so ability
+names the enum does not know are not recorded. Bot energy is stored as a
+double. A frame cut short by a crash is ignored by the reader.
+"""
+
+import importlib
+import json
+import mmap
+import struct
+from itertools import chain
+
+from .Constants import Ability
+from .Loader import SECTIONS
+from .models.Algae import Algae
+from .models.Bank import Bank
+from .models.Bot import Bot
+from .models.Columns import EntityColumns
+from .models.EnergyPad import EnergyPad
+from .models.PermanentEntities import PermanentEntities
+from .models.PlayerView import PlayerView
+from .models.Point import Point
+from .models.VisibleEntities import VisibleEntities
+from .models.VisibleScrap import VisibleScrap
+
+MAGIC = b"BRPL"
+VERSION = 1
+
+_FILE_HEADER = struct.Struct("<4sH")
+_FRAME_HEADER = struct.Struct("<IqqI6q")
+_COUNT = struct.Struct("<I")
+_REF = struct.Struct("<Q")
+_SPAWNED = struct.Struct("<qH")
+_REPEAT = 0xFFFFFFFF
+
+# frames between the strategy registry snapshots of a reader
+SNAPSHOT_EVERY = 64
+
+# section -> record layout
+_RECORDS = {
+    "bots": struct.Struct("<qqhhdqqH"),       # id, owner, x, y, energy, scraps, algae_held, abilities
+    "enemies": struct.Struct("<qqhhdqqH"),
+    "scraps": struct.Struct("<hhq"),          # x, y, amount
+    "visible_walls": struct.Struct("<hh"),
+    "banks": struct.Struct("<qhhqqqq"),       # id, x, y, occuring, amount, owner, ticksleft
+    "energypads": struct.Struct("<qhhqq"),    # id, x, y, available, ticksleft
+    "walls": struct.Struct("<hh"),
+    "algae": struct.Struct("<hhB"),           # x, y, poison code
+}
+
+# sections repeated by reference when unchanged since the last frame
+_STATIC = ("walls",)
+
+_ABILITY_BITS = {a.value: 1 << i for i, a in enumerate(Ability)}
+_POISON_CODES = {None: 0, "UNKNOWN": 1, "TRUE": 2, "FALSE": 3, True: 4, False: 5}
+_POISON_VALUES = {code: value for value, code in _POISON_CODES.items()}
+
+
+def _mask(abilities) -> int:
+    bits = _ABILITY_BITS
+    m = 0
+    for a in abilities or ():
+        m |= bits.get(a, 0)
+    return m
+
+
+def _sections(view) -> tuple:
+    ve, pe = view.visible_entities, view.permanent_entities
+    return (view.bots, ve.enemies, ve.scraps, ve.walls, pe.banks, pe.energypads, pe.walls, pe.algae)
+
+
+def _rows(section: str, items):
+    if section in ("bots", "enemies"):
+        if isinstance(items, EntityColumns):
+            n = items.numeric
+            return zip(n["id"], n["owner_id"], items.x, items.y, n["energy"], n["scraps"],
+                       n["algae_held"], map(_mask, items.objects["abilities"]))
+        return (
+            (b.id, -1 if b.owner_id is None else b.owner_id, b.location.x, b.location.y,
+             b.energy or 0, b.scraps or 0, b.algae_held or 0, _mask(b.abilities))
+            for b in items
+        )
+    if section == "scraps":
+        if isinstance(items, EntityColumns):
+            return zip(items.x, items.y, items.numeric["amount"])
+        return ((s.location.x, s.location.y, s.amount or 0) for s in items)
+    if section == "algae":
+        codes = _POISON_CODES
+        if isinstance(items, EntityColumns):
+            return zip(items.x, items.y, (codes.get(p, 1) for p in items.objects["is_poison"]))
+        return ((a.location.x, a.location.y, codes.get(a.is_poison, 1)) for a in items)
+    if section == "banks":
+        return (
+            (b.id, b.location.x, b.location.y, b.deposit_occuring or 0, b.deposit_amount or 0,
+             b.deposit_owner or 0, b.depositticksleft or 0)
+            for b in items
+        )
+    if section == "energypads":
+        return ((p.id, p.location.x, p.location.y, p.available or 0, p.ticksleft or 0) for p in items)
+    return ((p.x, p.y) for p in items)  # walls
+
+
+def _pack(section: str, items) -> bytes:
+    n = len(items)
+    if not n:
+        return b""
+    # one pack call per section: the record format repeated n times
+    fmt = "<" + _RECORDS[section].format[1:] * n
+    return struct.pack(fmt, *chain.from_iterable(_rows(section, items)))
+
+
+def _strategy_path(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _strategy_class(path: str):
+    module, _, name = path.partition(":")
+    obj = importlib.import_module(module)
+    for part in name.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+# ==================== RECORDING ====================
+
+class ReplayRecorder:
+    """
+    Appends frames to a replay log. Pass one to Wrapper.play(recorder=...).
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str | Path): Log file. An existing log is appended to.
+        """
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_FILE_HEADER.pack(MAGIC, VERSION))
+            self._file.flush()
+        # entities and file offset of each static section last written
+        self._static: dict[str, tuple[list, int]] = {}
+
+    def record(self, view, response: bytes, next_id: int, spawned=()) -> None:
+        """
+        Append one tick.
+
+        Args:
+            view (PlayerView): The tick's view.
+            response (bytes): The play() response as JSON.
+            next_id (int): Bot ID allocator position before the tick.
+            spawned (Iterable[tuple[int, type]]): (bot id, strategy class)
+                for the bots spawned this tick.
+        """
+        f = self._file
+        start = f.tell()
+        parts = [b""]  # frame header, filled in below
+        size = _FRAME_HEADER.size
+
+        for section, items in zip(SECTIONS, _sections(view)):
+            if section in _STATIC:
+                # the loaders intern Points, so this is mostly identity checks
+                items = list(items)
+                last = self._static.get(section)
+                if last is not None and last[0] == items:
+                    chunk = _COUNT.pack(_REPEAT) + _REF.pack(last[1])
+                    parts.append(chunk)
+                    size += len(chunk)
+                    continue
+                self._static[section] = (items, start + size)
+            chunk = _COUNT.pack(len(items)) + _pack(section, items)
+            parts.append(chunk)
+            size += len(chunk)
+
+        spawned = list(spawned)
+        chunk = [_COUNT.pack(len(spawned))]
+        for bot_id, cls in spawned:
+            name = _strategy_path(cls).encode()
+            chunk.append(_SPAWNED.pack(bot_id, len(name)) + name)
+        chunk = b"".join(chunk)
+        parts.append(chunk)
+        parts.append(response)
+        size += len(chunk) + len(response)
+
+        parts[0] = _FRAME_HEADER.pack(
+            size, view.tick, next_id, len(response),
+            view.scraps or 0, view.algae or 0, view.bot_count or 0, view.max_bots or 0,
+            view.width, view.height,
+        )
+        f.write(b"".join(parts))
+        f.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ==================== READING ====================
+
+class ReplayReader:
+    """
+    Random access to a replay log through a read-only memory map.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str | Path): Log file written by ReplayRecorder.
+
+        Raises:
+            ValueError: If the file is not a replay log.
+        """
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = self._map
+        if len(buf) < _FILE_HEADER.size or _FILE_HEADER.unpack_from(buf)[0] != MAGIC:
+            raise ValueError(f"{path} is not a replay log")
+        version = _FILE_HEADER.unpack_from(buf)[1]
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay log version {version}")
+
+        # frame offsets and ticks, in file order
+        self.offsets: list[int] = []
+        self.ticks: list[int] = []
+        pos = _FILE_HEADER.size
+        end = len(buf)
+        while pos + _FRAME_HEADER.size <= end:
+            size, tick = _FRAME_HEADER.unpack_from(buf, pos)[:2]
+            if pos + size > end:
+                break  # truncated by a crash mid-write
+            self.offsets.append(pos)
+            self.ticks.append(tick)
+            pos += size
+        self._frame_of = {tick: i for i, tick in enumerate(self.ticks)}
+        self._points: dict[tuple[int, int], Point] = {}
+        self._abilities: dict[int, tuple[str, ...]] = {}
+        # _snapshots[k]: bot id -> class path before frame k * SNAPSHOT_EVERY,
+        # extended on demand
+        self._snapshots: list[dict[int, str]] = [{}]
+        self._classes: dict[str, type] = {}
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _frame(self, tick: int) -> int:
+        i = self._frame_of.get(tick)
+        if i is None:
+            raise KeyError(f"Tick {tick} is not in the replay log")
+        return i
+
+    # ==================== FRAMES ====================
+
+    def _layout(self, i: int):
+        """Header fields, section spans, spawned span and response span of frame i."""
+        buf = self._map
+        pos = self.offsets[i]
+        header = _FRAME_HEADER.unpack_from(buf, pos)
+        size, response_len = header[0], header[3]
+        p = pos + _FRAME_HEADER.size
+        spans = []
+        for section in SECTIONS:
+            (count,) = _COUNT.unpack_from(buf, p)
+            p += _COUNT.size
+            if count == _REPEAT:
+                (ref,) = _REF.unpack_from(buf, p)
+                p += _REF.size
+                (count,) = _COUNT.unpack_from(buf, ref)
+                spans.append((ref + _COUNT.size, count))
+                continue
+            spans.append((p, count))
+            p += count * _RECORDS[section].size
+        response_start = pos + size - response_len
+        return header, spans, (p, response_start), (response_start, pos + size)
+
+    def response(self, tick: int) -> dict:
+        """Get the recorded play() response of a tick."""
+        _, _, _, (a, b) = self._layout(self._frame(tick))
+        return json.loads(self._map[a:b])
+
+    def next_id(self, tick: int) -> int:
+        """Get the bot ID allocator position before a tick."""
+        return _FRAME_HEADER.unpack_from(self._map, self.offsets[self._frame(tick)])[2]
+
+    def spawned(self, tick: int) -> list[tuple[int, str]]:
+        """Get (bot id, "module:Class") for the bots spawned on a tick."""
+        _, _, (p, _), _ = self._layout(self._frame(tick))
+        return self._read_spawned(p)
+
+    def _read_spawned(self, p: int) -> list[tuple[int, str]]:
+        buf = self._map
+        (count,) = _COUNT.unpack_from(buf, p)
+        p += _COUNT.size
+        out = []
+        for _ in range(count):
+            bot_id, n = _SPAWNED.unpack_from(buf, p)
+            p += _SPAWNED.size
+            out.append((bot_id, bytes(buf[p : p + n]).decode()))
+            p += n
+        return out
+
+    # ==================== VIEWS ====================
+
+    def view(self, tick: int) -> PlayerView:
+        """
+        Decode the recorded view of a tick.
+
+        Args:
+            tick (int): Tick number.
+
+        Returns:
+            PlayerView: Fresh model objects.
+
+        Raises:
+            KeyError: If the tick was not recorded.
+        """
+        header, spans, _, _ = self._layout(self._frame(tick))
+        _, tick, _, _, scraps, algae, bot_count, max_bots, width, height = header
+        s = {
+            section: self._decode(section, start, count)
+            for section, (start, count) in zip(SECTIONS, spans)
+        }
+        return PlayerView(
+            tick, scraps, algae, bot_count, max_bots, width, height,
+            s["bots"],
+            VisibleEntities(s["enemies"], s["scraps"], s["visible_walls"]),
+            PermanentEntities(s["banks"], s["energypads"], s["walls"], s["algae"]),
+        )
+
+    def _point(self, x: int, y: int) -> Point:
+        p = self._points.get((x, y))
+        if p is None:
+            p = self._points[(x, y)] = Point(x, y)
+        return p
+
+    def _ability_list(self, mask: int) -> list[str]:
+        names = self._abilities.get(mask)
+        if names is None:
+            names = self._abilities[mask] = tuple(
+                name for name, bit in _ABILITY_BITS.items() if mask & bit
+            )
+        return list(names)
+
+    def _decode(self, section: str, start: int, count: int) -> list:
+        record = _RECORDS[section]
+        rows = record.iter_unpack(self._map[start : start + count * record.size])
+        point = self._point
+        if section in ("bots", "enemies"):
+            abilities = self._ability_list
+            return [
+                Bot(i, None if owner == -1 else owner, point(x, y), energy, scraps,
+                    abilities(mask), held)
+                for i, owner, x, y, energy, scraps, held, mask in rows
+            ]
+        if section == "scraps":
+            return [VisibleScrap(point(x, y), amount) for x, y, amount in rows]
+        if section == "algae":
+            values = _POISON_VALUES
+            return [Algae(point(x, y), values[code]) for x, y, code in rows]
+        if section == "banks":
+            return [Bank(i, point(x, y), a, b, c, d) for i, x, y, a, b, c, d in rows]
+        if section == "energypads":
+            return [EnergyPad(i, point(x, y), a, t) for i, x, y, a, t in rows]
+        return [point(x, y) for x, y in rows]
+
+    # ==================== REPLAY ====================
+
+    def strategies(self, tick: int) -> dict[int, type]:
+        """
+        Get the strategy class of every bot spawned before a tick.
+
+        Args:
+            tick (int): Tick number.
+
+        Returns:
+            dict[int, type]: Bot id -> strategy class.
+        """
+        paths = self._strategy_paths(self._frame(tick))
+        classes = self._classes
+        out = {}
+        for bot_id, path in paths.items():
+            cls = classes.get(path)
+            if cls is None:
+                cls = classes[path] = _strategy_class(path)
+            out[bot_id] = cls
+        return out
+
+    def _strategy_paths(self, i: int) -> dict[int, str]:
+        """Bot id -> class path for the bots spawned before frame i."""
+        snapshots = self._snapshots
+        k = i // SNAPSHOT_EVERY
+        while len(snapshots) <= k:
+            start = (len(snapshots) - 1) * SNAPSHOT_EVERY
+            snapshots.append(self._spawned_between(snapshots[-1], start, start + SNAPSHOT_EVERY))
+        return self._spawned_between(snapshots[k], k * SNAPSHOT_EVERY, i)
+
+    def _spawned_between(self, paths: dict[int, str], start: int, stop: int) -> dict[int, str]:
+        """A copy of paths updated with the spawns of frames start..stop-1."""
+        out = dict(paths)
+        for i in range(start, stop):
+            _, _, (p, _), _ = self._layout(i)
+            out.update(self._read_spawned(p))
+        return out
+
+    def replay(self, tick: int, player=None, **options) -> tuple[dict, dict]:
+        """
+        Run play() again on a recorded tick.
+
+        By default a WrapperPlayer is set up with the ID allocator
+        position and a fresh strategy instance for every bot alive at the
+        tick. State a strategy kept across ticks is not in the log, so
+        for an exact reproduction replay every tick from the first one
+        with a single player.
+
+        Args:
+            tick (int): Tick number.
+            player (Callable[[PlayerView], dict] | None): Player to run
+                (see Simulator.WrapperPlayer).
+            **options: Keyword options of Wrapper.play for the default player.
+
+        Returns:
+            tuple[dict, dict]: (recorded response, replayed response).
+        """
+        from .Simulator import WrapperPlayer
+
+        view = self.view(tick)
+        if player is None:
+            player = WrapperPlayer(first_id=self.next_id(tick), **options)
+            known = self.strategies(tick)
+            for bot in view.bots:
+                cls = known.get(bot.id)
+                if cls is None:
+                    continue
+                try:
+                    player.strategies[bot.id] = cls(None)
+                except TypeError as e:
+                    raise TypeError(
+                        f"Cannot rebuild {cls.__name__} for bot {bot.id} from the log "
+                        f"({e}); pass a prepared player instead"
+                    ) from e
+        return self.response(tick), player(view)
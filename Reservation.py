@@ -0,0 +1,205 @@
+"""
+MOVE RESERVATION
+
+Fleet-wide resolution of friendly moves so bots never collide.
+
+Handles:
+- One reservation table per tick: every destination cell goes to at
+  most one bot, in priority order (strategy PRIORITY, then bot order)
+- Bots blocked by a friendly that stays put, and head-on swaps
+- Moves into walls or visible enemies: the bot counts as staying, and a
+  SPEED move stops before a blocked second cell
+- SPEED moves shortened to one step when only the second cell clashes
+- Spawn cells on this tick reserved for the new bots
+- Optional space-time reservations: bots following a PathPlan reserve
+  their next few cells for the coming ticks, and later planners treat
+  those cells as taken at those times
+
+A bot whose move cannot be granted stays where it is (no action).
+"""
+
+from .Constants import ActionType
+from .Occupancy import ENEMY, OUT, WALL
+from .Translate import move
+
+# cells no friendly move can enter this tick
+OBSTACLE = OUT | WALL | ENEMY
+
+
+class ReservationTable:
+    """
+    Resolves the tick's moves and keeps look-ahead reservations.
+    """
+
+    def __init__(self, horizon: int = 0):
+        """
+        Args:
+            horizon (int): Ticks ahead that planned routes are reserved
+                for (0 disables space-time reservations).
+        """
+        self.horizon = horizon
+        # (x, y, tick) -> bot id
+        self._ahead: dict[tuple[int, int, int], int] = {}
+        self.tick = -1
+
+    # ==================== QUERIES ====================
+
+    def reserved(self, x: int, y: int, tick: int) -> int | None:
+        """
+        Get the bot holding a look-ahead reservation.
+
+        Returns:
+            int | None: Bot id, or None if the cell is free at that tick.
+        """
+        return self._ahead.get((x, y, tick))
+
+    def items(self):
+        """All look-ahead reservations as ((x, y, tick), bot id) pairs."""
+        return self._ahead.items()
+
+    def conflicts(self, bot_id: int, cells, tick: int) -> bool:
+        """
+        Check a route against other bots' look-ahead reservations.
+
+        Args:
+            bot_id (int): Bot that wants to follow the route.
+            cells (Iterable[tuple[int, int]]): Cells it reaches at
+                tick + 1, tick + 2, ...
+            tick (int): Current tick.
+
+        Returns:
+            bool: True if another bot holds any of those cells at that time.
+        """
+        ahead = self._ahead
+        if not ahead:
+            return False
+        for k, (x, y) in enumerate(cells, 1):
+            if k > self.horizon:
+                break
+            holder = ahead.get((x, y, tick + k))
+            if holder is not None and holder != bot_id:
+                return True
+        return False
+
+    # ==================== RESOLUTION ====================
+
+    def resolve(self, api, bots, actions, strategies, spawns=()) -> list:
+        """
+        Make the tick's moves collision-free.
+
+        Args:
+            api (GameAPI): Game API for the tick.
+            bots (list[Bot]): Friendly bots, in output order.
+            actions (list[Action | None]): One action per bot.
+            strategies (dict[int, BotController]): Registered strategies.
+            spawns (Iterable[dict]): This tick's spawn payloads.
+
+        Returns:
+            list[Action | None]: Actions with conflicting moves dropped or
+            shortened.
+        """
+        tick = api.get_tick()
+        self._expire(tick)
+        grid = api.grid()
+        occupancy = api.spatial_index().occupancy
+        actions = list(actions)
+        n = len(bots)
+
+        here = [(b.location.x, b.location.y) for b in bots]
+        paths: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+        for i, action in enumerate(actions):
+            if action is None or action.action_type != ActionType.MOVE:
+                continue
+            d = action.payload["direction"]
+            steps = action.payload.get("step", 1)
+            p = bots[i].location
+            cells = []
+            for _ in range(steps):
+                p = grid.next_point(p, d)
+                if p is None or occupancy.blocked(p.x, p.y, OBSTACLE):
+                    break
+                cells.append((p.x, p.y))
+            if cells and len(cells) < steps:
+                # SPEED move whose second step is blocked or leaves the map
+                actions[i] = move(d)
+            # moves straight into an obstacle are left for the engine to
+            # reject; the bot counts as staying
+            paths[i] = cells
+
+        order = sorted(
+            range(n),
+            key=lambda i: -getattr(type(strategies.get(bots[i].id)), "PRIORITY", 0),
+        )
+        fixed = {(s["location"]["x"], s["location"]["y"]) for s in spawns}
+
+        # demotions only ever stop bots, so this settles after a few passes
+        changed = True
+        while changed:
+            changed = False
+            staying = set(fixed)
+            staying.update(here[i] for i in range(n) if not paths[i])
+            target_of = {here[i]: paths[i] for i in range(n) if paths[i]}
+            taken: set[tuple[int, int]] = set()
+
+            for i in order:
+                cells = paths[i]
+                if not cells:
+                    continue
+                if self._clear(i, cells, here[i], staying, taken, target_of, tick, bots):
+                    taken.add(cells[-1])
+                    continue
+                changed = True
+                short = cells[:1]
+                if len(cells) > 1 and self._clear(i, short, here[i], staying, taken, target_of, tick, bots):
+                    paths[i] = short
+                    actions[i] = move(actions[i].payload["direction"])
+                    taken.add(short[-1])
+                else:
+                    paths[i] = []
+                    actions[i] = None
+                    staying.add(here[i])
+
+        if self.horizon:
+            self._reserve_ahead(bots, strategies, paths, here, tick, api)
+        return actions
+
+    def _clear(self, i, cells, start, staying, taken, target_of, tick, bots) -> bool:
+        for cell in cells:
+            if cell in staying:
+                return False
+        dest = cells[-1]
+        if dest in taken:
+            return False
+        # head-on swap with the bot standing on our destination
+        other = target_of.get(dest)
+        if other is not None and start in other:
+            return False
+        holder = self._ahead.get((dest[0], dest[1], tick + 1))
+        return holder is None or holder == bots[i].id
+
+    # ==================== LOOK-AHEAD ====================
+
+    def _expire(self, tick: int):
+        if tick == self.tick:
+            return
+        self.tick = tick
+        if self._ahead:
+            self._ahead = {k: v for k, v in self._ahead.items() if k[2] > tick}
+
+    def _reserve_ahead(self, bots, strategies, paths, here, tick, api):
+        finder = api.spatial_index().pathfinder
+        ahead = self._ahead
+        for i, bot in enumerate(bots):
+            if not paths[i]:
+                continue
+            plan = getattr(strategies.get(bot.id), "plan", None)
+            route = paths[i][-1:]
+            if plan is not None and plan.cells and plan.finder is finder:
+                rest = plan.cells[plan.step + len(paths[i]):]
+                route = route + [_xy(finder.point(c)) for c in rest]
+            for k, (x, y) in enumerate(route[: self.horizon], 1):
+                ahead.setdefault((x, y, tick + k), bot.id)
+
+
+def _xy(p):
+    return p.x, p.y
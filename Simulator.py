@@ -0,0 +1,483 @@
+"""
+LOCAL SIMULATOR
+
+Headless stand-in for the game engine, for profiling and regression
+testing strategies offline.
+
+Handles:
+- Seeded map generation (walls, algae, banks, energy pads)
+- One PlayerView per player per tick, limited to each fleet's vision
+- Applying the {"spawn", "actions"} output of Wrapper.play: spawns,
+  moves (SPEED multi-step moves), harvest, defend and self-destruct
+- Deposits at banks, energy pad recharge, ability costs from
+  ABILITY_COSTS, algae regrowth
+- Running the library's own wrapper for several players in one process
+- Deterministic ticks: the same seed and players replay identically
+
+The engine itself is not public, so the rules below are a documented
+approximation of it rather than a copy:
+
+- Bots spawn on their player's home row; the second player's view is
+  mirrored vertically so both players spawn on row 0 and head NORTH.
+- Spawning costs the abilities' scrap cost (see BotContext.cost).
+- Each step costs MOVE_ENERGY; a SPEED step also costs the SPEED energy.
+  Steps stop at walls, map edges and other bots.
+- HARVEST takes algae or a scrap pile from the cell in the given
+  direction. Poisonous algae drains POISON_DAMAGE energy.
+- A bot standing on a bank deposits everything it carries.
+- A bot standing on an available energy pad is recharged; the pad then
+  cools down.
+- SELF_DESTRUCT removes the bot and every unshielded bot within
+  BLAST_RADIUS; DEFEND (SHIELD) protects a bot for the tick.
+- Using an ability costs its energy; bots without energy are removed.
+- Destroyed bots leave a scrap pile.
+"""
+
+import argparse
+import json
+import random
+import time
+from dataclasses import dataclass
+
+from .API import GameAPI
+from .BotIDAllocator import BotIDAllocator
+from .Constants import ABILITY_COSTS, Ability, ActionType, AlgaeType
+from .models.Algae import Algae
+from .models.Bank import Bank
+from .models.Bot import Bot
+from .models.EnergyPad import EnergyPad
+from .models.PermanentEntities import PermanentEntities
+from .models.PlayerView import PlayerView
+from .models.Point import Point
+from .models.VisibleEntities import VisibleEntities
+from .models.VisibleScrap import VisibleScrap
+from .Wrapper import Match
+
+# (dx, dy) per direction, in engine coordinates (NORTH is +y)
+STEPS = {"NORTH": (0, 1), "SOUTH": (0, -1), "EAST": (1, 0), "WEST": (-1, 0)}
+_MIRRORED = {"NORTH": (0, -1), "SOUTH": (0, 1), "EAST": (1, 0), "WEST": (-1, 0)}
+
+
+@dataclass(frozen=True)
+class SimConfig:
+    """Map shape and rule constants. Densities are fractions of all cells."""
+
+    width: int = 20
+    height: int = 20
+    max_bots: int = 10
+    start_scraps: int = 100
+    start_energy: float = 50.0
+    wall_density: float = 0.05
+    algae_density: float = 0.05
+    poison_chance: float = 0.1
+    algae_regrow: float = 0.05      # chance per tick that one algae grows back
+    banks: int = 4
+    energypads: int = 2
+    vision: int = 4
+    carry_limit: int = 5
+    move_energy: float = 0.5
+    pad_energy: float = 25.0
+    pad_cooldown: int = 10
+    poison_damage: float = 10.0
+    wreck_scraps: int = 5
+    blast_radius: int = 1
+
+
+class _SimBot:
+    """Engine-side bot state (the players only ever see copies)."""
+
+    __slots__ = ("id", "owner", "x", "y", "energy", "scraps", "abilities", "algae_held", "shielded")
+
+    def __init__(self, id, owner, x, y, energy, abilities):
+        self.id = id
+        self.owner = owner
+        self.x = x
+        self.y = y
+        self.energy = energy
+        self.scraps = 0
+        self.abilities = abilities
+        self.algae_held = 0
+        self.shielded = False
+
+
+class Simulator:
+    """
+    One local match between one or two players.
+
+    A player is any callable taking a PlayerView and returning the
+    play() response (dict, or JSON str / bytes). WrapperPlayer runs this
+    library's own Wrapper.
+    """
+
+    def __init__(self, players, config: SimConfig = SimConfig(), seed: int = 0):
+        """
+        Args:
+            players (list[Callable[[PlayerView], dict | bytes]]): One or
+                two players.
+            config (SimConfig): Map shape and rules.
+            seed (int): Seeds map generation and the per-tick action order.
+
+        Raises:
+            ValueError: If there are not one or two players.
+        """
+        if not 1 <= len(players) <= 2:
+            raise ValueError("The simulator supports one or two players")
+        self.players = list(players)
+        self.config = config
+        self.rng = random.Random(seed)
+        self.tick = 0
+
+        w, h = config.width, config.height
+        self.width, self.height = w, h
+        points = [Point(x, y) for y in range(h) for x in range(w)]
+        # per player: engine cell index -> Point as that player sees it
+        self._points = [points, [points[(h - 1 - i // w) * w + i % w] for i in range(w * h)]]
+        self._steps = [STEPS, _MIRRORED]
+
+        self.scraps = [config.start_scraps] * len(players)
+        self.algae = [0] * len(players)
+        self.bots: dict[tuple[int, int], _SimBot] = {}   # (player, bot id) -> bot
+        self.cells: dict[int, _SimBot] = {}              # cell index -> bot
+        self.scrap_piles: dict[int, int] = {}            # cell index -> amount
+        self.algae_cells: dict[int, bool] = {}           # cell index -> is poison
+        self.walls = bytearray(w * h)
+        self.pads: dict[int, list[int]] = {}             # cell index -> [id, available, ticksleft]
+        self.banks: dict[int, list[int]] = {}            # cell index -> [id, occuring, amount, owner, ticksleft]
+        self._generate()
+        self._wall_index = [i for i in range(w * h) if self.walls[i]]
+        self._wall_points = [None] * len(players)
+        self._algae_cache = [None] * len(players)
+
+    # ==================== MAP ====================
+
+    def _generate(self):
+        cfg, rng = self.config, self.rng
+        w, h = self.width, self.height
+        # home rows stay clear so spawns are never blocked by the map
+        free = [i for i in range(w * h) if 0 < i // w < h - 1]
+        rng.shuffle(free)
+        cells = iter(free)
+
+        for k in range(cfg.banks):
+            self.banks[next(cells)] = [k + 1, 0, 0, 0, 0]
+        for k in range(cfg.energypads):
+            self.pads[next(cells)] = [k + 1, 1, 0]
+        for _ in range(int(w * h * cfg.wall_density)):
+            self.walls[next(cells)] = 1
+        for _ in range(int(w * h * cfg.algae_density)):
+            self.algae_cells[next(cells)] = rng.random() < cfg.poison_chance
+
+    def _regrow(self):
+        cfg, rng = self.config, self.rng
+        if rng.random() >= cfg.algae_regrow:
+            return
+        i = rng.randrange(self.width * self.height)
+        if not self.walls[i] and i not in self.algae_cells and i not in self.banks:
+            self.algae_cells[i] = rng.random() < cfg.poison_chance
+
+    # ==================== VIEWS ====================
+
+    def view_for(self, player: int) -> PlayerView:
+        """
+        Build the given player's view of the current tick.
+
+        Args:
+            player (int): Player index.
+
+        Returns:
+            PlayerView: Fresh view; nothing in it is shared with the
+            simulator's own state except immutable Points.
+        """
+        w, h, r = self.width, self.height, self.config.vision
+        pts = self._points[player]
+
+        own, others = [], []
+        for bot in self.bots.values():
+            (own if bot.owner == player else others).append(bot)
+
+        seen = bytearray(w * h)
+        for bot in own:
+            for dy in range(-r, r + 1):
+                y = bot.y + dy
+                if 0 <= y < h:
+                    span = r - abs(dy)
+                    x0, x1 = max(0, bot.x - span), min(w - 1, bot.x + span)
+                    seen[y * w + x0 : y * w + x1 + 1] = b"\x01" * (x1 - x0 + 1)
+
+        def copy(b):
+            return Bot(b.id, b.owner + 1, pts[b.y * w + b.x], b.energy, b.scraps,
+                       list(b.abilities), b.algae_held)
+
+        bots = [copy(b) for b in own]
+        enemies = [copy(b) for b in others if seen[b.y * w + b.x]]
+        scraps = [VisibleScrap(pts[i], n) for i, n in self.scrap_piles.items() if seen[i]]
+
+        walls = self._wall_points[player]
+        if walls is None:
+            walls = self._wall_points[player] = [pts[i] for i in self._wall_index]
+        visible_walls = [pts[i] for i in self._wall_index if seen[i]]
+
+        algae = self._algae_cache[player]
+        if algae is None:
+            # poison is only revealed by harvesting
+            algae = self._algae_cache[player] = [
+                Algae(pts[i], AlgaeType.UNKNOWN.value) for i in self.algae_cells
+            ]
+
+        banks = [Bank(b[0], pts[i], b[1], b[2], b[3], b[4]) for i, b in self.banks.items()]
+        pads = [EnergyPad(p[0], pts[i], p[1], p[2]) for i, p in self.pads.items()]
+
+        return PlayerView(
+            self.tick,
+            self.scraps[player],
+            self.algae[player],
+            len(own),
+            self.config.max_bots,
+            w,
+            h,
+            bots,
+            VisibleEntities(enemies, scraps, visible_walls),
+            PermanentEntities(banks, pads, list(walls), list(algae)),
+        )
+
+    # ==================== TICK ====================
+
+    def step(self) -> None:
+        """Ask every player for its response and advance one tick."""
+        outputs = []
+        for player, play in enumerate(self.players):
+            out = play(self.view_for(player))
+            if isinstance(out, (str, bytes, bytearray)):
+                out = json.loads(out)
+            outputs.append(out)
+
+        for bot in self.bots.values():
+            bot.shielded = False
+
+        queued = []
+        for player, out in enumerate(outputs):
+            for key, action in (out.get("actions") or {}).items():
+                bot = self.bots.get((player, int(key)))
+                if bot is not None:
+                    queued.append((bot, action))
+        # simultaneous turns: resolve in a seeded order, shields first
+        self.rng.shuffle(queued)
+        for bot, action in queued:
+            if action.get("action") == ActionType.DEFEND.value:
+                self._defend(bot)
+        for bot, action in queued:
+            if bot.id is not None:
+                self._act(bot, action)
+
+        for player, out in enumerate(outputs):
+            for key, payload in (out.get("spawn") or {}).items():
+                self._spawn(player, int(key), payload)
+
+        self._settle()
+        self._regrow()
+        self.tick += 1
+
+    def run(self, ticks: int) -> dict:
+        """
+        Play a number of ticks.
+
+        Args:
+            ticks (int): Ticks to play.
+
+        Returns:
+            dict: Tick count, elapsed seconds, ticks per second, and per
+            player banked algae, scraps and live bots.
+        """
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": self.tick,
+            "elapsed": elapsed,
+            "ticks_per_sec": ticks / elapsed if elapsed else float("inf"),
+            "algae": list(self.algae),
+            "scraps": list(self.scraps),
+            "bots": [sum(b.owner == p for b in self.bots.values()) for p in range(len(self.players))],
+        }
+
+    # ==================== RULES ====================
+
+    def _spawn(self, player: int, bot_id: int, payload: dict):
+        cfg = self.config
+        w, h = self.width, self.height
+        if sum(b.owner == player for b in self.bots.values()) >= cfg.max_bots:
+            return
+        if (player, bot_id) in self.bots:
+            return
+        abilities = list(dict.fromkeys(payload.get("abilities") or ()))
+        if any(a not in ABILITY_COSTS for a in abilities):
+            return
+        cost = sum(ABILITY_COSTS[a]["scrap"] for a in abilities)
+        if Ability.SPEED.value in abilities and Ability.SELF_DESTRUCT.value in abilities:
+            cost -= 5
+        if cost > self.scraps[player]:
+            return
+
+        x = payload.get("location", {}).get("x", 0)
+        if not 0 <= x < w:
+            return
+        y = 0 if player == 0 else h - 1
+        i = y * w + x
+        if i in self.cells or self.walls[i]:
+            return
+
+        self.scraps[player] -= cost
+        bot = _SimBot(bot_id, player, x, y, cfg.start_energy, abilities)
+        self.bots[(player, bot_id)] = bot
+        self.cells[i] = bot
+
+    def _use(self, bot: _SimBot, ability: str, extra: float = 0.0) -> bool:
+        if ability not in bot.abilities:
+            return False
+        bot.energy -= ABILITY_COSTS[ability]["energy"] + extra
+        return True
+
+    def _defend(self, bot: _SimBot):
+        if self._use(bot, Ability.SHIELD.value):
+            bot.shielded = True
+
+    def _act(self, bot: _SimBot, action: dict):
+        kind = action.get("action")
+        if bot.energy <= 0:
+            return
+        if kind == ActionType.MOVE.value:
+            self._move(bot, action.get("direction"), action.get("step", 1))
+        elif kind == ActionType.HARVEST.value:
+            self._harvest(bot, action.get("direction"))
+        elif kind == ActionType.SELF_DESTRUCT.value:
+            if self._use(bot, Ability.SELF_DESTRUCT.value):
+                self._explode(bot)
+
+    def _move(self, bot: _SimBot, direction, steps):
+        d = self._steps[bot.owner].get(direction)
+        if d is None:
+            return
+        if steps != 1 and (steps != 2 or Ability.SPEED.value not in bot.abilities):
+            return
+        w, h = self.width, self.height
+        cells = self.cells
+        for k in range(steps):
+            x, y = bot.x + d[0], bot.y + d[1]
+            i = y * w + x
+            if not (0 <= x < w and 0 <= y < h) or self.walls[i] or i in cells:
+                break
+            cost = self.config.move_energy
+            if k:
+                cost += ABILITY_COSTS[Ability.SPEED.value]["energy"]
+            bot.energy -= cost
+            del cells[bot.y * w + bot.x]
+            bot.x, bot.y = x, y
+            cells[i] = bot
+
+    def _harvest(self, bot: _SimBot, direction):
+        d = self._steps[bot.owner].get(direction)
+        if d is None or not self._use(bot, Ability.HARVEST.value):
+            return
+        w, h = self.width, self.height
+        x, y = bot.x + d[0], bot.y + d[1]
+        if not (0 <= x < w and 0 <= y < h):
+            return
+        i = y * w + x
+        if i in self.algae_cells and bot.algae_held < self.config.carry_limit:
+            if self.algae_cells.pop(i):
+                bot.energy -= self.config.poison_damage
+            bot.algae_held += 1
+            self._algae_cache = [None] * len(self.players)
+        elif i in self.scrap_piles:
+            bot.scraps += self.scrap_piles.pop(i)
+
+    def _explode(self, bot: _SimBot):
+        r = self.config.blast_radius
+        doomed = [bot] + [
+            other for other in self.bots.values()
+            if other is not bot and not other.shielded
+            and abs(other.x - bot.x) + abs(other.y - bot.y) <= r
+        ]
+        for victim in doomed:
+            self._destroy(victim)
+
+    def _destroy(self, bot: _SimBot):
+        w = self.width
+        i = bot.y * w + bot.x
+        del self.bots[(bot.owner, bot.id)]
+        del self.cells[i]
+        self.scrap_piles[i] = self.scrap_piles.get(i, 0) + self.config.wreck_scraps + bot.scraps
+        bot.id = None  # queued actions of a destroyed bot are skipped
+
+    def _settle(self):
+        cfg = self.config
+        w = self.width
+        for pad in self.pads.values():
+            if pad[2]:
+                pad[2] -= 1
+                pad[1] = int(pad[2] == 0)
+        for bank in self.banks.values():
+            bank[1] = 0
+
+        for bot in list(self.bots.values()):
+            i = bot.y * w + bot.x
+            bank = self.banks.get(i)
+            if bank is not None and (bot.algae_held or bot.scraps):
+                self.algae[bot.owner] += bot.algae_held
+                self.scraps[bot.owner] += bot.scraps
+                bank[1:4] = [1, bot.algae_held + bot.scraps, bot.owner + 1]
+                bot.algae_held = bot.scraps = 0
+            pad = self.pads.get(i)
+            if pad is not None and pad[1]:
+                bot.energy += cfg.pad_energy
+                pad[1], pad[2] = 0, cfg.pad_cooldown
+            if bot.energy <= 0:
+                self._destroy(bot)
+
+
+# ==================== WRAPPER PLAYERS ====================
+
+class WrapperPlayer:
+    """
+    Plays with this library's wrapper.
+
+    Each instance owns its own Wrapper.Match (strategy registry, ID
+    allocator, caches), so any number of players can share a process.
+    """
+
+    def __init__(self, spawn_policy=None, first_id: int = 1, **options):
+        """
+        Args:
+            spawn_policy (Callable | None): Overrides User.spawn_policy.
+            first_id (int): First bot ID to allocate.
+            **options: Keyword options of Match.play.
+        """
+        self.options = options
+        self.match = Match(spawn_policy, BotIDAllocator(first_id))
+
+    @property
+    def strategies(self) -> dict:
+        """This player's strategy registry (bot id -> BotController)."""
+        return self.match.strategies
+
+    def __call__(self, view: PlayerView) -> dict:
+        return self.match.play(GameAPI(view), **self.options)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local headless match.")
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, default=20, help="map width and height")
+    parser.add_argument("--players", type=int, default=2, choices=(1, 2))
+    parser.add_argument("--max-bots", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    config = SimConfig(width=args.size, height=args.size, max_bots=args.max_bots)
+    sim = Simulator([WrapperPlayer() for _ in range(args.players)], config, args.seed)
+    print(json.dumps(sim.run(args.ticks), indent=2))
+
+
+if __name__ == "__main__":
+    main()
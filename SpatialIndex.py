@@ -0,0 +1,399 @@
+"""
+SPATIAL INDEX
+
+Grid-bucketed entity lookup shared by every BotContext in a tick.
+
+Handles:
+- Bucketing entities by the cell they occupy (read straight from the
+  x / y columns of columnar lists, so no entity is materialised)
+- Manhattan radius queries over the cells inside the diamond
+- Nearest / k-nearest / nearest-unclaimed via expanding ring search
+- Lazy per-layer construction (enemies, algae, scraps, walls, bots),
+  safe when executor threads reach a layer at the same time
+- The tick's path finder, occupancy flags and static distance fields
+"""
+
+from threading import Lock, RLock
+
+from .models.Columns import coordinates
+from .Occupancy import Occupancy
+from .Pathfinding import DistanceField, PathFinder, StaticMap
+
+
+def _location(entity):
+    return entity.location
+
+
+def _identity(point):
+    return point
+
+
+_MISSING = object()
+
+
+class _layer:
+    """
+    Like functools.cached_property, but the first build holds the owner's
+    lock. Threads that race to a layer all get the same instance, so
+    claims made on it are never lost with a discarded copy. Once built,
+    the value sits in the instance dict and reads take no lock.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        with obj._lock:
+            value = obj.__dict__.get(self.name, _MISSING)
+            if value is _MISSING:
+                value = obj.__dict__[self.name] = self.build(obj)
+        return value
+
+
+class SpatialIndex:
+    """
+    Buckets entities by grid cell.
+
+    Buckets hold positions in the source list, so query results come
+    back in exactly the order a linear scan would produce, and only the
+    entities a query returns are looked up (and, for columnar lists,
+    materialised).
+    """
+
+    def __init__(self, entities, locate=_location):
+        """
+        Build the index.
+
+        Args:
+            entities (Sequence): Entities to index (a list or EntityColumns).
+            locate (callable): Maps an entity to its Point (not used for
+                EntityColumns, whose x / y columns are read directly).
+        """
+        if locate is _location:
+            coords = coordinates(entities)
+        else:
+            coords = ((p.x, p.y) for p in map(locate, entities))
+
+        cells: dict[tuple[int, int], list[int]] = {}
+        count = 0
+        for ordinal, key in enumerate(coords):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [ordinal]
+            else:
+                bucket.append(ordinal)
+            count += 1
+
+        self._entities = entities
+        self._cells = cells
+        self._count = count
+        self._claimed: set[int] = set()
+        self._claim_lock = Lock()
+
+        if cells:
+            xs = [x for x, _ in cells]
+            ys = [y for _, y in cells]
+            self._bounds = (min(xs), max(xs), min(ys), max(ys))
+        else:
+            self._bounds = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def at(self, x: int, y: int) -> list:
+        """
+        Get the entities occupying a single cell.
+
+        Returns:
+            list: Entities at (x, y), in source order.
+        """
+        bucket = self._cells.get((x, y))
+        entities = self._entities
+        return [entities[o] for o in bucket] if bucket else []
+
+    def query(self, center, radius: int) -> list:
+        """
+        Get entities within a Manhattan radius of a point.
+
+        Only the O(r²) cells of the diamond are probed; when the diamond
+        has more cells than the index has occupied cells, the occupied
+        cells are scanned instead.
+
+        Args:
+            center (Point): Center position.
+            radius (int): Manhattan distance radius.
+
+        Returns:
+            list: Matching entities, in source order.
+        """
+        r = int(radius)
+        if r < 0 or not self._count:
+            return []
+
+        cx, cy = center.x, center.y
+        cells = self._cells
+        hits = []
+
+        if 2 * r * (r + 1) + 1 > len(cells):
+            for (x, y), bucket in cells.items():
+                if abs(x - cx) + abs(y - cy) <= r:
+                    hits.extend(bucket)
+        else:
+            get = cells.get
+            for dx in range(-r, r + 1):
+                x = cx + dx
+                span = r - abs(dx)
+                for y in range(cy - span, cy + span + 1):
+                    bucket = get((x, y))
+                    if bucket:
+                        hits.extend(bucket)
+
+        if len(hits) > 1:
+            hits.sort()
+        entities = self._entities
+        return [entities[o] for o in hits]
+
+
+    def count(self, center, radius: int) -> int:
+        """
+        Count entities within a Manhattan radius without building a list.
+
+        Args:
+            center (Point): Center position.
+            radius (int): Manhattan distance radius.
+
+        Returns:
+            int: Number of entities within radius.
+        """
+        r = int(radius)
+        if r < 0 or not self._count:
+            return 0
+
+        cx, cy = center.x, center.y
+        cells = self._cells
+        total = 0
+
+        if 2 * r * (r + 1) + 1 > len(cells):
+            for (x, y), bucket in cells.items():
+                if abs(x - cx) + abs(y - cy) <= r:
+                    total += len(bucket)
+        else:
+            get = cells.get
+            for dx in range(-r, r + 1):
+                x = cx + dx
+                span = r - abs(dx)
+                for y in range(cy - span, cy + span + 1):
+                    bucket = get((x, y))
+                    if bucket:
+                        total += len(bucket)
+        return total
+
+    # ==================== NEAREST ====================
+
+    def by_distance(self, center, radius: int | None = None):
+        """
+        Lazily yield entries in increasing distance from a point.
+
+        Rings of the Manhattan diamond are probed outward from center;
+        once the probes outnumber the occupied cells, the remaining
+        entries are sorted in one pass instead.
+
+        Args:
+            center (Point): Center position.
+            radius (int | None): Stop after this distance (unbounded if None).
+
+        Yields:
+            tuple[int, int, object]: (distance, ordinal, entity), ordered
+            by distance and then source order.
+        """
+        if self._bounds is None:
+            return
+
+        cx, cy = center.x, center.y
+        x0, x1, y0, y1 = self._bounds
+        reach = max(abs(x0 - cx), abs(x1 - cx)) + max(abs(y0 - cy), abs(y1 - cy))
+        if radius is not None:
+            reach = min(reach, int(radius))
+
+        entities = self._entities
+        cells = self._cells
+        get = cells.get
+        probes = 0
+
+        for d in range(reach + 1):
+            if probes > len(cells):
+                rest = []
+                for (x, y), bucket in cells.items():
+                    dist = abs(x - cx) + abs(y - cy)
+                    if d <= dist <= reach:
+                        rest.extend((dist, o) for o in bucket)
+                rest.sort()
+                for dist, o in rest:
+                    yield dist, o, entities[o]
+                return
+
+            if d == 0:
+                ring = list(get((cx, cy), ()))
+                probes += 1
+            else:
+                ring = []
+                for dx in range(-d, d + 1):
+                    x = cx + dx
+                    dy = d - abs(dx)
+                    bucket = get((x, cy + dy))
+                    if bucket:
+                        ring.extend(bucket)
+                    if dy:
+                        bucket = get((x, cy - dy))
+                        if bucket:
+                            ring.extend(bucket)
+                probes += 4 * d
+
+            if ring:
+                ring.sort()
+                for o in ring:
+                    yield d, o, entities[o]
+
+    def nearest(self, center, unclaimed: bool = False):
+        """
+        Get the entity closest to a point.
+
+        Ties resolve to the earliest entity in source order, matching
+        min() over the source list.
+
+        Args:
+            center (Point): Center position.
+            unclaimed (bool): Skip entities claimed earlier this tick.
+
+        Returns:
+            object | None: Nearest entity, or None if there is none.
+        """
+        found = self.k_nearest(center, 1, unclaimed)
+        return found[0] if found else None
+
+    def k_nearest(self, center, k: int, unclaimed: bool = False) -> list:
+        """
+        Get the k entities closest to a point.
+
+        Args:
+            center (Point): Center position.
+            k (int): Maximum number of entities.
+            unclaimed (bool): Skip entities claimed earlier this tick.
+
+        Returns:
+            list: Up to k entities, nearest first.
+        """
+        out = []
+        if k <= 0:
+            return out
+        claimed = self._claimed if unclaimed else ()
+        for _, _, e in self.by_distance(center):
+            if id(e) in claimed:
+                continue
+            out.append(e)
+            if len(out) == k:
+                break
+        return out
+
+    def claim(self, entity) -> None:
+        """Mark an entity as taken for the rest of the tick."""
+        self._claimed.add(id(entity))
+
+    def claim_nearest(self, center):
+        """
+        Claim and return the nearest entity not yet claimed this tick.
+
+        Returns:
+            object | None: Claimed entity, or None if all are taken.
+        """
+        with self._claim_lock:
+            e = self.nearest(center, unclaimed=True)
+            if e is not None:
+                self.claim(e)
+        return e
+
+
+class TickIndex:
+    """
+    The set of spatial indexes for one tick.
+
+    Built once per tick by the wrapper and shared by all BotContexts.
+    Each layer is only bucketed the first time something queries it.
+    """
+
+    def __init__(self, api, static: StaticMap | None = None):
+        """
+        Args:
+            api (GameAPI): Game API for the current tick.
+            static (StaticMap | None): Match-wide layout cache. A private
+                one is used when omitted.
+        """
+        self.api = api
+        self.static = static if static is not None else StaticMap()
+        # BatchSensing results, when the wrapper runs in batch mode
+        self.batch = None
+        # serialises layer builds; reentrant because layers build on each other
+        self._lock = RLock()
+
+    @_layer
+    def enemies(self) -> SpatialIndex:
+        return SpatialIndex(self.api.visible_enemies())
+
+    @_layer
+    def algae(self) -> SpatialIndex:
+        return SpatialIndex(self.api.visible_algae())
+
+    @_layer
+    def scraps(self) -> SpatialIndex:
+        return SpatialIndex(self.api.visible_scraps())
+
+    @_layer
+    def walls(self) -> SpatialIndex:
+        return SpatialIndex(self.api.visible_walls(), locate=_identity)
+
+    @_layer
+    def bots(self) -> SpatialIndex:
+        return SpatialIndex(self.api.get_my_bots())
+
+    @_layer
+    def banks(self) -> SpatialIndex:
+        return SpatialIndex(self.api.banks())
+
+    @_layer
+    def energypads(self) -> SpatialIndex:
+        return SpatialIndex(self.api.energypads())
+
+    @_layer
+    def pathfinder(self) -> PathFinder:
+        view = self.api.view
+        memory = self.api.memory
+        # remembered walls include ones only seen on earlier ticks
+        walls = memory.walls if memory is not None else self.api.walls()
+        return self.static.update(view.width, view.height, walls)
+
+    @_layer
+    def occupancy(self) -> Occupancy:
+        return Occupancy(
+            self.pathfinder, self.api.visible_enemies(), self.api.get_my_bots()
+        )
+
+    @_layer
+    def bank_field(self) -> DistanceField:
+        return self._field("banks", [b.location for b in self.api.banks()])
+
+    @_layer
+    def energypad_field(self) -> DistanceField:
+        return self._field(
+            "energypads", [p.location for p in self.api.energypads()]
+        )
+
+    def _field(self, name: str, sources) -> DistanceField:
+        self.pathfinder  # sync the static map with this tick's walls first
+        return self.static.field(name, sources)
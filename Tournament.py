@@ -0,0 +1,277 @@
+"""
+TOURNAMENT RUNNER
+
+Batches of independent simulated matches spread over a process pool.
+
+Handles:
+- Scheduling: strategy modules paired up x seeds x map configs
+- Running matches in worker processes against the local Simulator
+- Streaming one JSON line per finished match to the results file
+- Resuming an interrupted run: matches already in the file are skipped
+- Standings (wins, draws, losses, banked algae) per strategy module
+
+A strategy module is an importable module name whose spawn_policy is
+used for that player, e.g. "mypkg.User"; "module:attribute" picks a
+differently named policy. Matches share nothing, so throughput scales
+with the number of worker processes.
+
+Run from the directory containing the package:
+
+    python -m <package>.Tournament <package>.User other.User --seeds 100 --out runs.jsonl
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing import Pool
+
+from .Simulator import SimConfig, Simulator, WrapperPlayer
+
+
+@dataclass(frozen=True)
+class Match:
+    """One scheduled match. Picklable, so it can be sent to a worker."""
+
+    players: tuple[str, ...]
+    seed: int
+    config_name: str = "default"
+    config: SimConfig = SimConfig()
+    ticks: int = 500
+
+    @property
+    def key(self) -> str:
+        """
+        Unique name of the match in a results file.
+
+        Carries a hash of the config's settings, so changing a named
+        config (size, bot cap, ...) replays its matches on resume instead
+        of reusing the old records.
+        """
+        settings = json.dumps(asdict(self.config), sort_keys=True).encode()
+        digest = hashlib.sha1(settings).hexdigest()[:12]
+        return f"{' vs '.join(self.players)}|{self.config_name}#{digest}|{self.seed}|{self.ticks}"
+
+
+def schedule(modules, seeds, configs=None, ticks: int = 500, both_sides: bool = True) -> list[Match]:
+    """
+    Build the match list for a run.
+
+    Every pair of distinct modules plays on every config with every seed
+    (a single module plays itself).
+
+    Args:
+        modules (list[str]): Strategy module specs.
+        seeds (Iterable[int]): Seeds.
+        configs (dict[str, SimConfig] | None): Named map configs
+            (defaults to {"default": SimConfig()}).
+        ticks (int): Ticks per match.
+        both_sides (bool): Also play each pair with the sides swapped.
+
+    Returns:
+        list[Match]: Matches in a deterministic order.
+    """
+    configs = configs or {"default": SimConfig()}
+    modules = list(modules)
+    if len(modules) == 1:
+        pairs = [(modules[0], modules[0])]
+    else:
+        pairs = [
+            (a, b) for i, a in enumerate(modules) for j, b in enumerate(modules)
+            if i < j or (both_sides and i > j)
+        ]
+    return [
+        Match(pair, seed, name, config, ticks)
+        for name, config in configs.items()
+        for pair in pairs
+        for seed in seeds
+    ]
+
+
+# ==================== WORKER ====================
+
+def _policy(spec: str):
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr or "spawn_policy")
+
+
+def play_match(match: Match) -> dict:
+    """
+    Play one match (runs in a worker process).
+
+    Returns:
+        dict: JSON-serialisable result record. Failures are recorded
+        with an "error" field instead of raising, so one bad match does
+        not stop the run.
+    """
+    record = {
+        "key": match.key,
+        "players": list(match.players),
+        "seed": match.seed,
+        "config": match.config_name,
+        "settings": asdict(match.config),
+        "ticks": match.ticks,
+    }
+    try:
+        players = [WrapperPlayer(spawn_policy=_policy(spec)) for spec in match.players]
+        result = Simulator(players, match.config, match.seed).run(match.ticks)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    algae = result["algae"]
+    best = max(algae)
+    record.update(
+        algae=algae,
+        scraps=result["scraps"],
+        bots=result["bots"],
+        winner=algae.index(best) if algae.count(best) == 1 else None,
+        elapsed=round(result["elapsed"], 4),
+    )
+    return record
+
+
+# ==================== RESULTS FILE ====================
+
+def load_results(path) -> list[dict]:
+    """
+    Read the records of a results file.
+
+    A truncated last line (the run was killed mid-write) is cut off the
+    file so later appends start on a clean line.
+
+    Args:
+        path (str | Path): JSONL results file (missing files read as empty).
+
+    Returns:
+        list[dict]: Records in file order.
+    """
+    if not os.path.exists(path):
+        return []
+    records = []
+    good = 0
+    with open(path, "rb+") as f:
+        data = f.read()
+        for line in data.splitlines(keepends=True):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            good += len(line)
+        if good < len(data):
+            f.truncate(good)
+        elif data and not data.endswith(b"\n"):
+            f.write(b"\n")
+    return records
+
+
+def run_tournament(matches, path, workers: int | None = None, retry_errors: bool = True,
+                   progress=None) -> list[dict]:
+    """
+    Play every match not already recorded in the results file.
+
+    Records are appended (and flushed) as each match finishes, in
+    completion order, so an interrupted run loses at most the matches
+    that were in flight.
+
+    Args:
+        matches (list[Match]): Matches to play (see schedule).
+        path (str | Path): JSONL results file; created or appended to.
+        workers (int | None): Worker processes (defaults to the CPU
+            count; 0 plays in this process).
+        retry_errors (bool): Replay matches whose record has an error.
+        progress (Callable[[dict], None] | None): Called with each new record.
+
+    Returns:
+        list[dict]: All records for the given matches, old and new.
+    """
+    wanted = {m.key for m in matches}
+    done = {}
+    for record in load_results(path):
+        if record.get("key") in wanted and not (retry_errors and "error" in record):
+            done[record["key"]] = record
+    todo = [m for m in matches if m.key not in done]
+
+    with open(path, "a", encoding="utf-8") as out:
+        def write(record):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            done[record["key"]] = record
+            if progress:
+                progress(record)
+
+        if workers == 0 or len(todo) <= 1:
+            for match in todo:
+                write(play_match(match))
+        elif todo:
+            with Pool(workers) as pool:
+                # small chunks keep the load balanced without per-match IPC overhead
+                chunk = max(1, len(todo) // ((workers or os.cpu_count() or 1) * 8))
+                for record in pool.imap_unordered(play_match, todo, chunk):
+                    write(record)
+
+    return [done[m.key] for m in matches if m.key in done]
+
+
+def standings(records) -> dict[str, dict]:
+    """
+    Summarise results per strategy module.
+
+    Args:
+        records (Iterable[dict]): Result records.
+
+    Returns:
+        dict[str, dict]: Module -> {"played", "wins", "draws", "losses",
+        "errors", "algae"} where algae is the mean banked per match.
+    """
+    table: dict[str, dict] = {}
+    for record in records:
+        for side, module in enumerate(record["players"]):
+            row = table.setdefault(
+                module, {"played": 0, "wins": 0, "draws": 0, "losses": 0, "errors": 0, "algae": 0.0}
+            )
+            if "error" in record:
+                row["errors"] += 1
+                continue
+            row["played"] += 1
+            row["algae"] += record["algae"][side]
+            winner = record["winner"]
+            if winner is None:
+                row["draws"] += 1
+            elif winner == side:
+                row["wins"] += 1
+            else:
+                row["losses"] += 1
+    for row in table.values():
+        if row["played"]:
+            row["algae"] = round(row["algae"] / row["played"], 2)
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play a batch of local matches.")
+    parser.add_argument("modules", nargs="+", help="strategy modules (module[:spawn_policy])")
+    parser.add_argument("--seeds", type=int, default=10, help="seeds 0..N-1 per pairing")
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--size", type=int, nargs="+", default=[20], help="map sizes to play on")
+    parser.add_argument("--max-bots", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="tournament.jsonl")
+    args = parser.parse_args(argv)
+
+    configs = {
+        f"{n}x{n}": SimConfig(width=n, height=n, max_bots=args.max_bots) for n in args.size
+    }
+    matches = schedule(args.modules, range(args.seeds), configs, args.ticks)
+    start = time.perf_counter()
+    records = run_tournament(matches, args.out, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{len(records)} matches recorded in {args.out} ({elapsed:.1f}s this run)")
+    print(json.dumps(standings(records), indent=2))
+
+
+if __name__ == "__main__":
+    main()
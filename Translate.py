@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .Action import Action
 from .Constants import ActionType, Direction
 from .BotIDAllocator import BotIDAllocator
@@ -5,34 +7,40 @@ from .BotIDAllocator import BotIDAllocator
 BOT_ID_ALLOCATOR = BotIDAllocator()
 
 
+def _frozen(action_type: ActionType, **payload) -> Action:
+    return Action(action_type, MappingProxyType(payload))
+
+
+# fixed-argument actions are built once and shared by every bot
+_MOVES = {d: _frozen(ActionType.MOVE, direction=d.value) for d in Direction}
+_HARVESTS = {d: _frozen(ActionType.HARVEST, direction=d.value) for d in Direction}
+_SPEED_MOVES: dict[tuple[Direction, int], Action] = {}
+_SELF_DESTRUCT = _frozen(ActionType.SELF_DESTRUCT, direction="NULL")
+_DEFEND = _frozen(ActionType.DEFEND, direction="NULL")
+
+
 def move(direction: Direction):
-    return Action(ActionType.MOVE, {
-        "direction": direction.value
-    })
+    return _MOVES[direction]
 
 def moveSpeed(direction: Direction, step: int):
-    return Action(ActionType.MOVE, {
-        "direction": direction.value,
-        "step": step
-    })
+    action = _SPEED_MOVES.get((direction, step))
+    if action is None:
+        action = _SPEED_MOVES[(direction, step)] = _frozen(
+            ActionType.MOVE, direction=direction.value, step=step
+        )
+    return action
 
 def harvest(direction: Direction):
-    return Action(ActionType.HARVEST, {
-        "direction": direction.value
-    })
+    return _HARVESTS[direction]
 
 def self_destruct():
-    return Action(ActionType.SELF_DESTRUCT, {
-        "direction": "NULL"
-    })
+    return _SELF_DESTRUCT
 
 def defend():
-    return Action(ActionType.DEFEND, {
-        "direction": "NULL"
-    })
+    return _DEFEND
 
-def spawn(abilities: list[str], location:int):
-    bot_id= BOT_ID_ALLOCATOR.allocate()
+def spawn(abilities: list[str], location:int, allocator: BotIDAllocator | None = None):
+    bot_id= (allocator or BOT_ID_ALLOCATOR).allocate()
     return bot_id, {
         "abilities": abilities,
         "location": {"x": location, "y": 0}
@@ -3,7 +3,7 @@ USER STRATEGIES ONLY
 
 You may:
 - Define new bot strategy classes
-- Register them in TEMPLATE_TO_STRATEGY
+- Register them in TEMPLATE_TO_STRATEGY (templates.register)
 - Decide WHEN and WHICH bots to spawn
 - Decide actions for your bots
 
@@ -16,7 +16,8 @@ You may NOT:
 from .controllers.BotBase import BotController
 from .Constants import Ability, Direction
 from .models.Point import Point
-from .templates import Forager, FlashScout, HeatSeeker, Lurker, Saboteur
+from .Translate import harvest, move
+from . import templates
 
 
 # ============================================================
@@ -33,18 +34,20 @@ class MinerBot(BotController):
         ctx = self.ctx
 
         if ctx.getAlgaeHeld() >= 5:
-            bank = ctx.getNearestBank()
-            d = ctx.moveTarget(ctx.getLocation(), bank)
+            d = ctx.getBankDirection()
             if d:
-                return ctx.move(d)
+                return move(d)
 
         algae = ctx.senseAlgae()
         if algae:
-            return ctx.harvestAlgae(Direction.NORTH)
+            return harvest(Direction.NORTH)
 
-        return ctx.move(Direction.NORTH)
+        return move(Direction.NORTH)
 
 
+# user strategies share the registry with the shipped templates
+templates.register("MinerBot", MinerBot)
+
 
 # ============================================================
 # SPAWN POLICY
@@ -59,7 +62,8 @@ def spawn_policy(api):
         )
 
         spawns.append(
-            Forager.spawn(
+            templates.spawn(
+                "Forager",
                 abilities=[Ability.LOCKPICK.value],
                 location=2
             )
@@ -0,0 +1,209 @@
+"""
+WORLD MEMORY
+
+Observations accumulated across ticks.
+
+Handles:
+- Walls seen on any tick (never forgotten)
+- Last sighting of algae, scrap piles and enemy bots, with the tick
+- Latest bank and energy pad status
+- Last-seen tick per cell, from each friendly bot's vision diamond
+- Forgetting sightings that are contradicted or older than the decay
+
+The memory is updated in place once per tick by the wrapper; nothing is
+rebuilt from scratch. A remembered entry is dropped when its cell is in
+view again without it, or when it has not been seen for `decay` ticks.
+"""
+
+from array import array
+
+from .SpatialIndex import SpatialIndex
+
+# kinds with per-entry sightings, and how each is keyed
+_BY_CELL = ("algae", "scraps")
+_BY_ID = ("enemies", "banks", "energypads")
+
+
+class WorldMemory:
+    """
+    Persistent map built from every PlayerView seen this match.
+    """
+
+    def __init__(self, vision: int = 4, decay: int | None = 50):
+        """
+        Args:
+            vision (int): Manhattan radius each friendly bot is assumed
+                to observe; used for last-seen ticks and for forgetting
+                entries that are no longer there.
+            decay (int | None): Ticks after which an unconfirmed sighting
+                is forgotten (None keeps sightings until contradicted).
+        """
+        self.vision = vision
+        self.decay = decay
+        self.reset()
+
+    def reset(self):
+        """Forget everything (new match or new map size)."""
+        self.tick: int | None = None
+        self.width = 0
+        self.height = 0
+        # every wall seen so far, plus a per-cell flag for de-duplication
+        self.walls: list = []
+        self._wall_cells = bytearray()
+        self.last_seen = array("i")
+        # kind -> key -> (entity, tick last seen)
+        self._entries: dict[str, dict] = {kind: {} for kind in _BY_CELL + _BY_ID}
+        self._indexes: dict[str, SpatialIndex] = {}
+
+    def __getstate__(self):
+        # the per-tick indexes are rebuilt on demand (and hold locks)
+        state = self.__dict__.copy()
+        state["_indexes"] = {}
+        return state
+
+    # ==================== UPDATE ====================
+
+    def update(self, view) -> None:
+        """
+        Merge one tick's view. Calling it again for the same tick is a no-op.
+
+        Args:
+            view (PlayerView): Current view.
+        """
+        if (view.width, view.height) != (self.width, self.height):
+            self.reset()
+            self.width, self.height = view.width, view.height
+            self.last_seen = array("i", [-1]) * (view.width * view.height)
+            self._wall_cells = bytearray(view.width * view.height)
+        tick = view.tick
+        if tick == self.tick:
+            return
+        self.tick = tick
+        self._indexes.clear()
+
+        visible = view.visible_entities
+        permanent = view.permanent_entities
+
+        self._merge_walls(permanent.walls)
+        self._merge_walls(visible.walls)
+
+        self._mark_vision(view.bots, tick)
+        sightings = {
+            "algae": permanent.algae,
+            "scraps": visible.scraps,
+            "enemies": visible.enemies,
+            "banks": permanent.banks,
+            "energypads": permanent.energypads,
+        }
+        for kind, entities in sightings.items():
+            self._merge(kind, entities, tick)
+
+    def _merge_walls(self, walls):
+        cells = self._wall_cells
+        w, h = self.width, self.height
+        for p in walls:
+            if 0 <= p.x < w and 0 <= p.y < h:
+                i = p.y * w + p.x
+                if not cells[i]:
+                    cells[i] = 1
+                    self.walls.append(p)
+
+    def _mark_vision(self, bots, tick: int):
+        w, h, r = self.width, self.height, self.vision
+        seen = self.last_seen
+        fill = array("i", [tick]) * (2 * r + 1)
+        # (offset from the bot's cell, row length) for each diamond row
+        rows = [(dy * w - (r - abs(dy)), 2 * (r - abs(dy)) + 1) for dy in range(-r, r + 1)]
+        fills = {n: fill[:n] for _, n in rows}
+        for bot in bots:
+            bx, by = bot.location.x, bot.location.y
+            if r <= bx < w - r and r <= by < h - r:
+                base = by * w + bx
+                for off, n in rows:
+                    seen[base + off : base + off + n] = fills[n]
+                continue
+            for dy in range(-r, r + 1):
+                y = by + dy
+                if not 0 <= y < h:
+                    continue
+                span = r - abs(dy)
+                x0 = max(0, bx - span)
+                x1 = min(w - 1, bx + span)
+                if x0 <= x1:
+                    row = y * w
+                    seen[row + x0 : row + x1 + 1] = fill[: x1 - x0 + 1]
+
+    def _merge(self, kind: str, entities, tick: int):
+        entries = self._entries[kind]
+        seen = self.last_seen
+        w, h = self.width, self.height
+
+        if kind in _BY_CELL:
+            for e in entities:
+                p = e.location
+                entries[(p.x, p.y)] = (e, tick)
+        else:
+            for e in entities:
+                entries[e.id] = (e, tick)
+
+        if kind in ("banks", "energypads"):
+            return  # permanent; status is refreshed every tick
+
+        for e in entities:  # anything reported was in view
+            p = e.location
+            if 0 <= p.x < w and 0 <= p.y < h:
+                seen[p.y * w + p.x] = tick
+
+        decay = self.decay
+        stale = []
+        for key, (e, t) in entries.items():
+            if t == tick:
+                continue
+            p = e.location
+            in_view = 0 <= p.x < w and 0 <= p.y < h and seen[p.y * w + p.x] == tick
+            if in_view or (decay is not None and tick - t > decay):
+                stale.append(key)
+        for key in stale:
+            del entries[key]
+
+    # ==================== QUERIES ====================
+
+    def entities(self, kind: str, max_age: int | None = None) -> list:
+        """
+        Get remembered entities of a kind.
+
+        Args:
+            kind (str): "algae", "scraps", "enemies", "banks" or "energypads".
+            max_age (int | None): Only sightings at most this many ticks old.
+
+        Returns:
+            list: Entities as last seen, in no particular order.
+        """
+        entries = self._entries[kind].values()
+        if max_age is None:
+            return [e for e, _ in entries]
+        oldest = self.tick - max_age
+        return [e for e, t in entries if t >= oldest]
+
+    def sighting(self, kind: str, key) -> tuple | None:
+        """
+        Get (entity, tick) for a remembered entry.
+
+        Args:
+            kind (str): Entity kind.
+            key: (x, y) for algae and scraps, the entity id otherwise.
+        """
+        return self._entries[kind].get(key)
+
+    def index(self, kind: str) -> SpatialIndex:
+        """Spatial index over the remembered entities of a kind (built once per tick)."""
+        index = self._indexes.get(kind)
+        if index is None:
+            index = self._indexes[kind] = SpatialIndex(self.entities(kind))
+        return index
+
+    def last_seen_tick(self, x: int, y: int) -> int:
+        """Tick the cell was last in view, or -1 if never (or off the map)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.last_seen[y * self.width + x]
+        return -1
@@ -6,94 +6,408 @@ Handles:
 - Strategy persistence
 - Context rebinding
 - Cleanup of dead bots
+- Per-match caching of static map data
+- World memory accumulated across ticks (opt-in)
+- Collision-free friendly moves via a fleet-wide reservation table
+- Phase timing when the profiler is enabled
+- Direct compact-JSON output (play_bytes)
+- Delta input: per-tick diffs applied to a cached view (play_delta)
+- Opt-in binary replay recording of views and responses (see Replay)
+- Session-scoped state: one Match per game, so a process can serve
+  many games at once (play_async for asyncio servers)
 - Engine contract compliance
+
+The module-level play functions run the process's default match, so a
+worker that only ever serves one game does not need to know about Match.
 """
 
+import json
+import threading
+import time
+
+from . import Translate
 from .API import GameAPI
-from .BotContext import BotContext
+from .BatchSensing import BatchSensing
+from .BotIDAllocator import BotIDAllocator
+from .Delta import DeltaLoader
+from .Executor import DeadlineExecutor, SerialExecutor
+from .Instrumentation import PROFILER
 from .Translate import spawn
 from .controllers.BotBase import BotController
+from .models.Columns import ids
+from .Pathfinding import StaticMap
+from .Reservation import ReservationTable
 from .User import spawn_policy
+from .WorldMemory import WorldMemory
+
 
+# stateless; shared by every match
+DEFAULT_EXECUTOR = SerialExecutor()
 
-BOT_STRATEGIES: dict[int, BotController] = {}
+# share of a tick budget held back for the resolve phase and serialisation
+BUDGET_RESERVE = 0.1
 
 
-def play(api: GameAPI):
+class Match:
     """
-    Called once per tick by the engine.
+    All wrapper state for one game.
 
-    Returns:
-        dict:
-        {
-            "spawn": { bot_id: spawn_payload },
-            "actions": { bot_id: action_payload }
-        }
+    Strategies, bot IDs and caches never leak between Match objects, so
+    a single process can interleave ticks of any number of games. Ticks
+    of one match are serialised by a lock.
     """
 
-    spawns: dict[str, dict] = {}
-    actions: dict[str, dict] = {}
+    def __init__(self, spawn_policy=None, allocator: BotIDAllocator | None = None):
+        """
+        Args:
+            spawn_policy (Callable | None): Spawn policy for this match
+                (defaults to the wrapper's, i.e. User.spawn_policy).
+            allocator (BotIDAllocator | None): Bot ID source (a fresh one
+                starting at 1 when omitted).
+        """
+        self.spawn_policy = spawn_policy
+        self.allocator = allocator or BotIDAllocator()
+        self.strategies: dict[int, BotController] = {}
 
-    for spec in spawn_policy(api):
-        strategy_cls = spec["strategy"]
+        # walls, path finder and distance fields survive across ticks
+        self.static_map = StaticMap()
 
-        if not issubclass(strategy_cls, BotController):
-            raise TypeError(
-                f"Invalid strategy class in spawn_policy: {strategy_cls}"
-            )
+        # sightings merged from every tick, when play() runs with memory=True
+        self.memory = WorldMemory()
+
+        # resolves friendly move conflicts; keeps look-ahead reservations
+        self.reservations = ReservationTable()
 
-        base_abilities = list(strategy_cls.DEFAULT_ABILITIES)
-        extra_abilities = spec.get("extra_abilities", [])
+        # cached view that play_delta() applies diffs to
+        self.delta_loader = DeltaLoader()
 
-        final_abilities = list(dict.fromkeys(
-            base_abilities + extra_abilities
-        ))
+        # created on the first budgeted tick; keeps overrunning bots across ticks
+        self.deadline_executor: DeadlineExecutor | None = None
 
-        bot_id, payload = spawn(
-            abilities=final_abilities,
-            location=spec["location"]
-        )
+        # bots that missed their slice on the last budgeted tick (updated in place)
+        self.last_overruns: dict[str, list[int]] = {"overran": [], "busy": [], "skipped": []}
 
-        spawns[str(bot_id)] = payload
+        # re-entrant: play_delta holds it across the diff and the tick
+        self._lock = threading.RLock()
 
-        # create strategy instance (ctx bound in execution phase)
-        BOT_STRATEGIES[bot_id] = strategy_cls(None)
+    # ==================== ENTRY POINTS ====================
 
-    # ========================================================
-    # EXECUTION PHASE
-    # ========================================================
-    alive_ids: set[int] = set()
+    def play(self, api: GameAPI, *, batch_sensing: bool = False, executor=None,
+             budget: float | None = None, weights=None, memory: bool = False,
+             resolve_moves: bool = True, reserve_ahead: int = 0, recorder=None):
+        """
+        Play one tick of this match.
 
-    for bot in api.get_my_bots():
-        alive_ids.add(bot.id)
+        Args:
+            api (GameAPI): Game state for this tick.
+            batch_sensing (bool): Precompute every bot's neighbours with
+                NumPy in one pass (requires numpy).
+            executor: How act() calls are run (SerialExecutor,
+                ThreadExecutor or ProcessExecutor). Defaults to serial.
+            budget (float | None): Seconds allowed for the whole tick,
+                counted from entry. The execution phase gets what the spawn
+                phase left, minus BUDGET_RESERVE of the budget for resolving
+                and serialising. Bots that overrun their slice get a
+                fallback action and are listed in last_overruns. Cannot be
+                combined with executor.
+            weights (dict[type, float] | None): Per-strategy-class budget
+                weights overriding BUDGET_WEIGHT.
+            memory (bool): Merge this tick into the match's world memory
+                and expose it as api.memory.
+            resolve_moves (bool): Drop or shorten friendly moves that would
+                collide (see Reservation).
+            reserve_ahead (int): Ticks of planned route each moving bot
+                reserves for cooperative pathing (0 disables).
+            recorder (ReplayRecorder | None): Appends the view and the
+                response to a replay log.
 
-        if bot.id not in BOT_STRATEGIES:
-            # This should never happen unless the backend
-            # introduces bots without frontend consent
-            raise RuntimeError(
-                f"No strategy registered for bot id {bot.id}"
+        Returns:
+            dict:
+            {
+                "spawn": { bot_id: spawn_payload },
+                "actions": { bot_id: action_payload }
+            }
+        """
+        with self._lock, PROFILER.phase("tick"):
+            next_id = self.allocator.next_id
+            spawns, bots, results = self._play(
+                api, batch_sensing, executor, budget, weights, memory, resolve_moves, reserve_ahead
             )
+            actions = {
+                str(bot.id): action.to_dict()
+                for bot, action in zip(bots, results)
+                if action
+            }
+            response = {
+                "spawn": spawns,
+                "actions": actions,
+            }
+            if recorder is not None:
+                self._record(recorder, api, json.dumps(response, separators=(",", ":")).encode(),
+                             next_id, spawns)
+            return response
+
+    def play_bytes(self, api: GameAPI, *, recorder=None, **options) -> bytes:
+        """
+        Same as play(), but returns the response as compact JSON bytes.
+
+        Actions are encoded straight from their cached JSON, so no action
+        dicts are built and the shared fixed-argument actions are only ever
+        encoded once.
+
+        Args:
+            api (GameAPI): Game state for this tick.
+            recorder (ReplayRecorder | None): As for play().
+            **options: Keyword options of play().
+
+        Returns:
+            bytes: UTF-8 JSON of {"spawn": ..., "actions": ...}.
+        """
+        with self._lock, PROFILER.phase("tick"):
+            next_id = self.allocator.next_id
+            spawns, bots, results = self._play(api, **options)
+            parts = [
+                b'{"spawn":',
+                json.dumps(spawns, separators=(",", ":")).encode(),
+                b',"actions":{',
+                b",".join(
+                    b'"%d":%s' % (bot.id, action.to_json())
+                    for bot, action in zip(bots, results)
+                    if action
+                ),
+                b"}}",
+            ]
+            response = b"".join(parts)
+            if recorder is not None:
+                self._record(recorder, api, response, next_id, spawns)
+            return response
+
+    def play_delta(self, diff, *, as_bytes: bool = False, **options):
+        """
+        Play one tick in delta mode.
+
+        Args:
+            diff (str | bytes | dict): Changes since the previous tick, or a
+                full snapshot (see Delta).
+            as_bytes (bool): Return compact JSON bytes like play_bytes().
+            **options: Keyword options of play().
+
+        Returns:
+            dict | bytes: Same response as play() / play_bytes().
+        """
+        with self._lock:
+            api = GameAPI(self.delta_loader.apply(diff))
+            if as_bytes:
+                return self.play_bytes(api, **options)
+            return self.play(api, **options)
+
+    async def play_async(self, data, *, delta: bool = False, as_bytes: bool = False, **options):
+        """
+        Play one tick from an asyncio event loop.
+
+        The tick, JSON parsing included, runs on a worker thread, so the
+        loop keeps serving other matches meanwhile. Ticks of different matches may overlap; ticks
+        of this match run one at a time.
+
+        Args:
+            data (GameAPI | str | bytes | dict): Game state, or engine JSON
+                (a diff when delta is True).
+            delta (bool): data is a delta-mode diff (see play_delta).
+            as_bytes (bool): Return compact JSON bytes like play_bytes().
+            **options: Keyword options of play().
+
+        Returns:
+            dict | bytes: Same response as play() / play_bytes().
+        """
+        # imported here: asyncio is slow to import and most workers are synchronous
+        import asyncio
+
+        if delta:
+            return await asyncio.to_thread(self.play_delta, data, as_bytes=as_bytes, **options)
+        run = self.play_bytes if as_bytes else self.play
+
+        def tick():
+            api = data if isinstance(data, GameAPI) else GameAPI.from_json(data)
+            return run(api, **options)
+
+        return await asyncio.to_thread(tick)
+
+    # ==================== PHASES ====================
+
+    def _record(self, recorder, api, response: bytes, next_id: int, spawns: dict):
+        with PROFILER.phase("record"):
+            spawned = [(int(k), type(self.strategies[int(k)])) for k in spawns]
+            recorder.record(api.view, response, next_id, spawned)
+
+    def _play(self, api, batch_sensing=False, executor=None, budget=None, weights=None,
+              memory=False, resolve_moves=True, reserve_ahead=0):
+        """
+        Run the spawn, execution, resolve and cleanup phases.
+
+        Returns:
+            tuple: (spawn payloads by id string, bots, actions in bot order)
+        """
+        started = time.perf_counter()
+        strategies = self.strategies
+        spawns: dict[str, dict] = {}
+        spawned: dict[int, BotController] = {}
+
+        # ========================================================
+        # SPAWN PHASE
+        # ========================================================
+        with PROFILER.phase("spawn"):
+            if memory:
+                self.memory.update(api.view)
+                api.memory = self.memory
+            if resolve_moves:
+                self.reservations.horizon = reserve_ahead
+                api.reservations = self.reservations
+
+            # one spatial index per tick, shared by every BotContext
+            index = api.build_index(self.static_map)
+            if batch_sensing:
+                index.batch = BatchSensing(api)
+
+            policy = self.spawn_policy or spawn_policy
+            for spec in policy(api):
+                strategy_cls = spec["strategy"]
+
+                if not issubclass(strategy_cls, BotController):
+                    raise TypeError(
+                        f"Invalid strategy class in spawn_policy: {strategy_cls}"
+                    )
+
+                base_abilities = list(strategy_cls.DEFAULT_ABILITIES)
+                extra_abilities = spec.get("extra_abilities", [])
+
+                final_abilities = list(dict.fromkeys(
+                    base_abilities + extra_abilities
+                ))
+
+                bot_id, payload = spawn(
+                    abilities=final_abilities,
+                    location=spec["location"],
+                    allocator=self.allocator,
+                )
+
+                spawns[str(bot_id)] = payload
+
+                # create strategy instance (ctx bound in execution phase)
+                strategies[bot_id] = spawned[bot_id] = strategy_cls(None)
+
+        # ========================================================
+        # EXECUTION PHASE
+        # ========================================================
+        with PROFILER.phase("execute"):
+            # columnar views answer from the id column; each Bot is then
+            # only built when the executor binds it to its strategy
+            bots = api.get_my_bots()
+            bot_ids = ids(bots)
+            alive_ids: set[int] = set(bot_ids)
+
+            for bot_id in bot_ids:
+                if bot_id not in strategies:
+                    # This should never happen unless the backend
+                    # introduces bots without frontend consent
+                    raise RuntimeError(
+                        f"No strategy registered for bot id {bot_id}"
+                    )
+
+            if budget is not None:
+                if executor is not None:
+                    raise ValueError("budget cannot be combined with a custom executor")
+                if self.deadline_executor is None:
+                    self.deadline_executor = DeadlineExecutor()
+                # spawn-phase time counts against the tick budget
+                left = budget * (1 - BUDGET_RESERVE) - (time.perf_counter() - started)
+                results = self.deadline_executor.run(
+                    api, bots, strategies, spawned, budget=max(left, 0.0), weights=weights
+                )
+                self.last_overruns.clear()
+                self.last_overruns.update(self.deadline_executor.report)
+            else:
+                executor = executor or DEFAULT_EXECUTOR
+                results = executor.run(api, bots, strategies, spawned)
+
+        # ========================================================
+        # RESOLVE PHASE
+        # ========================================================
+        with PROFILER.phase("resolve"):
+            if resolve_moves:
+                results = self.reservations.resolve(
+                    api, bots, results, strategies, spawns.values()
+                )
+
+        # ========================================================
+        # CLEANUP PHASE
+        # ========================================================
+        with PROFILER.phase("cleanup"):
+            # bots spawned this tick only appear in the next view
+            for bot_id in list(strategies.keys()):
+                if bot_id not in alive_ids and bot_id not in spawned:
+                    del strategies[bot_id]
+
+        return spawns, bots, results
+
+    def close(self):
+        """Release the match's deadline executor threads, if any."""
+        if self.deadline_executor is not None:
+            self.deadline_executor.close()
+            self.deadline_executor = None
+
+
+# ============================================================
+# DEFAULT MATCH
+# ============================================================
+
+class _DefaultMatch(Match):
+    """
+    The single-game match behind the module-level functions. It draws
+    IDs from Translate.BOT_ID_ALLOCATOR, looked up on every tick, as the
+    wrapper always has.
+    """
+
+    @property
+    def allocator(self) -> BotIDAllocator:
+        return Translate.BOT_ID_ALLOCATOR
+
+    @allocator.setter
+    def allocator(self, value: BotIDAllocator):
+        Translate.BOT_ID_ALLOCATOR = value
+
+
+DEFAULT_MATCH = _DefaultMatch(allocator=Translate.BOT_ID_ALLOCATOR)
+
+# the default match's state under its long-standing module names
+BOT_STRATEGIES = DEFAULT_MATCH.strategies
+STATIC_MAP = DEFAULT_MATCH.static_map
+WORLD_MEMORY = DEFAULT_MATCH.memory
+RESERVATIONS = DEFAULT_MATCH.reservations
+DELTA_LOADER = DEFAULT_MATCH.delta_loader
+LAST_OVERRUNS = DEFAULT_MATCH.last_overruns
+
+
+def play(api: GameAPI, **options):
+    """
+    Called once per tick by the engine.
+
+    Plays the default match; see Match.play for the options.
+
+    Returns:
+        dict:
+        {
+            "spawn": { bot_id: spawn_payload },
+            "actions": { bot_id: action_payload }
+        }
+    """
+    return DEFAULT_MATCH.play(api, **options)
+
+
+def play_bytes(api: GameAPI, **options) -> bytes:
+    """Same as play(), but returns compact JSON bytes (see Match.play_bytes)."""
+    return DEFAULT_MATCH.play_bytes(api, **options)
+
 
-        ctx = BotContext(api, bot)
-
-        # rebind context every tick
-        BOT_STRATEGIES[bot.id].ctx = ctx
-
-        action = BOT_STRATEGIES[bot.id].act()
-        if action:
-            actions[str(bot.id)] = action.to_dict()
-
-    # ========================================================
-    # CLEANUP PHASE
-    # ========================================================
-    for bot_id in list(BOT_STRATEGIES.keys()):
-        if bot_id not in alive_ids:
-            del BOT_STRATEGIES[bot_id]
-
-    # ========================================================
-    # FINAL RETURN
-    # ========================================================
-    return {
-        "spawn": spawns,
-        "actions": actions,
-    }
+def play_delta(diff, *, as_bytes: bool = False, **options):
+    """Called once per tick by the engine in delta mode (see Match.play_delta)."""
+    return DEFAULT_MATCH.play_delta(diff, as_bytes=as_bytes, **options)
@@ -0,0 +1,220 @@
+"""
+BENCHMARKS
+
+Throughput and latency benchmarks for the wrapper, BotContext and the
+shipped templates on synthetic views.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench --scale small
+    python -m <package>.benchmarks.bench --save-baseline
+
+Results are compared against benchmarks/baseline.json when it exists.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from .. import Wrapper
+from ..API import GameAPI
+from ..BotContext import BotContext
+from ..models.Point import Point
+from ..templates.FlashScout import FlashScout
+from ..templates.Forager import Forager
+from ..templates.HeatSeeker import HeatSeeker
+from ..templates.Saboteur import Saboteur
+from .generator import SCALES, generate_view
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# templates measured by the act() benchmarks, with their constructors
+# (HeatSeeker targets are set to the map centre once a view exists)
+TEMPLATES = {
+    "Forager": lambda: Forager(None),
+    "FlashScout": lambda: FlashScout(None),
+    "Saboteur": lambda: Saboteur(None),
+    "HeatSeeker": lambda: HeatSeeker(None, None),
+}
+
+
+def _context_calls(target):
+    """(name, call) pairs for the BotContext benchmarks."""
+    return [
+        ("senseAlgae(5)", lambda c: c.senseAlgae(5)),
+        ("senseSacraps(5)", lambda c: c.senseSacraps(5)),
+        ("senseEnemyinRadius(5)", lambda c: c.senseEnemyinRadius(c.getLocation(), 5)),
+        ("senseBotinRadius(5)", lambda c: c.senseBotinRadius(c.getLocation(), 5)),
+        ("senseWallsinRadius(5)", lambda c: c.senseWallsinRadius(c.getLocation(), 5)),
+        ("senseByDistance first", lambda c: next(c.senseByDistance(10, ("algae", "scraps")), None)),
+        ("countInRadius(5)", lambda c: c.countInRadius(5, ("enemies",))),
+        ("checkBlocked", lambda c: c.checkBlocked(c.getLocation())),
+        ("shortestPath", lambda c: c.shortestPath(target)),
+        ("moveTarget", lambda c: c.moveTarget(c.getLocation(), target)),
+        ("getNearestBank", lambda c: c.getNearestBank()),
+        ("getBankDirection", lambda c: c.getBankDirection()),
+        ("getNearestAlgae", lambda c: c.getNearestAlgae()),
+        ("getNearestEnemy", lambda c: c.getNearestEnemy()),
+    ]
+
+
+def _register_fleet(view):
+    """Give every bot in the view a template strategy, round-robin."""
+    Wrapper.BOT_STRATEGIES.clear()
+    makers = list(TEMPLATES.values())
+    centre = _centre(view)
+    for k, bot in enumerate(view.bots):
+        strategy = makers[k % len(makers)]()
+        _equip(bot, strategy, centre)
+        Wrapper.BOT_STRATEGIES[bot.id] = strategy
+
+
+def _equip(bot, strategy, centre):
+    """Give the bot the abilities its template needs (and a HeatSeeker target)."""
+    bot.abilities = list(dict.fromkeys(bot.abilities + type(strategy).DEFAULT_ABILITIES))
+    if isinstance(strategy, HeatSeeker):
+        strategy.target = centre
+
+
+def _centre(view):
+    return Point(view.width // 2, view.height // 2)
+
+
+def _timeit(fn, min_time: float) -> tuple[int, float]:
+    """Call fn until min_time has elapsed. Returns (calls, seconds)."""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time or calls == 0:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls, elapsed
+
+
+def bench_play(view, min_time: float) -> dict:
+    """Ticks per second of Wrapper.play on a static view."""
+    _register_fleet(view)
+    Wrapper.play(GameAPI(view))  # warm the static map caches
+    calls, elapsed = _timeit(lambda: Wrapper.play(GameAPI(view)), min_time)
+    Wrapper.BOT_STRATEGIES.clear()
+    return {"ticks_per_sec": calls / elapsed, "us_per_call": elapsed / calls * 1e6}
+
+
+def bench_context(view, min_time: float, sample: int = 64) -> dict:
+    """Per-call latency of BotContext methods over a sample of bots."""
+    api = GameAPI(view)
+    api.build_index(Wrapper.STATIC_MAP)
+    contexts = [BotContext(api, bot) for bot in view.bots[:sample]]
+    out = {}
+    for name, call in _context_calls(_centre(view)):
+        for ctx in contexts:  # warm lazily built index layers
+            call(ctx)
+
+        def run():
+            for ctx in contexts:
+                call(ctx)
+
+        calls, elapsed = _timeit(run, min_time)
+        out[name] = {"us_per_call": elapsed / (calls * len(contexts)) * 1e6}
+    return out
+
+
+def bench_templates(view, min_time: float, sample: int = 64) -> dict:
+    """Per-call latency of each template's act()."""
+    out = {}
+    centre = _centre(view)
+    for name, make in TEMPLATES.items():
+        api = GameAPI(view)
+        api.build_index(Wrapper.STATIC_MAP)
+        strategies = []
+        for bot in view.bots[:sample]:
+            strategy = make()
+            strategy.ctx = BotContext(api, bot)
+            _equip(bot, strategy, centre)
+            strategies.append(strategy)
+
+        def run():
+            for s in strategies:
+                if isinstance(s, Saboteur):
+                    s.target = None  # measure the search, not a cached target
+                s.act()
+
+        run()
+        calls, elapsed = _timeit(run, min_time)
+        out[name] = {"us_per_call": elapsed / (calls * len(strategies)) * 1e6}
+    return out
+
+
+def run_suite(scales, seed: int = 0, min_time: float = 0.5) -> dict:
+    """
+    Run every benchmark at each scale.
+
+    Returns:
+        dict: scale -> {"play": ..., "context": ..., "templates": ...}
+    """
+    results = {}
+    for scale in scales:
+        view = generate_view(SCALES[scale], seed=seed)
+        results[scale] = {
+            "play": bench_play(view, min_time),
+            "context": bench_context(view, min_time),
+            "templates": bench_templates(view, min_time),
+        }
+    return results
+
+
+def _flatten(results: dict) -> dict[str, float]:
+    flat = {}
+    for scale, groups in results.items():
+        flat[f"{scale}/play ticks/s"] = groups["play"]["ticks_per_sec"]
+        flat[f"{scale}/play us"] = groups["play"]["us_per_call"]
+        for group in ("context", "templates"):
+            for name, row in groups[group].items():
+                flat[f"{scale}/{group}/{name} us"] = row["us_per_call"]
+    return flat
+
+
+def report(results: dict, baseline: dict | None) -> str:
+    """Render results, with the change against the baseline when given."""
+    flat = _flatten(results)
+    base = _flatten(baseline) if baseline else {}
+    lines = [f"{'benchmark':<52}{'value':>14}{'baseline':>14}{'change':>9}"]
+    for key, value in flat.items():
+        line = f"{key:<52}{value:>14.2f}"
+        if key in base and base[key]:
+            change = (value - base[key]) / base[key] * 100
+            line += f"{base[key]:>14.2f}{change:>+8.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OceanMaster library benchmarks")
+    parser.add_argument("--scale", nargs="+", default=["small", "medium"],
+                        choices=sorted(SCALES), help="view sizes to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="seconds spent per benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scale, seed=args.seed, min_time=args.min_time)
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    print(report(results, baseline))
+
+    if args.save_baseline:
+        merged = dict(baseline or {})
+        merged.update(results)
+        args.baseline.write_text(json.dumps(merged, indent=2, sort_keys=True))
+        print(f"baseline written to {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
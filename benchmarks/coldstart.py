@@ -0,0 +1,135 @@
+"""
+COLD-START BENCHMARK
+
+Time from a fresh interpreter to the first response, the latency a
+worker started per match adds before its first tick.
+
+Handles:
+- Importing the wrapper (and with it the package and User.py)
+- Serving the first play() call on a small generated view with an empty
+  fleet, so the spawn policy runs and imports the templates it uses
+- Medians over several fresh processes, checked against a budget
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.coldstart
+    python -m <package>.benchmarks.coldstart --runs 20 --import-budget 0.1
+
+Exits with status 1 when a median is over its budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from ..Loader import dump_view
+from .generator import SCALES, generate_view
+
+# seconds; medians above these fail the run
+BUDGET = {
+    "import": 0.15,
+    "first_play": 0.05,
+}
+
+# runs in the fresh interpreter: argv = package, view file
+_CHILD = """
+import importlib, json, sys, time
+start = time.perf_counter()
+wrapper = importlib.import_module(sys.argv[1] + ".Wrapper")
+api_module = importlib.import_module(sys.argv[1] + ".API")
+imported = time.perf_counter()
+with open(sys.argv[2], "rb") as f:
+    api = api_module.GameAPI.from_json(f.read())
+response = wrapper.play(api)
+played = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "first_play": played - imported,
+    "spawned": len(response["spawn"]),
+    "templates": sorted(
+        name.rsplit(".", 1)[1] for name in sys.modules
+        if name.startswith(sys.argv[1] + ".templates.")
+    ),
+}))
+"""
+
+
+def measure(view_path, runs: int = 5) -> list[dict]:
+    """
+    Start fresh interpreters and time their first response.
+
+    Args:
+        view_path (str | Path): Engine JSON of the first tick.
+        runs (int): Number of fresh processes.
+
+    Returns:
+        list[dict]: Per-run {"import", "first_play", "spawned", "templates"}.
+    """
+    package = __package__.rpartition(".")[0]
+    root = Path(__file__).resolve().parents[2]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root), env.get("PYTHONPATH")]))
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD, package, str(view_path)],
+            env=env, capture_output=True, text=True,
+        )
+        if out.returncode:
+            raise RuntimeError(f"cold-start run failed:\n{out.stderr}")
+        results.append(json.loads(out.stdout))
+    return results
+
+
+def report(results, budget=BUDGET) -> tuple[str, bool]:
+    """
+    Format the medians against the budget.
+
+    Returns:
+        tuple[str, bool]: Report text, and whether every median is within budget.
+    """
+    lines = [f"{len(results)} fresh processes"]
+    ok = True
+    for phase, limit in budget.items():
+        median = statistics.median(r[phase] for r in results)
+        within = median <= limit
+        ok &= within
+        lines.append(
+            f"  {phase:<12} median {median * 1e3:8.1f} ms"
+            f"   budget {limit * 1e3:6.1f} ms   {'ok' if within else 'OVER'}"
+        )
+    last = results[-1]
+    lines.append(f"  first tick spawned {last['spawned']}, templates imported: "
+                 f"{', '.join(last['templates']) or 'none'}")
+    return "\n".join(lines), ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OceanMaster cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--import-budget", type=float, default=BUDGET["import"])
+    parser.add_argument("--play-budget", type=float, default=BUDGET["first_play"])
+    args = parser.parse_args(argv)
+
+    raw = dump_view(generate_view(SCALES["small"], seed=args.seed))
+    # the match's first tick: no fleet yet, so the spawn policy runs
+    raw["bots"] = []
+    raw["bot_count"] = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        view_path = Path(tmp) / "view.json"
+        view_path.write_text(json.dumps(raw))
+        results = measure(view_path, args.runs)
+
+    text, ok = report(results, {"import": args.import_budget, "first_play": args.play_budget})
+    print(text)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+SYNTHETIC VIEWS
+
+Seeded generator of realistic PlayerViews for benchmarks.
+
+Every knob (grid size, fleet size, enemies, algae / scrap / wall
+density, banks, energy pads) is configurable, and the same seed always
+produces the same view.
+"""
+
+import random
+from dataclasses import dataclass
+
+from ..Constants import Ability, AlgaeType
+from ..models.Algae import Algae
+from ..models.Bank import Bank
+from ..models.Bot import Bot
+from ..models.EnergyPad import EnergyPad
+from ..models.PermanentEntities import PermanentEntities
+from ..models.PlayerView import PlayerView
+from ..models.Point import Point
+from ..models.VisibleEntities import VisibleEntities
+from ..models.VisibleScrap import VisibleScrap
+
+
+@dataclass(frozen=True)
+class ViewConfig:
+    """Shape of a generated view. Densities are fractions of all cells."""
+
+    width: int = 20
+    height: int = 20
+    bots: int = 10
+    enemies: int = 10
+    algae_density: float = 0.05
+    scrap_density: float = 0.02
+    wall_density: float = 0.08
+    banks: int = 4
+    energypads: int = 2
+    tick: int = 1
+
+
+# named scales used by the benchmark runner
+SCALES = {
+    "small": ViewConfig(20, 20, bots=10, enemies=10),
+    "medium": ViewConfig(100, 100, bots=200, enemies=200, banks=8, energypads=6),
+    "large": ViewConfig(500, 500, bots=2000, enemies=2000, algae_density=0.01,
+                        scrap_density=0.005, banks=24, energypads=16),
+    "huge": ViewConfig(500, 500, bots=5000, enemies=5000, algae_density=0.01,
+                       scrap_density=0.005, banks=24, energypads=16),
+}
+
+ABILITY_SETS = [
+    [Ability.HARVEST.value, Ability.SCOUT.value],
+    [Ability.SCOUT.value, Ability.SPEED.value],
+    [Ability.SELF_DESTRUCT.value],
+    [Ability.SELF_DESTRUCT.value, Ability.SPEED.value, Ability.SHIELD.value],
+]
+
+
+def generate_view(config: ViewConfig = ViewConfig(), seed: int = 0, first_id: int = 1) -> PlayerView:
+    """
+    Build a PlayerView.
+
+    Walls never overlap units, banks or pads, and each unit gets its own
+    cell while free cells last. max_bots equals the fleet size, so spawn
+    policies stay idle and play() measures the execution phase.
+
+    Args:
+        config (ViewConfig): View shape.
+        seed (int): Random seed.
+        first_id (int): ID of the first friendly bot; IDs are consecutive.
+
+    Returns:
+        PlayerView: Generated view.
+    """
+    rng = random.Random(seed)
+    w, h = config.width, config.height
+    cells = w * h
+
+    free = list(range(cells))
+    rng.shuffle(free)
+
+    def take():
+        i = free.pop() if free else rng.randrange(cells)
+        return Point(i % w, i // w)
+
+    bots = [
+        Bot(
+            id=first_id + k,
+            owner_id=1,
+            location=take(),
+            energy=rng.randint(10, 100),
+            scraps=0,
+            abilities=list(rng.choice(ABILITY_SETS)),
+            algae_held=rng.randint(0, 6),
+        )
+        for k in range(config.bots)
+    ]
+    enemies = [
+        Bot(
+            id=1_000_000 + k,
+            owner_id=2,
+            location=take(),
+            energy=rng.randint(10, 100),
+            scraps=0,
+            abilities=list(rng.choice(ABILITY_SETS)),
+            algae_held=rng.randint(0, 6),
+        )
+        for k in range(config.enemies)
+    ]
+    banks = [
+        Bank(id=k, location=take(), deposit_occuring=0, deposit_amount=0,
+              deposit_owner=0, depositticksleft=0)
+        for k in range(config.banks)
+    ]
+    pads = [
+        EnergyPad(id=k, location=take(), available=1, ticksleft=0)
+        for k in range(config.energypads)
+    ]
+    walls = [take() for _ in range(int(cells * config.wall_density))]
+
+    # resources may share cells with units
+    algae = [
+        Algae(location=Point(rng.randrange(w), rng.randrange(h)),
+              is_poison=AlgaeType.UNKNOWN)
+        for _ in range(int(cells * config.algae_density))
+    ]
+    scraps = [
+        VisibleScrap(location=Point(rng.randrange(w), rng.randrange(h)),
+              amount=rng.randint(1, 10))
+        for _ in range(int(cells * config.scrap_density))
+    ]
+
+    visible = VisibleEntities(enemies=enemies, scraps=scraps, walls=walls)
+    permanent = PermanentEntities(banks=banks, energypads=pads,
+                      walls=walls, algae=algae)
+
+    return PlayerView(
+        tick=config.tick,
+        scraps=1000,
+        algae=0,
+        bot_count=len(bots),
+        max_bots=len(bots),
+        width=w,
+        height=h,
+        bots=bots,
+        visible_entities=visible,
+        permanent_entities=permanent,
+    )
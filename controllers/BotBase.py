@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+from ..Pathfinding import PathPlan
+from ..Translate import defend
+
 class BotController(ABC):
     """
     Base class for all bot strategies.
@@ -7,13 +10,36 @@ class BotController(ABC):
 
     DEFAULT_ABILITIES: list[str] = []
 
+    # deadline scheduling: higher PRIORITY runs first, BUDGET_WEIGHT
+    # scales this strategy's share of the tick budget
+    PRIORITY: int = 0
+    BUDGET_WEIGHT: float = 1.0
+
     def __init__(self, ctx):
         self.ctx = ctx
+        # route reused across ticks by ctx.followPlan
+        self.plan = PathPlan()
 
     @abstractmethod
     def act(self):
         pass
 
+    def fallback(self, ctx):
+        """
+        Cheap action used when act() misses its time slice.
+
+        Must not touch strategy state: act() may still be running.
+
+        Args:
+            ctx (BotContext): Context for the current tick.
+
+        Returns:
+            Action | None: DEFEND if the bot can shield, else no action.
+        """
+        if ctx.canDefend():
+            return defend()
+        return None
+
     @classmethod
     def spawn(cls, abilities: list[str] | None = None, location: int = 0):
         """
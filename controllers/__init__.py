@@ -1,6 +1,8 @@
-import BotBase
+from . import BotBase
+from .BotBase import BotController
 
 
 __all__ = [
     "BotBase",
-]
\ No newline at end of file
+    "BotController",
+]
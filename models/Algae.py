@@ -2,5 +2,11 @@ from .Point import Point
 from ..Constants import AlgaeType
 
 class Algae:
+    __slots__ = ("location", "is_poison")
+
     location: Point
     is_poison: AlgaeType
+
+    def __init__(self, location, is_poison):
+        self.location = location
+        self.is_poison = is_poison
@@ -1,9 +1,19 @@
 from .Point import Point
 
 class Bank:
+    __slots__ = ("id", "location", "deposit_occuring", "deposit_amount", "deposit_owner", "depositticksleft")
+
     id: int
     location: Point
     deposit_occuring: int
     deposit_amount: int
     deposit_owner: int
     depositticksleft: int
+
+    def __init__(self, id, location, deposit_occuring, deposit_amount, deposit_owner, depositticksleft):
+        self.id = id
+        self.location = location
+        self.deposit_occuring = deposit_occuring
+        self.deposit_amount = deposit_amount
+        self.deposit_owner = deposit_owner
+        self.depositticksleft = depositticksleft
@@ -3,10 +3,21 @@ from .Point import Point
 from ..Constants import Ability, BotType
 
 class Bot:
+    __slots__ = ("id", "owner_id", "location", "energy", "scraps", "abilities", "algae_held")
+
     id: int
     owner_id: int
     location: Point
     energy: int
     scraps: int
     abilities: List[Ability]
-    algae_held: int
\ No newline at end of file
+    algae_held: int
+
+    def __init__(self, id, owner_id, location, energy, scraps, abilities, algae_held):
+        self.id = id
+        self.owner_id = owner_id
+        self.location = location
+        self.energy = energy
+        self.scraps = scraps
+        self.abilities = abilities
+        self.algae_held = algae_held
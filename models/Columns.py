@@ -0,0 +1,188 @@
+"""
+ENTITY COLUMNS
+
+Struct-of-arrays storage for entity lists.
+
+Handles:
+- Parallel typed arrays (x, y and the numeric fields) per entity list
+- Lazy, cached materialisation of model objects on access
+- Zero-copy NumPy views of the columns (numpy optional)
+- Reading positions and ids of any entity list, straight from the
+  columns when it is columnar (coordinates, ids)
+
+An EntityColumns object is a read-only sequence, so it can stand in for
+the plain lists of a PlayerView: objects are only built for the entries
+a strategy actually reads, and the same index always returns the same
+object.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .Algae import Algae
+from .Bank import Bank
+from .Bot import Bot
+from .EnergyPad import EnergyPad
+from .Point import Point
+from .VisibleScrap import VisibleScrap
+
+# optional dependency, and slow to import: loaded by the first numpy() call
+np = None
+
+
+# per layout: model, numeric (field, typecode) columns, object columns.
+# x and y ('q') always come first; location is rebuilt from them.
+LAYOUTS = {
+    "bots": (
+        Bot,
+        (("id", "q"), ("owner_id", "q"), ("energy", "d"), ("scraps", "q"), ("algae_held", "q")),
+        ("abilities",),
+    ),
+    "scraps": (VisibleScrap, (("amount", "q"),), ()),
+    "algae": (Algae, (), ("is_poison",)),
+    "banks": (
+        Bank,
+        (("id", "q"), ("deposit_occuring", "q"), ("deposit_amount", "q"),
+         ("deposit_owner", "q"), ("depositticksleft", "q")),
+        (),
+    ),
+    "energypads": (EnergyPad, (("id", "q"), ("available", "q"), ("ticksleft", "q")), ()),
+}
+
+_NP_TYPES = {"q": "int64", "d": "float64"}
+
+
+class EntityColumns(Sequence):
+    """
+    One entity list held as parallel arrays.
+    """
+
+    __slots__ = ("layout", "x", "y", "numeric", "objects", "_cache")
+
+    def __init__(self, layout: str):
+        """
+        Create an empty column set.
+
+        Args:
+            layout (str): Key of LAYOUTS.
+        """
+        _, numeric, objects = LAYOUTS[layout]
+        self.layout = layout
+        self.x = array("q")
+        self.y = array("q")
+        self.numeric = {name: array(code) for name, code in numeric}
+        self.objects = {name: [] for name in objects}
+        self._cache: list | None = None
+
+    @classmethod
+    def from_objects(cls, layout: str, entities) -> "EntityColumns":
+        """
+        Build columns from existing model objects.
+
+        The objects are kept as the materialised entries, so indexing
+        returns the very same instances.
+        """
+        cols = cls(layout)
+        entities = list(entities)
+        cols.x.extend(e.location.x for e in entities)
+        cols.y.extend(e.location.y for e in entities)
+        for name, column in cols.numeric.items():
+            column.extend(getattr(e, name) or 0 for e in entities)
+        for name, column in cols.objects.items():
+            column.extend(getattr(e, name) for e in entities)
+        cols._cache = entities
+        return cols
+
+    # ==================== SEQUENCE ====================
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = [None] * len(self.x)
+        entity = cache[i]
+        if entity is None:
+            entity = cache[i] = self._materialise(i if i >= 0 else i + len(self.x))
+        return entity
+
+    def __iter__(self):
+        for i in range(len(self.x)):
+            yield self[i]
+
+    def __reduce__(self):
+        # the cache holds objects that are rebuilt on demand anyway
+        return _rebuild, (self.layout, self.x, self.y, self.numeric, self.objects)
+
+    def _materialise(self, i: int):
+        model, numeric, objects = LAYOUTS[self.layout]
+        fields = {name: self.numeric[name][i] for name, _ in numeric}
+        for name in objects:
+            fields[name] = self.objects[name][i]
+        return model(location=Point(self.x[i], self.y[i]), **fields)
+
+    # ==================== COLUMNS ====================
+
+    def column(self, name: str):
+        """
+        Get one column without materialising any entity.
+
+        Args:
+            name (str): "x", "y", a numeric field or an object field.
+
+        Returns:
+            array | list: The column (not a copy).
+        """
+        if name == "x":
+            return self.x
+        if name == "y":
+            return self.y
+        if name in self.numeric:
+            return self.numeric[name]
+        return self.objects[name]
+
+    def numpy(self, name: str):
+        """
+        Get a numeric column as a zero-copy NumPy array (requires numpy).
+        """
+        global np
+        if np is None:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("NumPy columns require numpy (pip install numpy).") from None
+            np = numpy
+        column = self.column(name)
+        if not isinstance(column, array):
+            raise TypeError(f"Column {name!r} is not numeric")
+        if not len(column):
+            return np.empty(0, dtype=_NP_TYPES[column.typecode])
+        return np.frombuffer(column, dtype=_NP_TYPES[column.typecode])
+
+
+def _rebuild(layout, x, y, numeric, objects):
+    cols = EntityColumns(layout)
+    cols.x, cols.y, cols.numeric, cols.objects = x, y, numeric, objects
+    return cols
+
+
+def coordinates(entities):
+    """
+    Iterate the (x, y) cell of every entity in a list, in order.
+
+    EntityColumns answer from their x / y columns, so nothing is
+    materialised; plain lists read each entity's location.
+    """
+    if isinstance(entities, EntityColumns):
+        return zip(entities.x, entities.y)
+    return ((e.location.x, e.location.y) for e in entities)
+
+
+def ids(entities):
+    """The id of every entity in a list, in order (from the id column when columnar)."""
+    if isinstance(entities, EntityColumns):
+        return entities.numeric["id"]
+    return [e.id for e in entities]
@@ -1,7 +1,15 @@
 from .Point import Point
 
 class EnergyPad:
+    __slots__ = ("id", "location", "available", "ticksleft")
+
     id: int
     location: Point
     available: int
-    ticksleft: int
\ No newline at end of file
+    ticksleft: int
+
+    def __init__(self, id, location, available, ticksleft):
+        self.id = id
+        self.location = location
+        self.available = available
+        self.ticksleft = ticksleft
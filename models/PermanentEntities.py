@@ -5,7 +5,15 @@ from .Point import Point
 from .Algae import Algae
 
 class PermanentEntities:
+    __slots__ = ("banks", "energypads", "walls", "algae")
+
     banks: List[Bank]
     energypads: List[EnergyPad]
     walls: List[Point]
     algae: List[Algae]
+
+    def __init__(self, banks, energypads, walls, algae):
+        self.banks = banks
+        self.energypads = energypads
+        self.walls = walls
+        self.algae = algae
@@ -4,6 +4,8 @@ from .PermanentEntities import PermanentEntities
 from typing import List
     
 class PlayerView:
+    __slots__ = ("tick", "scraps", "algae", "bot_count", "max_bots", "width", "height", "bots", "visible_entities", "permanent_entities")
+
     tick: int
     scraps: int
     algae: int
@@ -14,3 +16,15 @@ class PlayerView:
     bots: List[Bot]
     visible_entities: VisibleEntities
     permanent_entities: PermanentEntities
+
+    def __init__(self, tick, scraps, algae, bot_count, max_bots, width, height, bots, visible_entities, permanent_entities):
+        self.tick = tick
+        self.scraps = scraps
+        self.algae = algae
+        self.bot_count = bot_count
+        self.max_bots = max_bots
+        self.width = width
+        self.height = height
+        self.bots = bots
+        self.visible_entities = visible_entities
+        self.permanent_entities = permanent_entities
@@ -4,5 +4,13 @@ from .VisibleScrap import VisibleScrap
 from typing import List
 
 class VisibleEntities:
+    __slots__ = ("enemies", "scraps", "walls")
+
     enemies: List[Bot]
     scraps: List[VisibleScrap]
+    walls: List[Point]
+
+    def __init__(self, enemies, scraps, walls):
+        self.enemies = enemies
+        self.scraps = scraps
+        self.walls = walls
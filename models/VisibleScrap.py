@@ -1,5 +1,11 @@
 from .Point import Point
 
 class VisibleScrap:
+    __slots__ = ("location", "amount")
+
     location : Point
-    amount: int
\ No newline at end of file
+    amount: int
+
+    def __init__(self, location, amount):
+        self.location = location
+        self.amount = amount
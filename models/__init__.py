@@ -1,17 +1,17 @@
-import Bank 
-import Bot
-import EnemyBot
-import PlayerView
-import Point
-import PythonLib.models.Algae as Algae
-import VisibleScrap
-import VisibleEntities
-import PermanentEntities
+from .Algae import Algae
+from .Bank import Bank
+from .Bot import Bot
+from .Columns import EntityColumns
+from .EnergyPad import EnergyPad
+from .PermanentEntities import PermanentEntities
+from .PlayerView import PlayerView
+from .Point import Point
+from .VisibleEntities import VisibleEntities
+from .VisibleScrap import VisibleScrap
 
 
 __all__ = [
     "Bot",
-    "EnemyBot",
     "PlayerView",
     "Point",
     "Algae",
@@ -20,4 +20,5 @@ __all__ = [
     "PermanentEntities",
     "Bank",
     "EnergyPad",
+    "EntityColumns",
 ]
@@ -14,20 +14,13 @@ class FlashScout(BotController):
         ctx = self.ctx
         bot_pos = ctx.getLocation()
 
-        # sense algae like forager (no harvest)
-        visible = ctx.senseAlgae()
-        if visible:
-            d, steps = ctx.moveTargetSpeed(bot_pos, visible[0].location)
+        # only the nearest algae (no harvest): the search already heads for
+        # the closest reachable cell, so a bot that gets no step from it is
+        # boxed in and further targets would only repeat the search
+        nearest = next(ctx.senseByDistance(radius=10, kinds=("algae",)), None)
+        if nearest:
+            d, steps = ctx.moveTargetSpeed(bot_pos, nearest[1].location)
             if d:
                 return moveSpeed(d,steps);
 
-        radius = 2
-        while radius <= 10:
-            visible = ctx.senseAlgae(radius=radius)
-            if visible:
-                d, steps = ctx.moveTargetSpeed(bot_pos, visible[0].location)
-                if d:
-                    return moveSpeed(d,steps);
-            radius += 1
-
         return move(Direction.NORTH)
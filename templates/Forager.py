@@ -1,7 +1,6 @@
 from ..controllers.BotBase import BotController
 from ..Translate import *
 from ..Constants import Ability
-from ..Helper import direction_from_point
 
 class Forager(BotController):
     """
@@ -15,21 +14,17 @@ class Forager(BotController):
         ctx = self.ctx
         
         if(ctx.getAlgaeHeld()>=5):
-            pos = ctx.getNearestBank()
-            dir = ctx.moveTarget(ctx.getLocation(),pos)
-            return move(dir)
-        
-        visible = ctx.senseAlgae()+ctx.senseSacraps()
-        if visible:
-            dir=direction_from_point(ctx.getLocation(),visible[0].location)
-            return harvest(dir);
-        i=2;
-        while(i<=10):
-            visible = ctx.senseAlgae(radius=i)+ctx.senseSacraps(radius=i)
-            if visible:
-                dir=ctx.moveTarget(ctx.getLocation(),visible[0].location)
+            dir = ctx.getBankDirection()
+            if dir:
                 return move(dir)
-            i+=1
-                
         
-        
\ No newline at end of file
+        pos = ctx.getLocation()
+        nearest = next(ctx.senseByDistance(radius=10, kinds=("algae", "scraps")), None)
+        if nearest:
+            dist, target = nearest
+            if dist <= 1:
+                dir=ctx.directionTo(target.location,pos)
+                return harvest(dir);
+            dir=ctx.moveTarget(pos,target.location)
+            if dir:
+                return move(dir)
@@ -1,25 +1,36 @@
 from ..controllers.BotBase import BotController
 from ..Translate import *
 from ..Constants import Direction,Ability
+from ..Helper import manhattan_distance
 
 class HeatSeeker(BotController):
     """
     A bot that accepts a block as target and self-destructs at that location.
+
+    Without a target (as when spawned by template name) it hunts the
+    nearest visible enemy and self-destructs next to it.
     """
     DEFAULT_ABILITIES=[
         Ability.SELF_DESTRUCT.value
     ]
-    def __init__(self, ctx, target):
+    def __init__(self, ctx, target=None):
         super().__init__(ctx)
         self.target = target
     def act(self):
         ctx = self.ctx
         bot_pos = ctx.getLocation()
 
-        if bot_pos.x == self.target.x and bot_pos.y == self.target.y:
+        target = self.target
+        if target is None:
+            target = ctx.getNearestEnemy()
+            if target is None:
+                return None
+            if manhattan_distance(bot_pos, target) <= 1:
+                return self_destruct()
+        elif bot_pos.x == target.x and bot_pos.y == target.y:
             return self_destruct()
 
-        d = ctx.moveTarget(bot_pos, self.target)
+        d = ctx.followPlan(self.plan, target)
         if d:
             return move(d)
         
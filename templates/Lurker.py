@@ -11,5 +11,5 @@ class Lurker(BotController):
         if enemies:
             e = enemies[0]
             # return attack(ctx.getID(), e.location.x, e.location.y)
-        return move(ctx.getID(), Direction.SOUTH)
+        return move(Direction.SOUTH)
 
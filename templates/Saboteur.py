@@ -14,23 +14,16 @@ class Saboteur(BotController):
 
     def act(self):
         ctx = self.ctx
-        bot_pos = ctx.getLocation()
 
-        close_enemies = ctx.senseEnemyinRadius(bot_pos, radius=1)
-        if close_enemies:
+        nearest = next(ctx.senseByDistance(radius=10, kinds=("enemies",)), None)
+        if nearest and nearest[0] <= 1:
             return self_destruct()
 
-        if self.target is None:
-            radius = 2
-            while radius <= 10:
-                enemies = ctx.senseEnemyinRadius(bot_pos, radius)
-                if enemies:
-                    self.target = enemies[0].location
-                    break
-                radius += 1
+        if self.target is None and nearest:
+            self.target = nearest[1].location
 
         if self.target:
-            d = ctx.moveTarget(bot_pos, self.target)
+            d = ctx.followPlan(self.plan, self.target)
             if d:
                 return move( d)
             else:
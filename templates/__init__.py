@@ -0,0 +1,82 @@
+"""
+STRATEGY TEMPLATES
+
+Registry of the strategy classes a spawn policy can ask for by name.
+
+Handles:
+- Discovering the shipped templates (one module per class, named after
+  it) without importing them
+- Importing a template on first use, so a worker only pays for the
+  templates its spawn policy actually spawns
+- Registering user strategies next to the shipped ones
+
+TEMPLATE_TO_STRATEGY maps a name to a BotController subclass, or to a
+"module:Class" path that is imported and replaced by the class the first
+time the name is looked up. Names match the BotType values.
+"""
+
+import importlib
+import pkgutil
+
+TEMPLATE_TO_STRATEGY: dict[str, object] = {
+    name: f"{__name__}.{name}:{name}"
+    for _, name, is_pkg in pkgutil.iter_modules(__path__)
+    if not is_pkg
+}
+
+
+def register(name: str, strategy):
+    """
+    Add a strategy to the registry (replacing any entry of that name).
+
+    Args:
+        name (str): Template name.
+        strategy (type[BotController] | str): The class, or a
+            "module:Class" path imported on first use.
+    """
+    TEMPLATE_TO_STRATEGY[name] = strategy
+
+
+def names() -> list[str]:
+    """All registered template names, imported or not."""
+    return sorted(TEMPLATE_TO_STRATEGY)
+
+
+def strategy(name: str):
+    """
+    Get a template class, importing its module on first use.
+
+    Args:
+        name (str): Template name.
+
+    Returns:
+        type[BotController]: The strategy class.
+
+    Raises:
+        KeyError: If no template of that name is registered.
+    """
+    try:
+        entry = TEMPLATE_TO_STRATEGY[name]
+    except KeyError:
+        raise KeyError(f"Unknown strategy template {name!r} (known: {', '.join(names())})") from None
+    if isinstance(entry, str):
+        module, _, attr = entry.partition(":")
+        entry = getattr(importlib.import_module(module), attr or name)
+        TEMPLATE_TO_STRATEGY[name] = entry
+    return entry
+
+
+def spawn(name: str, abilities=None, location: int = 0) -> dict:
+    """
+    Build a spawn request for a template by name.
+
+    Args:
+        name (str): Template name.
+        abilities (list[str] | None): Extra abilities to stack.
+        location (int): Spawn location index.
+
+    Returns:
+        dict: Spawn request for the spawn policy's result list.
+    """
+    return strategy(name).spawn(abilities=abilities, location=location)
+
@@ -0,0 +1,26 @@
+"""
+TESTS
+
+The repository directory is itself the package (every module uses
+relative imports), so its parent goes on sys.path and the tests import
+it under the directory's name.
+
+Run from the repository directory:
+
+    python -m pytest -q
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = ROOT.name
+
+if str(ROOT.parent) not in sys.path:
+    sys.path.insert(0, str(ROOT.parent))
+
+
+def load(module: str):
+    """Import one of the package's modules, e.g. load("API") or load("models.Point")."""
+    return importlib.import_module(f"{PACKAGE}.{module}")
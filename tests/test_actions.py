@@ -0,0 +1,61 @@
+"""play_bytes() must emit exactly the bytes of json.dumps(play())."""
+
+import json
+
+from . import load
+
+Action = load("Action").Action
+Constants = load("Constants")
+ActionType, Direction = Constants.ActionType, Constants.Direction
+Translate = load("Translate")
+Wrapper = load("Wrapper")
+GameAPI = load("API").GameAPI
+Simulator = load("Simulator")
+templates = load("templates")
+
+MIX = ("Forager", "FlashScout", "Saboteur", "Lurker", "HeatSeeker")
+
+
+def _compact(response):
+    return json.dumps(response, separators=(",", ":")).encode()
+
+
+def policy(api):
+    view = api.view
+    if view.bot_count >= view.max_bots:
+        return []
+    return [templates.spawn(MIX[view.tick % len(MIX)], location=view.tick % 3)]
+
+
+def test_play_bytes_matches_play():
+    as_dict = Wrapper.Match(policy)
+    as_bytes = Wrapper.Match(policy)
+    seen = {"spawn": 0, "actions": 0}
+
+    def player(view):
+        response = as_dict.play(GameAPI(view))
+        assert as_bytes.play_bytes(GameAPI(view)) == _compact(response)
+        seen["spawn"] += len(response["spawn"])
+        seen["actions"] += len(response["actions"])
+        return response
+
+    config = Simulator.SimConfig(width=16, height=16, max_bots=8)
+    Simulator.Simulator([player, Simulator.WrapperPlayer(policy)], config, seed=4).run(30)
+    assert seen["spawn"] and seen["actions"]
+
+
+def test_shared_actions_encode_like_their_dicts():
+    actions = [Translate.move(d) for d in Direction]
+    actions += [Translate.harvest(d) for d in Direction]
+    actions += [Translate.moveSpeed(Direction.EAST, 2), Translate.defend(),
+                Translate.self_destruct()]
+    for action in actions:
+        assert action.to_json() == _compact(action.to_dict())
+        assert action.to_json() is action.to_json()
+
+
+def test_user_action_payload_changes_are_encoded():
+    action = Action(ActionType.MOVE, {"direction": "NORTH"})
+    assert json.loads(action.to_json()) == {"action": "MOVE", "direction": "NORTH"}
+    action.payload["direction"] = "SOUTH"
+    assert json.loads(action.to_json()) == {"action": "MOVE", "direction": "SOUTH"}
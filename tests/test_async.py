@@ -0,0 +1,81 @@
+"""Asynchronous ticks of one match must run one at a time, off the event loop."""
+
+import asyncio
+import json
+import threading
+import time
+
+from . import load
+
+Delta = load("Delta")
+Loader = load("Loader")
+Wrapper = load("Wrapper")
+GameAPI = load("API").GameAPI
+templates = load("templates")
+generator = load("benchmarks.generator")
+
+
+def _views(n):
+    return [generator.generate_view(generator.SCALES["small"], seed=seed) for seed in range(n)]
+
+
+def _match(views):
+    """A match with a strategy for every bot of the given views."""
+    match = Wrapper.Match(spawn_policy=lambda api: [])
+    forager = templates.strategy("Forager")
+    for view in views:
+        for bot in view.bots:
+            match.strategies.setdefault(bot.id, forager(None))
+    return match
+
+
+def test_overlapping_delta_ticks_play_the_view_they_applied():
+    views = _views(6)
+    # full snapshots, so the diffs apply in any order
+    diffs = [json.dumps(Delta.DeltaProducer().diff(view)) for view in views]
+    match = _match(views)
+    events = []
+    apply, play = match.delta_loader.apply, match.play
+
+    def record_apply(diff):
+        view = apply(diff)
+        events.append(("apply", id(view), view.tick))
+        return view
+
+    def record_play(api, **options):
+        # a thread switch between applying the diff and playing it
+        time.sleep(0.01)
+        events.append(("play", id(api.view), api.view.tick))
+        return play(api, **options)
+
+    match.delta_loader.apply = record_apply
+    match.play = record_play
+
+    async def main():
+        return await asyncio.gather(*(match.play_async(d, delta=True) for d in diffs))
+
+    asyncio.run(main())
+    assert len(events) == 12
+    for applied, played in zip(events[::2], events[1::2]):
+        assert applied[0] == "apply" and played[0] == "play"
+        assert applied[1:] == played[1:]
+
+
+def test_json_is_parsed_off_the_event_loop(monkeypatch):
+    views = _views(1)
+    raw = Loader.dump_view(views[0])
+    from_json = GameAPI.from_json.__func__
+    threads = []
+
+    def spy(cls, data, *args, **kwargs):
+        threads.append(threading.current_thread())
+        return from_json(cls, data, *args, **kwargs)
+
+    monkeypatch.setattr(GameAPI, "from_json", classmethod(spy))
+
+    async def main():
+        return threading.current_thread(), await _match(views).play_async(json.dumps(raw))
+
+    loop_thread, response = asyncio.run(main())
+    assert response["actions"] or response["spawn"]
+    assert threads and loop_thread not in threads
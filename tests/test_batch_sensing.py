@@ -0,0 +1,43 @@
+"""Batch sensing must answer exactly like the scalar sensing path."""
+
+import pytest
+
+from . import load
+
+pytest.importorskip("numpy")
+
+GameAPI = load("API").GameAPI
+BotContext = load("BotContext").BotContext
+BatchSensing = load("BatchSensing").BatchSensing
+Loader = load("Loader")
+generator = load("benchmarks.generator")
+
+
+def _cells(entities):
+    return [(e.location.x, e.location.y) for e in entities]
+
+
+def _senses(api, bot):
+    ctx = BotContext(api, bot)
+    here = bot.location
+    out = []
+    for r in (0, 1, 4, 10):
+        out.append(_cells(ctx.senseAlgae(r)))
+        out.append(_cells(ctx.senseSacraps(r)))
+        out.append([(e.id, e.location.x, e.location.y) for e in ctx.senseEnemyinRadius(here, r)])
+    out.append((ctx.getNearestAlgae(), ctx.getNearestScrap(), ctx.getNearestEnemy()))
+    return out
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_scalar(seed, columnar):
+    raw = Loader.dump_view(generator.generate_view(generator.SCALES["medium"], seed=seed))
+    scalar = GameAPI.from_json(raw, columnar=columnar)
+    batched = GameAPI.from_json(raw, columnar=columnar)
+    scalar.build_index()
+    batched.build_index().batch = BatchSensing(batched)
+    for a, b in zip(scalar.view.bots, batched.view.bots):
+        assert _senses(batched, b) == _senses(scalar, a)
+    # the batch answered, rather than the spatial index fallback
+    assert set(batched.spatial_index().batch._layers) == {"enemies", "algae", "scraps"}
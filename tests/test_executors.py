@@ -0,0 +1,188 @@
+"""Every executor must produce exactly the serial executor's responses."""
+
+import threading
+import time
+
+import pytest
+
+from . import load
+
+BotController = load("controllers.BotBase").BotController
+Executor = load("Executor")
+Translate = load("Translate")
+Wrapper = load("Wrapper")
+GameAPI = load("API").GameAPI
+TickIndex = load("SpatialIndex").TickIndex
+Simulator = load("Simulator")
+templates = load("templates")
+generator = load("benchmarks.generator")
+
+MIX = ("Forager", "FlashScout", "Saboteur", "Lurker", "HeatSeeker")
+
+
+def mixed_policy(api):
+    view = api.view
+    if view.bot_count >= view.max_bots:
+        return []
+    return [templates.spawn(MIX[view.tick % len(MIX)], location=view.tick % 3)]
+
+
+class Recaller(BotController):
+    """Heads for remembered algae along a plan kept across ticks."""
+
+    DEFAULT_ABILITIES = ["HARVEST", "SCOUT"]
+
+    def act(self):
+        ctx = self.ctx
+        remembered = ctx.recallAlgae(12)
+        if remembered:
+            d = ctx.followPlan(self.plan, remembered[0].location)
+            if d:
+                return Translate.move(d)
+        return None
+
+
+def memory_policy(api):
+    view = api.view
+    if view.bot_count >= view.max_bots:
+        return []
+    cls = Recaller if view.tick % 2 else templates.strategy("Saboteur")
+    return [cls.spawn(location=view.tick % 3)]
+
+
+class RecordingPlayer(Simulator.WrapperPlayer):
+    """WrapperPlayer that keeps every response it returned."""
+
+    def __init__(self, spawn_policy=mixed_policy, **options):
+        super().__init__(spawn_policy=spawn_policy, **options)
+        self.responses = []
+
+    def __call__(self, view):
+        response = super().__call__(view)
+        self.responses.append(response)
+        return response
+
+
+def play_match(make_options, ticks=30, seed=5, policy=mixed_policy):
+    """Play one two-player match; returns (responses per player, result)."""
+    players = [RecordingPlayer(policy, **make_options()) for _ in range(2)]
+    config = Simulator.SimConfig(width=16, height=16, max_bots=8)
+    try:
+        result = Simulator.Simulator(players, config, seed).run(ticks)
+    finally:
+        for player in players:
+            executor = player.options.get("executor")
+            if executor is not None:
+                executor.close()
+            player.match.close()
+    del result["elapsed"], result["ticks_per_sec"]
+    return [p.responses for p in players], result
+
+
+@pytest.fixture(scope="module")
+def serial():
+    return play_match(dict)
+
+
+def test_thread_executor_matches_serial(serial):
+    assert play_match(lambda: {"executor": Executor.ThreadExecutor(4)}) == serial
+
+
+def test_process_executor_matches_serial(serial):
+    assert play_match(lambda: {"executor": Executor.ProcessExecutor(2)}) == serial
+
+
+def test_deadline_executor_matches_serial_within_budget(serial):
+    assert play_match(lambda: {"budget": 30.0}) == serial
+
+
+def test_process_executor_with_memory_and_reservations_matches_serial():
+    options = {"memory": True, "reserve_ahead": 3}
+    expected = play_match(lambda: dict(options), policy=memory_policy)
+    responses, _ = expected
+    assert any(r["actions"] for r in responses[0][5:])
+    got = play_match(
+        lambda: dict(options, executor=Executor.ProcessExecutor(2)), policy=memory_policy
+    )
+    assert got == expected
+
+
+def test_layers_are_built_once_under_concurrent_access():
+    view = generator.generate_view(generator.SCALES["medium"], seed=1)
+    for _ in range(20):
+        index = TickIndex(GameAPI(view))
+        start = threading.Barrier(8)
+        seen = []
+
+        def touch():
+            start.wait()
+            seen.append((index.scraps, index.occupancy))
+
+        threads = [threading.Thread(target=touch) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(scraps) for scraps, _ in seen}) == 1
+        assert len({id(occupancy) for _, occupancy in seen}) == 1
+
+
+def test_deadline_stuck_bots_do_not_starve_the_fleet():
+    release = threading.Event()
+
+    class Stuck(BotController):
+        PRIORITY = 1  # runs before every fast bot
+
+        def act(self):
+            release.wait(10)
+            return Translate.move("NORTH")
+
+    class Fast(BotController):
+        def act(self):
+            return Translate.move("SOUTH")
+
+    view = generator.generate_view(generator.SCALES["small"], seed=2)
+    api = GameAPI(view)
+    api.build_index()
+    bots = view.bots
+    # more stuck bots than the old fixed pool had threads
+    strategies = {b.id: (Stuck if k < 6 else Fast)(None) for k, b in enumerate(bots)}
+    fast = [b.id for b in bots[6:]]
+
+    executor = Executor.DeadlineExecutor()
+    try:
+        for _ in range(3):
+            results = executor.run(api, bots, strategies, {}, budget=0.5)
+            report = executor.report
+            assert not set(fast) & set(report["overran"] + report["busy"] + report["skipped"])
+            assert [a.payload["direction"] for a in results[6:]] == ["SOUTH"] * len(fast)
+        assert sorted(report["busy"]) == [b.id for b in bots[:6]]
+    finally:
+        release.set()
+        executor.close()
+
+
+def test_deadline_budget_covers_the_whole_tick():
+    class Slow(BotController):
+        def act(self):
+            time.sleep(0.02)
+            return Translate.move("SOUTH")
+
+    def slow_policy(api):
+        time.sleep(0.15)
+        return []
+
+    view = generator.generate_view(generator.SCALES["small"], seed=2)
+    match = Wrapper.Match(spawn_policy=slow_policy)
+    for bot in view.bots:
+        match.strategies[bot.id] = Slow(None)
+    budget = 0.3
+    try:
+        start = time.perf_counter()
+        match.play(GameAPI(view), budget=budget)
+        elapsed = time.perf_counter() - start
+    finally:
+        match.close()
+    assert elapsed < budget
+    report = match.last_overruns
+    assert report["overran"] or report["skipped"]
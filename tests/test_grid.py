@@ -0,0 +1,51 @@
+"""Movement helpers must respect the real map size."""
+
+import pytest
+
+from . import load
+
+Helper = load("Helper")
+Direction = load("Constants").Direction
+Point = load("models.Point").Point
+
+
+@pytest.mark.parametrize("width,height", [(20, 20), (500, 300), (1, 7)])
+def test_next_point_matches_bounds(width, height):
+    grid = Helper.grid_for(width, height)
+    for x in (-1, 0, width // 2, width - 1, width):
+        for y in (-1, 0, height // 2, height - 1, height):
+            for d, (dx, dy) in Helper.STEPS.items():
+                p = Point(x, y)
+                inside = 0 <= x < width and 0 <= y < height
+                ok = inside and 0 <= x + dx < width and 0 <= y + dy < height
+                got = Helper.next_point(p, d, grid)
+                assert got == (Point(x + dx, y + dy) if ok else None)
+                # engine payloads carry plain direction names
+                assert grid.next_point(p, d.value) == got
+
+
+def test_direction_uses_the_map_bounds():
+    grid = Helper.grid_for(100, 100)
+    assert Helper.direction_from_point(Point(10, 10), Point(90, 20), grid) == Direction.EAST
+    assert Helper.direction_from_point(Point(50, 10), Point(45, 80), grid) == Direction.NORTH
+    with pytest.raises(ValueError):
+        Helper.direction_from_point(Point(0, 0), Point(100, 0), grid)
+
+
+def test_grid_defaults_to_the_standard_map():
+    assert Helper.next_point(Point(19, 5), Direction.EAST) is None
+    assert Helper.next_point(Point(3, 5), Direction.NORTH) == Point(3, 6)
+    assert Helper.direction_from_point(Point(1, 1), Point(1, 9)) == Direction.NORTH
+    with pytest.raises(ValueError):
+        Helper.direction_from_point(Point(0, 0), Point(20, 0))
+    big = Helper.grid_for(40, 40)
+    assert Helper.next_point(Point(19, 5), Direction.EAST, grid=big) == Point(20, 5)
+
+
+def test_bot_context_uses_the_match_grid():
+    generator = load("benchmarks.generator")
+    api = load("API").GameAPI(generator.generate_view(generator.ViewConfig(40, 40), seed=1))
+    ctx = load("BotContext").BotContext(api, api.view.bots[0])
+    assert ctx.getGrid() is Helper.grid_for(40, 40)
+    assert ctx.nextPoint(Direction.EAST, Point(19, 5)) == Point(20, 5)
+    assert ctx.directionTo(Point(39, 5), Point(19, 5)) == Direction.EAST
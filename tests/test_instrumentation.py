@@ -0,0 +1,70 @@
+"""The profiler must count every sample, whichever thread records it."""
+
+import io
+import threading
+
+import pytest
+
+from . import load
+
+Instrumentation = load("Instrumentation")
+Executor = load("Executor")
+Wrapper = load("Wrapper")
+GameAPI = load("API").GameAPI
+templates = load("templates")
+generator = load("benchmarks.generator")
+
+PROFILER = Instrumentation.PROFILER
+
+
+@pytest.fixture
+def profiler():
+    PROFILER.reset()
+    PROFILER.enable()
+    try:
+        yield PROFILER
+    finally:
+        PROFILER.disable()
+        PROFILER.reset()
+
+
+def test_profiled_tick_is_summarised(profiler):
+    view = generator.generate_view(generator.SCALES["small"], seed=1)
+    match = Wrapper.Match(spawn_policy=lambda api: [])
+    forager = templates.strategy("Forager")
+    for bot in view.bots:
+        match.strategies[bot.id] = forager(None)
+    executor = Executor.ThreadExecutor(4)
+    try:
+        match.play(GameAPI(view), executor=executor)
+    finally:
+        executor.close()
+
+    stats = profiler.stats()
+    for phase in ("tick", "spawn", "execute", "resolve", "cleanup"):
+        assert stats["phase:" + phase]["count"] == 1
+    assert stats["strategy:Forager"]["count"] == len(view.bots)
+    assert any(key.startswith("ctx:") for key in stats)
+
+    out = io.StringIO()
+    profiler.dump(out)
+    assert "phase:tick" in out.getvalue() and "strategy:Forager" in out.getvalue()
+
+
+def test_concurrent_samples_are_all_counted(profiler):
+    threads, per_thread = 8, 5000
+    start = threading.Barrier(threads)
+
+    def work():
+        start.wait()
+        for _ in range(per_thread):
+            profiler.record("test:shared", 1e-6)
+
+    pool = [threading.Thread(target=work) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    stats = profiler.stats()["test:shared"]
+    assert stats["count"] == threads * per_thread
+    assert stats["total"] == pytest.approx(threads * per_thread * 1e-6)
@@ -0,0 +1,79 @@
+"""BFS, A* and distance fields must agree with a plain reference BFS."""
+
+import random
+from collections import deque
+
+from . import load
+
+Pathfinding = load("Pathfinding")
+Point = load("models.Point").Point
+
+STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+def _reference(width, height, walls, start):
+    """Grid BFS distances from start: {(x, y): steps}."""
+    dist = {start: 0}
+    frontier = deque([start])
+    while frontier:
+        x, y = frontier.popleft()
+        for dx, dy in STEPS:
+            n = (x + dx, y + dy)
+            if 0 <= n[0] < width and 0 <= n[1] < height and n not in walls and n not in dist:
+                dist[n] = dist[(x, y)] + 1
+                frontier.append(n)
+    return dist
+
+
+def _maps():
+    for seed in range(6):
+        rng = random.Random(seed)
+        w, h = rng.randint(5, 30), rng.randint(5, 30)
+        walls = {(rng.randrange(w), rng.randrange(h)) for _ in range(w * h // 4)}
+        yield rng, w, h, walls
+
+
+def _check_path(finder, walls, start, path):
+    """Every step of the path is a single move onto an open cell."""
+    prev = (start.x, start.y)
+    for cell in path:
+        p = finder.point(cell)
+        assert (p.x, p.y) not in walls
+        assert abs(p.x - prev[0]) + abs(p.y - prev[1]) == 1
+        prev = (p.x, p.y)
+    return prev
+
+
+def test_bfs_and_astar_find_shortest_paths():
+    for rng, w, h, walls in _maps():
+        finder = Pathfinding.PathFinder(w, h, [Point(x, y) for x, y in walls])
+        open_cells = [(x, y) for x in range(w) for y in range(h) if (x, y) not in walls]
+        for _ in range(20):
+            sx, sy = rng.choice(open_cells)
+            gx, gy = rng.choice(open_cells)
+            expected = _reference(w, h, walls, (sx, sy)).get((gx, gy))
+            start, goal = Point(sx, sy), Point(gx, gy)
+            for search in (finder.bfs, finder.astar):
+                path = search(start, goal, max_nodes=w * h)
+                if expected is None:
+                    assert path is None
+                else:
+                    assert len(path) == expected
+                    assert _check_path(finder, walls, start, path) == (gx, gy)
+
+
+def test_distance_field_matches_reference():
+    for rng, w, h, walls in _maps():
+        finder = Pathfinding.PathFinder(w, h, [Point(x, y) for x, y in walls])
+        open_cells = [(x, y) for x in range(w) for y in range(h) if (x, y) not in walls]
+        sources = [Point(*c) for c in rng.sample(open_cells, 3)]
+        field = Pathfinding.DistanceField(finder, sources)
+        reach = [_reference(w, h, walls, (s.x, s.y)) for s in sources]
+        for x, y in open_cells:
+            best = [r[(x, y)] for r in reach if (x, y) in r]
+            p = Point(x, y)
+            assert field.distance(p) == (min(best) if best else None)
+            d = field.direction(p)
+            if best and min(best):
+                dx, dy = {"NORTH": (0, 1), "EAST": (1, 0), "SOUTH": (0, -1), "WEST": (-1, 0)}[d.name]
+                assert field.distance(Point(x + dx, y + dy)) == min(best) - 1
@@ -0,0 +1,64 @@
+"""A replay log must reproduce the match it recorded."""
+
+import pytest
+
+from . import load
+
+Replay = load("Replay")
+Simulator = load("Simulator")
+templates = load("templates")
+
+MIX = ("Forager", "FlashScout", "Saboteur", "Lurker", "HeatSeeker")
+
+
+def policy(api):
+    view = api.view
+    if view.bot_count >= view.max_bots:
+        return []
+    return [templates.spawn(MIX[view.tick % len(MIX)], location=view.tick % 3)]
+
+
+@pytest.fixture(scope="module")
+def log(tmp_path_factory):
+    path = tmp_path_factory.mktemp("replay") / "match.brpl"
+    with Replay.ReplayRecorder(path) as recorder:
+        players = [Simulator.WrapperPlayer(policy, recorder=recorder), Simulator.WrapperPlayer(policy)]
+        config = Simulator.SimConfig(width=16, height=16, max_bots=8)
+        Simulator.Simulator(players, config, seed=9).run(40)
+    return path
+
+
+def test_replaying_every_tick_reproduces_the_responses(log):
+    with Replay.ReplayReader(log) as reader:
+        assert len(reader) == 40
+        player = Simulator.WrapperPlayer(policy, first_id=reader.next_id(reader.ticks[0]))
+        for tick in reader.ticks:
+            recorded, replayed = reader.replay(tick, player)
+            assert replayed == recorded
+
+
+def test_strategies_seek_matches_a_sequential_scan(log, monkeypatch):
+    monkeypatch.setattr(Replay, "SNAPSHOT_EVERY", 4)
+    with Replay.ReplayReader(log) as reader:
+        expected = {}
+        sequential = []
+        for tick in reader.ticks:
+            sequential.append(dict(expected))
+            for bot_id, path in reader.spawned(tick):
+                expected[bot_id] = Replay._strategy_class(path)
+        assert sequential[-1]
+        # out of order, across and on snapshot boundaries
+        order = list(range(len(reader.ticks)))
+        for i in order[::-3] + order[::2] + [0, 4, 8, 39]:
+            assert reader.strategies(reader.ticks[i]) == sequential[i]
+
+
+def test_default_replay_rebuilds_the_fleet(log):
+    with Replay.ReplayReader(log) as reader:
+        tick = reader.ticks[-1]
+        view = reader.view(tick)
+        known = reader.strategies(tick)
+        assert {b.id for b in view.bots} <= set(known)
+        recorded, replayed = reader.replay(tick, spawn_policy=policy)
+        assert replayed["spawn"] == recorded["spawn"]
+        assert len(replayed["actions"]) == len(recorded["actions"])
@@ -0,0 +1,70 @@
+"""The move resolver must never let two friendly bots end on the same cell."""
+
+from . import load
+
+GameAPI = load("API").GameAPI
+Translate = load("Translate")
+Direction = load("Constants").Direction
+ReservationTable = load("Reservation").ReservationTable
+Bot = load("models.Bot").Bot
+Point = load("models.Point").Point
+PlayerView = load("models.PlayerView").PlayerView
+VisibleEntities = load("models.VisibleEntities").VisibleEntities
+PermanentEntities = load("models.PermanentEntities").PermanentEntities
+
+N, E, S, W = Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST
+
+
+def _bot(i, x, y, owner=0):
+    return Bot(i, owner, Point(x, y), 100, 0, [], 0)
+
+
+def _resolve(moves, walls=(), enemies=()):
+    """
+    Resolve moves on an empty 8x8 map.
+
+    Args:
+        moves (list[tuple[int, int, Action | None]]): (x, y, action) per bot.
+        walls (Iterable[tuple[int, int]]): Wall cells.
+        enemies (Iterable[tuple[int, int]]): Enemy cells.
+
+    Returns:
+        list[Action | None]: Resolved actions.
+    """
+    bots = [_bot(i + 1, x, y) for i, (x, y, _) in enumerate(moves)]
+    view = PlayerView(
+        1, 0, 0, len(bots), 10, 8, 8, bots,
+        VisibleEntities([_bot(100 + k, x, y, 1) for k, (x, y) in enumerate(enemies)], [], []),
+        PermanentEntities([], [], [Point(x, y) for x, y in walls], []),
+    )
+    return ReservationTable().resolve(GameAPI(view), bots, [a for _, _, a in moves], {})
+
+
+def test_move_into_a_wall_keeps_the_cell_occupied():
+    a, b = Translate.move(N), Translate.move(N)
+    assert _resolve([(2, 2, a), (2, 1, b)], walls=[(2, 3)]) == [a, None]
+
+
+def test_move_into_an_enemy_keeps_the_cell_occupied():
+    a, b = Translate.move(N), Translate.move(N)
+    assert _resolve([(2, 2, a), (2, 1, b)], enemies=[(2, 3)]) == [a, None]
+
+
+def test_speed_move_stops_before_a_blocked_second_cell():
+    speed = Translate.moveSpeed(N, 2)
+    for obstacle in ({"walls": [(2, 4)]}, {"enemies": [(2, 4)]}):
+        assert _resolve([(2, 2, speed)], **obstacle) == [Translate.move(N)]
+
+
+def test_head_on_swap_is_refused():
+    assert _resolve([(2, 2, Translate.move(N)), (2, 3, Translate.move(S))]) == [None, None]
+
+
+def test_follow_chain_moves_together():
+    chain = [(2, 2, Translate.move(E)), (3, 2, Translate.move(E)), (4, 2, Translate.move(E))]
+    assert _resolve(chain) == [a for _, _, a in chain]
+
+
+def test_follow_chain_behind_a_blocked_leader_stops():
+    chain = [(2, 2, Translate.move(E)), (3, 2, Translate.move(E)), (4, 2, Translate.move(E))]
+    assert _resolve(chain, walls=[(5, 2)]) == [None, None, chain[2][2]]
@@ -0,0 +1,101 @@
+"""The tick's spatial index must answer exactly like the linear scans it replaced."""
+
+import random
+
+import pytest
+
+from . import load
+
+GameAPI = load("API").GameAPI
+BotContext = load("BotContext").BotContext
+SpatialIndex = load("SpatialIndex").SpatialIndex
+Point = load("models.Point").Point
+generator = load("benchmarks.generator")
+
+
+def _dist(a, b):
+    return abs(a.x - b.x) + abs(a.y - b.y)
+
+
+def _within(entities, center, radius):
+    return [e for e in entities if _dist(e.location, center) <= radius]
+
+
+@pytest.fixture(params=["small", "medium"])
+def view(request):
+    return generator.generate_view(generator.SCALES[request.param], seed=3)
+
+
+def _centers(view, n=40):
+    rng = random.Random(7)
+    # off-map centers too: queries near the edge must clip like a scan
+    return [Point(rng.randrange(-3, view.width + 3), rng.randrange(-3, view.height + 3))
+            for _ in range(n)]
+
+
+@pytest.mark.parametrize("radius", [0, 1, 3, 10, 60])
+def test_query_and_count_match_linear_scan(view, radius):
+    entities = view.permanent_entities.algae
+    index = SpatialIndex(entities)
+    for center in _centers(view):
+        expected = _within(entities, center, radius)
+        assert index.query(center, radius) == expected
+        assert index.count(center, radius) == len(expected)
+
+
+def test_by_distance_matches_sorted_scan(view):
+    entities = view.visible_entities.enemies
+    index = SpatialIndex(entities)
+    for center in _centers(view, 15):
+        expected = sorted(
+            ((_dist(e.location, center), i, e) for i, e in enumerate(entities)),
+            key=lambda t: (t[0], t[1]),
+        )
+        assert list(index.by_distance(center)) == expected
+        bounded = [t for t in expected if t[0] <= 5]
+        assert list(index.by_distance(center, 5)) == bounded
+
+
+def test_nearest_matches_min(view):
+    entities = view.visible_entities.scraps
+    index = SpatialIndex(entities)
+    for center in _centers(view):
+        expected = min(entities, key=lambda e: _dist(e.location, center))
+        assert index.nearest(center) is expected
+        k = sorted(range(len(entities)), key=lambda i: (_dist(entities[i].location, center), i))[:4]
+        assert index.k_nearest(center, 4) == [entities[i] for i in k]
+
+
+def test_claim_nearest_hands_out_each_entity_once(view):
+    entities = view.visible_entities.scraps
+    index = SpatialIndex(entities)
+    center = Point(view.width // 2, view.height // 2)
+    claimed = [index.claim_nearest(center) for _ in range(len(entities))]
+    assert sorted(map(id, claimed)) == sorted(map(id, entities))
+    assert index.claim_nearest(center) is None
+
+
+def test_bot_context_sensing_matches_linear_scan(view):
+    api = GameAPI(view)
+    api.build_index()
+    enemies = view.visible_entities.enemies
+    algae = api.visible_algae()
+    scraps = view.visible_entities.scraps
+    walls = view.visible_entities.walls
+    for bot in view.bots[:25]:
+        ctx = BotContext(api, bot)
+        here = bot.location
+        for r in (1, 4, 9):
+            assert ctx.senseAlgae(r) == _within(algae, here, r)
+            assert ctx.senseSacraps(r) == _within(scraps, here, r)
+            assert ctx.senseEnemyinRadius(here, r) == _within(enemies, here, r)
+            assert ctx.senseBotinRadius(here, r) == [
+                b for b in _within(view.bots, here, r) if b.id != bot.id
+            ]
+            assert ctx.senseWallsinRadius(here, r) == [w for w in walls if _dist(w, here) <= r]
+            assert ctx.countInRadius(r, ("enemies", "algae")) == (
+                len(_within(enemies, here, r)) + len(_within(algae, here, r))
+            )
+        if algae:
+            nearest = min(algae, key=lambda a: _dist(a.location, here))
+            assert ctx.getNearestAlgae() == nearest.location
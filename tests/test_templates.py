@@ -0,0 +1,25 @@
+"""Every registered template must spawn and play through the wrapper."""
+
+import pytest
+
+from . import load
+
+Simulator = load("Simulator")
+templates = load("templates")
+
+
+@pytest.mark.parametrize("name", templates.names())
+def test_template_spawns_and_acts(name):
+    strategy = templates.strategy(name)
+    strategy(None)  # buildable without extra arguments
+
+    def policy(api):
+        view = api.view
+        if view.bot_count >= view.max_bots:
+            return []
+        return [templates.spawn(name, location=view.tick % 3)]
+
+    player = Simulator.WrapperPlayer(policy)
+    config = Simulator.SimConfig(width=16, height=16, max_bots=4)
+    Simulator.Simulator([player, Simulator.WrapperPlayer(policy)], config, seed=2).run(12)
+    assert any(type(s) is strategy for s in player.strategies.values())
@@ -0,0 +1,37 @@
+"""Tournament resume must only reuse records of identical matches."""
+
+from . import PACKAGE, load
+
+Tournament = load("Tournament")
+SimConfig = load("Simulator").SimConfig
+
+
+def test_key_tracks_config_contents():
+    small = SimConfig(width=12, height=12, max_bots=4)
+    base = Tournament.Match(("a", "b"), 1, "arena", small, 20)
+    assert base.key == Tournament.Match(("a", "b"), 1, "arena", SimConfig(12, 12, 4), 20).key
+    resized = Tournament.Match(("a", "b"), 1, "arena", SimConfig(width=14, height=14, max_bots=4), 20)
+    assert resized.key != base.key
+
+
+def test_resume_skips_recorded_matches_and_replays_changed_configs(tmp_path):
+    out = tmp_path / "runs.jsonl"
+    module = f"{PACKAGE}.User"
+    configs = {"arena": SimConfig(width=12, height=12, max_bots=4)}
+    matches = Tournament.schedule([module], range(2), configs, ticks=10)
+
+    played = []
+    records = Tournament.run_tournament(matches, out, workers=0, progress=played.append)
+    assert len(played) == 2
+    assert all("error" not in r for r in records)
+
+    played.clear()
+    assert Tournament.run_tournament(matches, out, workers=0, progress=played.append) == records
+    assert played == []
+
+    # same config name, different settings: nothing stale is reused
+    configs = {"arena": SimConfig(width=12, height=12, max_bots=6)}
+    changed = Tournament.schedule([module], range(2), configs, ticks=10)
+    Tournament.run_tournament(changed, out, workers=0, progress=played.append)
+    assert len(played) == 2
+    assert len(Tournament.load_results(out)) == 4